@@ -7,9 +7,18 @@ Agent 模块
 - AnalysisAgent: 分析与关键词提取
 """
 
-from .ingestion_agent import IngestionAgent, run_ingestion
-from .structuring_agent import StructuringAgent, run_structuring
-from .analysis_agent import AnalysisAgent, run_analysis
+from lazy_import import lazy_exports
+
+# 按需导入：各 Agent 依赖的采集客户端、提取模型较重，
+# 只在首次访问对应属性时才导入子模块（PEP 562）
+_LAZY_ATTRS = {
+    "IngestionAgent": ".ingestion_agent",
+    "run_ingestion": ".ingestion_agent",
+    "StructuringAgent": ".structuring_agent",
+    "run_structuring": ".structuring_agent",
+    "AnalysisAgent": ".analysis_agent",
+    "run_analysis": ".analysis_agent",
+}
 
 __all__ = [
     "IngestionAgent",
@@ -19,3 +28,5 @@ __all__ = [
     "run_structuring",
     "run_analysis",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS)
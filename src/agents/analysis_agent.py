@@ -12,8 +12,10 @@ Analysis Agent
 
 import sys
 import re
+import hashlib
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple, Literal
+from typing import List, Optional, Dict, Tuple, Literal, TYPE_CHECKING
 from datetime import datetime
 
 # 确保 src 目录在路径中
@@ -25,7 +27,11 @@ from database import get_structured_repository, get_analysis_repository
 from database.repository import StructuredRepository, AnalysisRepository
 from scraper.models import Paper, PaperKeyword
 from extractor.yake_extractor import YakeExtractor, create_yake_extractor
-from extractor.keybert_extractor import KeyBertExtractor, get_keybert_extractor
+from extractor.yake_pool import iter_yake_parallel
+
+if TYPE_CHECKING:
+    # KeyBERT 会连带导入 torch，只在实际使用时导入
+    from extractor.keybert_extractor import KeyBertExtractor
 
 
 ExtractorType = Literal["yake", "keybert", "both"]
@@ -43,12 +49,14 @@ class AnalysisAgent:
         structured_repo: StructuredRepository = None,
         analysis_repo: AnalysisRepository = None,
         yake_extractor: YakeExtractor = None,
-        keybert_extractor: KeyBertExtractor = None,
+        keybert_extractor: "KeyBertExtractor" = None,
     ):
         self.structured_repo = structured_repo or get_structured_repository()
         self.analysis_repo = analysis_repo or get_analysis_repository()
         self._yake = yake_extractor
         self._keybert = keybert_extractor
+        # (文本 sha256, method, top_n) -> 过滤后的关键词，内容相同的论文只提取一次
+        self._keyword_cache: Dict[Tuple[str, str, int], List[Tuple[str, float]]] = {}
     
     def _get_yake(self) -> YakeExtractor:
         """懒加载 YAKE 提取器"""
@@ -56,9 +64,10 @@ class AnalysisAgent:
             self._yake = create_yake_extractor()
         return self._yake
     
-    def _get_keybert(self) -> KeyBertExtractor:
+    def _get_keybert(self) -> "KeyBertExtractor":
         """懒加载 KeyBERT 提取器"""
         if self._keybert is None:
+            from extractor.keybert_extractor import get_keybert_extractor
             self._keybert = get_keybert_extractor()
         return self._keybert
     
@@ -79,7 +88,10 @@ class AnalysisAgent:
         Returns:
             需要处理的论文列表
         """
-        return self.analysis_repo.get_papers_without_keywords(method=method, limit=limit)
+        # 关键词提取只用到 paper_id 与标题/摘要，跳过作者列的 JSON 解析
+        return self.analysis_repo.get_papers_without_keywords(
+            method=method, limit=limit, with_authors=False
+        )
     
     # ========== Step 2: 构建提取文本 ==========
     
@@ -168,19 +180,19 @@ class AnalysisAgent:
         if not text or len(text) < 10:
             return []
         
-        # 提取关键词（多提取一些，后续过滤）
-        if method == "yake":
-            raw_keywords = self.extract_keywords_yake(text, top_n=top_n)
-        elif method == "keybert":
-            raw_keywords = self.extract_keywords_keybert(text, top_n=top_n)
-        else:
-            raise ValueError(f"未知的提取方法: {method}")
-        
-        # 过滤、规范化、去重、同义归并
-        filtered = self.filter_keywords(raw_keywords, fuzzy_dedup=True)
-        
-        # 截取最终保留数量
-        filtered = filtered[:10]
+        cache_key = self._cache_key(text, method, top_n)
+        filtered = self._keyword_cache.get(cache_key)
+        if filtered is None:
+            # 提取关键词（多提取一些，后续过滤）
+            if method == "yake":
+                raw_keywords = self.extract_keywords_yake(text, top_n=top_n)
+            elif method == "keybert":
+                raw_keywords = self.extract_keywords_keybert(text, top_n=top_n)
+            else:
+                raise ValueError(f"未知的提取方法: {method}")
+            
+            filtered = self._finalize_keywords(raw_keywords)
+            self._keyword_cache[cache_key] = filtered
         
         # 构建 PaperKeyword 对象
         results = []
@@ -194,12 +206,59 @@ class AnalysisAgent:
         
         return results
     
+    @staticmethod
+    def _cache_key(text: str, method: str, top_n: int) -> Tuple[str, str, int]:
+        """关键词缓存键：(文本 sha256, method, top_n)"""
+        return (hashlib.sha256(text.encode("utf-8")).hexdigest(), method, top_n)
+    
+    def _finalize_keywords(
+        self,
+        raw_keywords: List[Tuple[str, float]],
+    ) -> List[Tuple[str, float]]:
+        """过滤、规范化、去重、同义归并，并截取最终保留数量"""
+        filtered = self.filter_keywords(raw_keywords, fuzzy_dedup=True)
+        return filtered[:10]
+    
+    def _prefetch_yake(self, papers: List[Paper], top_n: int, jobs: int):
+        """
+        多进程预先提取 YAKE 关键词并写入缓存
+        
+        YAKE 是纯 Python 实现，用进程池绕开 GIL；过滤与入库仍在主进程，
+        之后 process_paper 直接命中缓存。
+        """
+        pending: Dict[Tuple[str, str, int], str] = {}
+        for paper in papers:
+            text = self.get_text_for_extraction(paper)
+            if not text or len(text) < 10:
+                continue
+            cache_key = self._cache_key(text, "yake", top_n)
+            if cache_key not in self._keyword_cache:
+                pending.setdefault(cache_key, text)
+        
+        jobs = min(jobs, len(pending))
+        if jobs < 2:
+            return
+        
+        texts = list(pending.values())
+        
+        print(f"   ⚙️ 使用 {jobs} 个进程并行提取 YAKE 关键词...")
+        try:
+            results = list(iter_yake_parallel(self._get_yake(), texts, jobs, method="extract"))
+        except (BrokenProcessPool, OSError) as e:
+            # 进程池不可用时退回逐篇串行提取
+            print(f"   ⚠️ 并行提取失败，改为串行: {e}")
+            return
+        
+        for cache_key, raw_keywords in zip(pending, results):
+            self._keyword_cache[cache_key] = self._finalize_keywords(raw_keywords[:top_n])
+    
     def run(
         self,
         method: str = "yake",
         limit: int = 1000,
         top_n: int = 10,
         force: bool = False,
+        jobs: int = 1,
     ) -> Dict[str, int]:
         """
         运行增量分析流程
@@ -209,6 +268,7 @@ class AnalysisAgent:
             limit: 单次处理上限
             top_n: 每篇论文提取的关键词数
             force: 强制运行（忽略缓存）
+            jobs: YAKE 并行进程数（1 为串行；KeyBERT 始终在主进程运行）
             
         Returns:
             处理统计
@@ -233,6 +293,9 @@ class AnalysisAgent:
         
         print(f"\n📝 待处理论文: {len(papers)} 篇")
         
+        if method == "yake" and jobs > 1:
+            self._prefetch_yake(papers, top_n=top_n, jobs=jobs)
+        
         # Step 2-3: 处理每篇论文
         total_keywords = 0
         processed = 0
@@ -344,7 +407,8 @@ class AnalysisAgent:
 def run_analysis(
     method: str = "yake",
     limit: int = 1000,
+    jobs: int = 1,
 ) -> Dict[str, int]:
     """运行分析的便捷函数"""
     agent = AnalysisAgent()
-    return agent.run(method=method, limit=limit)
+    return agent.run(method=method, limit=limit, jobs=jobs)
@@ -10,8 +10,10 @@ Ingestion Agent
 """
 
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, Iterable, List, Optional
 from datetime import datetime
 
 # 确保 src 目录在路径中
@@ -29,6 +31,23 @@ from scraper.venues import parse_note_to_paper
 from config import VENUES
 
 
+# 并发采集时各数据源的输出按整行写出，行与行之间不会交错
+_print_lock = threading.Lock()
+
+
+def _make_log(prefix: str = "") -> Callable[[str], None]:
+    """返回带数据源前缀、按整行输出的 print"""
+    def log(message: str = ""):
+        text = "".join(
+            f"{prefix}{line}\n" if line else "\n"
+            for line in str(message).split("\n")
+        )
+        with _print_lock:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+    return log
+
+
 class IngestionAgent:
     """
     原始数据采集 Agent
@@ -49,6 +68,9 @@ class IngestionAgent:
         self.openalex = openalex_client
         self.s2 = s2_client
         self.or_client = or_client
+        # 同一 agent 的写库串行化：并发采集的各数据源轮流整批写入，
+        # 不在 SQLite 写锁上互相等待
+        self._write_lock = threading.Lock()
     
     def _get_arxiv_client(self) -> ArxivClient:
         """懒加载 arXiv 客户端"""
@@ -74,6 +96,20 @@ class IngestionAgent:
             self.or_client = create_or_client()
         return self.or_client
     
+    def _save_raw_papers(self, papers: Iterable[Optional[RawPaper]], log: Callable = print) -> int:
+        """整批写入 Raw Layer，返回成功保存的数量"""
+        saved_count = 0
+        with self._write_lock:
+            for paper in papers:
+                if paper is None:
+                    continue
+                try:
+                    self.repo.save_raw_paper(paper)
+                    saved_count += 1
+                except Exception as e:
+                    log(f"   保存失败: {e}")
+        return saved_count
+    
     # ========== arXiv 采集 ==========
     
     def ingest_arxiv_recent(
@@ -81,6 +117,7 @@ class IngestionAgent:
         categories: List[str] = None,
         days: int = 7,
         max_results: int = 1000,
+        log: Callable[[str], None] = print,
     ) -> int:
         """
         采集 arXiv 最近的论文
@@ -89,6 +126,7 @@ class IngestionAgent:
             categories: arXiv 类别列表
             days: 天数
             max_results: 最大数量
+            log: 输出函数，并发采集时带数据源前缀
             
         Returns:
             采集的论文数量
@@ -96,7 +134,7 @@ class IngestionAgent:
         client = self._get_arxiv_client()
         categories = categories or DEFAULT_CATEGORIES
         
-        print(f"\n📥 [Ingestion] 正在从 arXiv 采集最近 {days} 天的论文...")
+        log(f"\n📥 [Ingestion] 正在从 arXiv 采集最近 {days} 天的论文...")
         
         papers = client.search_recent(
             categories=categories,
@@ -104,38 +142,27 @@ class IngestionAgent:
             max_results=max_results,
         )
         
-        saved_count = 0
-        for paper in papers:
-            try:
-                self.repo.save_raw_paper(paper)
-                saved_count += 1
-            except Exception as e:
-                print(f"   保存失败: {e}")
-        
-        print(f"✅ arXiv: 已保存 {saved_count}/{len(papers)} 篇到 Raw Layer")
+        saved_count = self._save_raw_papers(papers, log)
+        
+        log(f"✅ arXiv: 已保存 {saved_count}/{len(papers)} 篇到 Raw Layer")
         return saved_count
     
     def ingest_arxiv_category(
         self,
         category: str,
         max_results: int = 1000,
+        log: Callable[[str], None] = print,
     ) -> int:
         """按类别采集 arXiv 论文"""
         client = self._get_arxiv_client()
         
-        print(f"\n📥 [Ingestion] 正在从 arXiv 采集 {category} 类别...")
+        log(f"\n📥 [Ingestion] 正在从 arXiv 采集 {category} 类别...")
         
         papers = client.search_by_category(category, max_results)
         
-        saved_count = 0
-        for paper in papers:
-            try:
-                self.repo.save_raw_paper(paper)
-                saved_count += 1
-            except Exception as e:
-                pass
-        
-        print(f"✅ arXiv {category}: 已保存 {saved_count} 篇")
+        saved_count = self._save_raw_papers(papers, log)
+        
+        log(f"✅ arXiv {category}: 已保存 {saved_count} 篇")
         return saved_count
     
     # ========== OpenAlex 采集 ==========
@@ -145,6 +172,7 @@ class IngestionAgent:
         venue_name: str,
         year: int,
         max_results: int = 2000,
+        log: Callable[[str], None] = print,
     ) -> int:
         """
         按会议采集 OpenAlex 论文
@@ -153,25 +181,20 @@ class IngestionAgent:
             venue_name: 会议名称
             year: 年份
             max_results: 最大数量
+            log: 输出函数，并发采集时带数据源前缀
             
         Returns:
             采集数量
         """
         client = self._get_openalex_client()
         
-        print(f"\n📥 [Ingestion] 正在从 OpenAlex 采集 {venue_name} {year}...")
+        log(f"\n📥 [Ingestion] 正在从 OpenAlex 采集 {venue_name} {year}...")
         
         papers = client.search_by_venue_year(venue_name, year, max_results)
         
-        saved_count = 0
-        for paper in papers:
-            try:
-                self.repo.save_raw_paper(paper)
-                saved_count += 1
-            except Exception as e:
-                pass
-        
-        print(f"✅ OpenAlex {venue_name} {year}: 已保存 {saved_count} 篇")
+        saved_count = self._save_raw_papers(papers, log)
+        
+        log(f"✅ OpenAlex {venue_name} {year}: 已保存 {saved_count} 篇")
         return saved_count
     
     # ========== Semantic Scholar 采集 ==========
@@ -181,25 +204,19 @@ class IngestionAgent:
         venue_name: str,
         year: int,
         max_results: int = 1000,
+        log: Callable[[str], None] = print,
     ) -> int:
         """按会议采集 Semantic Scholar 论文"""
         client = self._get_s2_client()
         
-        print(f"\n📥 [Ingestion] 正在从 Semantic Scholar 采集 {venue_name} {year}...")
+        log(f"\n📥 [Ingestion] 正在从 Semantic Scholar 采集 {venue_name} {year}...")
         
         raw_papers = client.search_papers(venue_name, year, max_results)
         
-        saved_count = 0
-        for data in raw_papers:
-            try:
-                paper = self._parse_s2_to_raw(data, venue_name, year)
-                if paper:
-                    self.repo.save_raw_paper(paper)
-                    saved_count += 1
-            except Exception as e:
-                pass
+        papers = [self._parse_s2_to_raw(data, venue_name, year) for data in raw_papers]
+        saved_count = self._save_raw_papers(papers, log)
         
-        print(f"✅ Semantic Scholar {venue_name} {year}: 已保存 {saved_count} 篇")
+        log(f"✅ Semantic Scholar {venue_name} {year}: 已保存 {saved_count} 篇")
         return saved_count
     
     def _parse_s2_to_raw(self, data: Dict, venue: str, year: int) -> Optional[RawPaper]:
@@ -238,10 +255,11 @@ class IngestionAgent:
         venue_name: str,
         year: int,
         limit: int = None,
+        log: Callable[[str], None] = print,
     ) -> int:
         """采集 OpenReview 会议论文"""
         if venue_name not in VENUES:
-            print(f"⚠️ 未配置的会议: {venue_name}")
+            log(f"⚠️ 未配置的会议: {venue_name}")
             return 0
         
         config = VENUES[venue_name]
@@ -249,22 +267,25 @@ class IngestionAgent:
         
         venue_id = config.venue_id_pattern.format(year=year)
         
-        print(f"\n📥 [Ingestion] 正在从 OpenReview 采集 {venue_name} {year}...")
+        log(f"\n📥 [Ingestion] 正在从 OpenReview 采集 {venue_name} {year}...")
         
-        saved_count = 0
-        for note in client.get_accepted_papers(venue_id, limit=limit):
-            try:
-                paper = self._parse_or_to_raw(note, venue_name, year)
-                if paper:
-                    self.repo.save_raw_paper(paper)
-                    saved_count += 1
-            except Exception as e:
-                pass
+        # 先取完全部 note 再整批写入，写锁不跨网络请求持有
+        papers = [
+            self._parse_or_to_raw(note, venue_name, year, log)
+            for note in client.get_accepted_papers(venue_id, limit=limit)
+        ]
+        saved_count = self._save_raw_papers(papers, log)
         
-        print(f"✅ OpenReview {venue_name} {year}: 已保存 {saved_count} 篇")
+        log(f"✅ OpenReview {venue_name} {year}: 已保存 {saved_count} 篇")
         return saved_count
     
-    def _parse_or_to_raw(self, note, venue: str, year: int) -> Optional[RawPaper]:
+    def _parse_or_to_raw(
+        self,
+        note,
+        venue: str,
+        year: int,
+        log: Callable[[str], None] = print,
+    ) -> Optional[RawPaper]:
         """将 OpenReview Note 转换为 RawPaper"""
         try:
             content = note.content
@@ -309,7 +330,7 @@ class IngestionAgent:
                 retrieved_at=datetime.now(),
             )
         except Exception as e:
-            print(f"解析 OpenReview note 失败: {e}")
+            log(f"解析 OpenReview note 失败: {e}")
             return None
     
     # ========== 批量采集 ==========
@@ -334,7 +355,7 @@ class IngestionAgent:
             各数据源采集数量
         """
         sources = sources or ["arxiv", "openalex"]
-        results = {}
+        tasks = {}
         
         print("\n" + "=" * 60)
         print("📥 [Ingestion Agent] 开始采集原始数据")
@@ -342,35 +363,53 @@ class IngestionAgent:
         
         # arXiv
         if "arxiv" in sources:
-            results["arxiv"] = self.ingest_arxiv_recent(days=arxiv_days)
+            tasks["arxiv"] = lambda log: self.ingest_arxiv_recent(days=arxiv_days, log=log)
         
         # OpenAlex
         if "openalex" in sources and venues and years:
-            count = 0
-            for venue in venues:
-                for year in years:
-                    count += self.ingest_openalex_venue(venue, year)
-            results["openalex"] = count
+            tasks["openalex"] = lambda log: sum(
+                self.ingest_openalex_venue(venue, year, log=log)
+                for venue in venues
+                for year in years
+            )
         
         # Semantic Scholar
         if "s2" in sources and venues and years:
-            count = 0
-            for venue in venues:
-                for year in years:
-                    count += self.ingest_s2_venue(venue, year)
-            results["s2"] = count
+            tasks["s2"] = lambda log: sum(
+                self.ingest_s2_venue(venue, year, log=log)
+                for venue in venues
+                for year in years
+            )
         
         # OpenReview
         if "openreview" in sources:
-            count = 0
             or_venues = venues or list(VENUES.keys())
             or_years = years or [2024, 2023]
-            for venue in or_venues:
-                if venue in VENUES:
-                    for year in or_years:
-                        if year in VENUES[venue].years:
-                            count += self.ingest_openreview_venue(venue, year)
-            results["openreview"] = count
+            tasks["openreview"] = lambda log: sum(
+                self.ingest_openreview_venue(venue, year, log=log)
+                for venue in or_venues
+                if venue in VENUES
+                for year in or_years
+                if year in VENUES[venue].years
+            )
+        
+        # 各数据源互不依赖、以网络 I/O 为主，按数据源并发抓取；
+        # 写库经 _save_raw_papers 串行化，输出按数据源加前缀
+        results = {}
+        if tasks:
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = {
+                    name: executor.submit(task, _make_log(f"[{name}] "))
+                    for name, task in tasks.items()
+                }
+            
+            # 单个数据源失败不影响其他数据源的计数
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    print(f"❌ {name} 采集失败: {e}")
+                    results[name] = 0
         
         total = sum(results.values())
         print(f"\n📊 [Ingestion] 总计采集 {total} 篇到 Raw Layer")
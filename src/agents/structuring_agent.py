@@ -55,6 +55,12 @@ VENUE_PATTERNS = {
     "AISTATS": [r"\bAISTATS\b", r"Artificial Intelligence and Statistics"],
 }
 
+# 每个会议的全部模式合并为一个预编译正则，按 VENUE_PATTERNS 的顺序匹配
+_VENUE_REGEXES = [
+    (venue_name, re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE))
+    for venue_name, patterns in VENUE_PATTERNS.items()
+]
+
 # 领域分类
 DOMAIN_CATEGORIES = {
     "CV": ["cs.CV", "computer vision", "image", "video", "visual"],
@@ -174,12 +180,9 @@ class StructuringAgent:
     
     def _match_venue_patterns(self, text: str) -> Optional[str]:
         """匹配会议模式"""
-        text_lower = text.lower()
-        
-        for venue_name, patterns in VENUE_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    return venue_name
+        for venue_name, regex in _VENUE_REGEXES:
+            if regex.search(text):
+                return venue_name
         
         return None
     
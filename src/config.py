@@ -116,9 +116,17 @@ class ExtractorConfig:
     keybert_model: str = "all-MiniLM-L6-v2"  # 轻量级模型
     keybert_top_n: int = 20
     keybert_keyphrase_ngram_range: tuple = (1, 3)
+    keybert_half_precision: bool = True  # GPU 上以 FP16 运行编码器
+    keybert_diversity: float = 0.5  # MMR 多样性（0 只看相关度，1 只看多样性）
+    keybert_vocab_max_features: int = 20000  # build_vocab 候选词表上限（按语料词频）
+    
+    # TF-IDF 配置（需要 scikit-learn，缺失时回退到 YAKE）
+    tfidf_max_ngram_size: int = 3
+    tfidf_max_features: int = 50000
+    tfidf_num_keywords: int = 20
     
     # 默认提取器
-    default_extractor: str = "yake"  # 可选: "yake", "keybert", "both"
+    default_extractor: str = "yake"  # 可选: "yake", "keybert", "both", "tfidf"
 
 
 # 默认配置实例
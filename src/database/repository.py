@@ -21,6 +21,10 @@ from scraper.models import (
 from config import DATABASE_PATH
 
 
+# 写锁忙等超时（秒）
+SQLITE_BUSY_TIMEOUT = 30
+
+
 # ============================================================
 # BASE REPOSITORY
 # ============================================================
@@ -28,9 +32,11 @@ from config import DATABASE_PATH
 class BaseRepository:
     """数据库基础仓库"""
     
-    def __init__(self, db_path: Path = None):
+    def __init__(self, db_path: Path = None, init_schema: bool = True):
         self.db_path = db_path or DATABASE_PATH
-        self._init_database()
+        # 共享同一数据库的子仓库无需重复执行建表脚本与 PRAGMA
+        if init_schema:
+            self._init_database()
     
     def _init_database(self):
         """初始化数据库表"""
@@ -49,7 +55,8 @@ class BaseRepository:
     @contextmanager
     def _get_connection(self):
         """获取数据库连接（上下文管理器）"""
-        conn = sqlite3.connect(self.db_path)
+        # 其他连接（Web 服务、其他进程）持有写锁时等待，而不是立即报 database is locked
+        conn = sqlite3.connect(self.db_path, timeout=SQLITE_BUSY_TIMEOUT)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
         try:
@@ -65,9 +72,10 @@ class BaseRepository:
 class RawRepository(BaseRepository):
     """原始数据层仓库"""
 
-    def __init__(self, db_path: Path = None):
-        super().__init__(db_path)
-        self._ensure_raw_schema_columns()
+    def __init__(self, db_path: Path = None, init_schema: bool = True):
+        super().__init__(db_path, init_schema)
+        if init_schema:
+            self._ensure_raw_schema_columns()
 
     def _ensure_raw_schema_columns(self):
         """Add newly introduced columns for existing DB files."""
@@ -226,31 +234,36 @@ class StructuredRepository(BaseRepository):
         """保存会议/期刊"""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR IGNORE INTO venues 
-                (canonical_name, full_name, domain, tier, venue_type, 
-                 openreview_ids, years_available, first_year, last_year, discovered_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                venue.canonical_name,
-                venue.full_name,
-                venue.domain,
-                getattr(venue, 'tier', 'C'),
-                venue.venue_type,
-                json.dumps(getattr(venue, 'openreview_ids', [])),
-                json.dumps(getattr(venue, 'years_available', [])),
-                venue.first_year,
-                venue.last_year,
-                datetime.now().isoformat(),
-            ))
+            venue_id = self._insert_venue(cursor, venue)
             conn.commit()
-            
-            # 获取 venue_id
-            cursor.execute(
-                "SELECT venue_id FROM venues WHERE canonical_name = ?",
-                (venue.canonical_name,)
-            )
-            return cursor.fetchone()["venue_id"]
+            return venue_id
+    
+    def _insert_venue(self, cursor: sqlite3.Cursor, venue: Venue) -> int:
+        """在给定游标上插入会议（已存在则忽略）并返回 venue_id，不提交"""
+        cursor.execute("""
+            INSERT OR IGNORE INTO venues 
+            (canonical_name, full_name, domain, tier, venue_type, 
+             openreview_ids, years_available, first_year, last_year, discovered_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            venue.canonical_name,
+            venue.full_name,
+            venue.domain,
+            getattr(venue, 'tier', 'C'),
+            venue.venue_type,
+            json.dumps(getattr(venue, 'openreview_ids', [])),
+            json.dumps(getattr(venue, 'years_available', [])),
+            venue.first_year,
+            venue.last_year,
+            datetime.now().isoformat(),
+        ))
+        
+        # 获取 venue_id
+        cursor.execute(
+            "SELECT venue_id FROM venues WHERE canonical_name = ?",
+            (venue.canonical_name,)
+        )
+        return cursor.fetchone()["venue_id"]
     
     def save_discovered_venue(
         self,
@@ -417,27 +430,32 @@ class StructuredRepository(BaseRepository):
         """保存论文"""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO papers 
-                (canonical_title, abstract, authors, year, venue_id, venue_type,
-                 domain, quality_flag, doi, url, pdf_url, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                paper.canonical_title,
-                paper.abstract,
-                json.dumps(paper.authors) if paper.authors else None,
-                paper.year,
-                paper.venue_id,
-                paper.venue_type,
-                paper.domain,
-                paper.quality_flag,
-                paper.doi,
-                paper.url,
-                paper.pdf_url,
-                datetime.now().isoformat(),
-            ))
+            paper_id = self._insert_paper(cursor, paper)
             conn.commit()
-            return cursor.lastrowid
+            return paper_id
+    
+    def _insert_paper(self, cursor: sqlite3.Cursor, paper: Paper) -> int:
+        """在给定游标上插入论文并返回 paper_id，不提交"""
+        cursor.execute("""
+            INSERT INTO papers 
+            (canonical_title, abstract, authors, year, venue_id, venue_type,
+             domain, quality_flag, doi, url, pdf_url, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            paper.canonical_title,
+            paper.abstract,
+            json.dumps(paper.authors) if paper.authors else None,
+            paper.year,
+            paper.venue_id,
+            paper.venue_type,
+            paper.domain,
+            paper.quality_flag,
+            paper.doi,
+            paper.url,
+            paper.pdf_url,
+            datetime.now().isoformat(),
+        ))
+        return cursor.lastrowid
     
     def get_paper(self, paper_id: int) -> Optional[Paper]:
         """获取论文"""
@@ -486,22 +504,24 @@ class StructuredRepository(BaseRepository):
             paper_id 如果找到，否则 None
         """
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # 使用 LOWER 进行不区分大小写匹配
-            if year:
-                cursor.execute(
-                    "SELECT paper_id FROM papers WHERE LOWER(canonical_title) = ? AND year = ? LIMIT 1",
-                    (title.lower(), year)
-                )
-            else:
-                cursor.execute(
-                    "SELECT paper_id FROM papers WHERE LOWER(canonical_title) = ? LIMIT 1",
-                    (title.lower(),)
-                )
-            
-            row = cursor.fetchone()
-            return row["paper_id"] if row else None
+            return self._find_paper_id(conn.cursor(), title, year)
+    
+    def _find_paper_id(self, cursor: sqlite3.Cursor, title: str, year: int = None) -> Optional[int]:
+        """find_paper_by_title 的游标版本，可在批量写入的事务内复用"""
+        # 使用 LOWER 进行不区分大小写匹配
+        if year:
+            cursor.execute(
+                "SELECT paper_id FROM papers WHERE LOWER(canonical_title) = ? AND year = ? LIMIT 1",
+                (title.lower(), year)
+            )
+        else:
+            cursor.execute(
+                "SELECT paper_id FROM papers WHERE LOWER(canonical_title) = ? LIMIT 1",
+                (title.lower(),)
+            )
+        
+        row = cursor.fetchone()
+        return row["paper_id"] if row else None
     
     def _row_to_paper(self, conn: sqlite3.Connection, row: sqlite3.Row) -> Paper:
         """将数据库行转换为 Paper"""
@@ -613,22 +633,25 @@ class AnalysisRepository(BaseRepository):
         self,
         method: str = "yake",
         limit: int = 1000,
+        with_authors: bool = True,
     ) -> List[Paper]:
         """
         获取没有提取关键词的论文（增量处理）
-        
+
         Args:
             method: 提取方法
             limit: 最大数量
-            
+            with_authors: 是否读取并解析作者列表（关键词提取不需要，可关闭以跳过逐行 JSON 解析）
+
         Returns:
             需要处理的论文列表
         """
-        import json
+        authors_column = ", p.authors" if with_authors else ""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT p.*
+            cursor.execute(f"""
+                SELECT p.paper_id, p.canonical_title, p.abstract, p.year, p.venue_id,
+                       p.venue_type, p.domain, p.quality_flag{authors_column}
                 FROM papers p
                 LEFT JOIN paper_keywords pk ON p.paper_id = pk.paper_id AND pk.method = ?
                 WHERE pk.id IS NULL
@@ -636,13 +659,13 @@ class AnalysisRepository(BaseRepository):
                   AND p.canonical_title != ''
                 LIMIT ?
             """, (method, limit))
-            
+
             papers = []
             for row in cursor.fetchall():
-                authors = row["authors"]
+                authors = row["authors"] if with_authors else None
                 if isinstance(authors, str):
                     authors = json.loads(authors) if authors else []
-                
+
                 papers.append(Paper(
                     paper_id=row["paper_id"],
                     canonical_title=row["canonical_title"],
@@ -918,22 +941,25 @@ class AnalysisRepository(BaseRepository):
     
     def save_keyword_trends_batch(self, trends: List[Dict]):
         """批量保存关键词趋势"""
+        now_iso = datetime.now().isoformat()  # 同一批次共用一个时间戳
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            for t in trends:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO analysis_keyword_trends 
-                    (scope, venue, keyword, granularity, bucket, count, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
+            cursor.executemany("""
+                INSERT OR REPLACE INTO analysis_keyword_trends
+                (scope, venue, keyword, granularity, bucket, count, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
                     t["scope"],
                     t.get("venue") or '',  # 空字符串代替 NULL
                     t["keyword"].lower(),
                     t["granularity"],
                     t["bucket"],
                     t["count"],
-                    datetime.now().isoformat()
-                ))
+                    now_iso,
+                )
+                for t in trends
+            ])
             conn.commit()
     
     def get_keyword_trends_cached(
@@ -983,21 +1009,24 @@ class AnalysisRepository(BaseRepository):
     
     def save_arxiv_timeseries_batch(self, data: List[Dict]):
         """批量保存 arXiv 时间序列"""
+        now_iso = datetime.now().isoformat()
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            for d in data:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO analysis_arxiv_timeseries 
-                    (category, granularity, bucket, paper_count, top_keywords_json, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
+            cursor.executemany("""
+                INSERT OR REPLACE INTO analysis_arxiv_timeseries
+                (category, granularity, bucket, paper_count, top_keywords_json, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, [
+                (
                     d["category"],
                     d["granularity"],
                     d["bucket"],
                     d["paper_count"],
                     json.dumps(d.get("top_keywords", []), ensure_ascii=False),
-                    datetime.now().isoformat()
-                ))
+                    now_iso,
+                )
+                for d in data
+            ])
             conn.commit()
     
     def get_arxiv_timeseries(
@@ -1070,22 +1099,25 @@ class AnalysisRepository(BaseRepository):
 
     def save_emerging_topics_batch(self, topics: List[Dict]):
         """批量保存新兴主题"""
+        now_iso = datetime.now().isoformat()
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            for t in topics:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO analysis_arxiv_emerging
-                    (category, keyword, growth_rate, first_seen, recent_count, trend, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
+            cursor.executemany("""
+                INSERT OR REPLACE INTO analysis_arxiv_emerging
+                (category, keyword, growth_rate, first_seen, recent_count, trend, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
                     t["category"],
                     t["keyword"].lower(),
                     t["growth_rate"],
                     t["first_seen"],
                     t["recent_count"],
                     t["trend"],
-                    datetime.now().isoformat()
-                ))
+                    now_iso,
+                )
+                for t in topics
+            ])
             conn.commit()
 
     def get_emerging_topics(
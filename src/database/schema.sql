@@ -117,6 +117,33 @@ CREATE TABLE IF NOT EXISTS scrape_logs (
     scraped_at      DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Cached raw_papers counters per source (refreshed by the DQ checker)
+CREATE TABLE IF NOT EXISTS raw_papers_stats (
+    source          TEXT PRIMARY KEY,
+    total           INTEGER NOT NULL DEFAULT 0,
+    title_null      INTEGER NOT NULL DEFAULT 0,
+    abstract_null   INTEGER NOT NULL DEFAULT 0,
+    year_null       INTEGER NOT NULL DEFAULT 0,
+    retrieved_null  INTEGER NOT NULL DEFAULT 0,
+    max_raw_id      INTEGER NOT NULL DEFAULT 0,  -- MAX(raw_papers.raw_id) when counted
+    updated_at      DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Any write to raw_papers invalidates that source's cached counters. MAX(raw_id)
+-- alone misses UPDATEs, deletes, and REPLACEs that reuse the highest raw_id.
+CREATE TRIGGER IF NOT EXISTS trg_raw_papers_stats_insert AFTER INSERT ON raw_papers
+BEGIN
+    DELETE FROM raw_papers_stats WHERE source = NEW.source;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_raw_papers_stats_update AFTER UPDATE ON raw_papers
+BEGIN
+    DELETE FROM raw_papers_stats WHERE source IN (OLD.source, NEW.source);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_raw_papers_stats_delete AFTER DELETE ON raw_papers
+BEGIN
+    DELETE FROM raw_papers_stats WHERE source = OLD.source;
+END;
+
 -- ========== ANALYSIS CACHE TABLES ==========
 -- Pre-computed analysis results for fast frontend access
 
@@ -183,19 +210,23 @@ CREATE TABLE IF NOT EXISTS analysis_arxiv_emerging (
 CREATE INDEX IF NOT EXISTS idx_raw_papers_source ON raw_papers(source, source_paper_id);
 CREATE INDEX IF NOT EXISTS idx_raw_papers_year ON raw_papers(year);
 CREATE INDEX IF NOT EXISTS idx_raw_papers_categories ON raw_papers(categories);
+CREATE INDEX IF NOT EXISTS idx_raw_papers_source_title ON raw_papers(source, title COLLATE NOCASE);  -- DQ title duplicate check
 CREATE INDEX IF NOT EXISTS idx_raw_papers_retrieved_at ON raw_papers(retrieved_at DESC);  -- 鏂板锛氭椂闂村簭鍒楁煡璇紭鍖?
 -- Structured Layer indexes
 CREATE INDEX IF NOT EXISTS idx_papers_venue_year ON papers(venue_id, year);
-CREATE INDEX IF NOT EXISTS idx_papers_canonical_title ON papers(LOWER(canonical_title));  -- 鏂板锛氭爣棰樺幓閲嶄紭鍖?CREATE INDEX IF NOT EXISTS idx_papers_domain ON papers(domain);
+CREATE INDEX IF NOT EXISTS idx_papers_canonical_title ON papers(LOWER(canonical_title));  -- 鏂板锛氭爣棰樺幓閲嶄紭鍖?
+CREATE INDEX IF NOT EXISTS idx_papers_domain ON papers(domain);
 CREATE INDEX IF NOT EXISTS idx_papers_quality ON papers(quality_flag);
-CREATE INDEX IF NOT EXISTS idx_paper_sources_paper ON paper_sources(paper_id);
+CREATE INDEX IF NOT EXISTS idx_paper_sources_paper_source_raw ON paper_sources(paper_id, source, raw_id);  -- 覆盖索引：按 paper 分组/查来源无需回表
+DROP INDEX IF EXISTS idx_paper_sources_paper;  -- 旧单列索引已被上面的覆盖索引取代，老库里一并删除
 CREATE INDEX IF NOT EXISTS idx_paper_sources_raw ON paper_sources(raw_id);
 CREATE INDEX IF NOT EXISTS idx_venues_domain_tier ON venues(domain, tier);  -- 鏂板锛氫細璁煡璇紭鍖?
 -- Analysis Layer indexes
 CREATE INDEX IF NOT EXISTS idx_paper_keywords_paper ON paper_keywords(paper_id);
 CREATE INDEX IF NOT EXISTS idx_paper_keywords_keyword ON paper_keywords(keyword);
 CREATE INDEX IF NOT EXISTS idx_paper_keywords_method ON paper_keywords(method);
-CREATE INDEX IF NOT EXISTS idx_paper_keywords_keyword_paper ON paper_keywords(keyword, paper_id);  -- 鏂板锛氬鍚堢储寮曚紭鍖栬仛鍚堟煡璇?CREATE INDEX IF NOT EXISTS idx_trend_cache_keyword_year ON trend_cache(keyword, year);
+CREATE INDEX IF NOT EXISTS idx_paper_keywords_keyword_paper ON paper_keywords(keyword, paper_id);  -- 鏂板锛氬鍚堢储寮曚紭鍖栬仛鍚堟煡璇?
+CREATE INDEX IF NOT EXISTS idx_trend_cache_keyword_year ON trend_cache(keyword, year);
 
 -- Operational indexes
 CREATE INDEX IF NOT EXISTS idx_ingestion_logs_source ON ingestion_logs(source, completed_at);
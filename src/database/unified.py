@@ -1,6 +1,8 @@
 """Unified repository and singleton factories."""
 
+import json
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -14,6 +16,13 @@ from .repository import (
 )
 
 
+# paper_keywords 批量写入：每行 3 个参数（score 固定为 1.0），
+# 按 SQLite 默认的 SQLITE_MAX_VARIABLE_NUMBER=999 计算每条语句的行数
+_KEYWORD_INSERT_PREFIX = "INSERT OR REPLACE INTO paper_keywords (paper_id, keyword, method, score) VALUES "
+_KEYWORD_ROW_VALUES = "(?, ?, ?, 1.0)"
+_KEYWORD_ROWS_PER_INSERT = 999 // 3
+
+
 class DatabaseRepository(BaseRepository):
     """
     统一数据库仓库
@@ -21,11 +30,14 @@ class DatabaseRepository(BaseRepository):
     整合三层仓库的功能，并提供向后兼容的接口。
     """
 
-    def __init__(self, db_path: Path = None):
-        super().__init__(db_path)
-        self.raw = RawRepository(self.db_path)
-        self.structured = StructuredRepository(self.db_path)
-        self.analysis = AnalysisRepository(self.db_path)
+    def __init__(self, db_path: Path = None, init_schema: bool = True):
+        super().__init__(db_path, init_schema)
+        # 建表与 PRAGMA 已在上面执行一次，子仓库共享同一数据库文件，不再重复初始化
+        self.raw = RawRepository(self.db_path, init_schema=False)
+        if init_schema:
+            self.raw._ensure_raw_schema_columns()
+        self.structured = StructuredRepository(self.db_path, init_schema=False)
+        self.analysis = AnalysisRepository(self.db_path, init_schema=False)
 
     def save_paper(self, paper: Paper) -> bool:
         """保存论文（兼容旧接口）"""
@@ -66,13 +78,108 @@ class DatabaseRepository(BaseRepository):
             return False
 
     def save_papers(self, papers: List[Paper]) -> int:
-        """批量保存论文（兼容旧接口）"""
+        """
+        批量保存论文（兼容旧接口）
+
+        逐篇语义与 save_paper 相同，但整批共用一个连接和一个事务：
+        每篇论文在 SAVEPOINT 内写入，失败只回滚该篇；
+        会议 ID 在批内缓存，关键词最后用 executemany 一次写入。
+        """
         count = 0
-        for paper in papers:
-            if self.save_paper(paper):
-                count += 1
+        venue_ids: Dict[str, int] = {}
+        keyword_rows: List[Tuple[int, str, str]] = []
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                for paper in papers:
+                    cursor.execute("SAVEPOINT save_paper")
+                    try:
+                        new_venue, rows = self._stage_paper(cursor, paper, venue_ids)
+                    except Exception as exc:
+                        cursor.execute("ROLLBACK TO save_paper")
+                        cursor.execute("RELEASE save_paper")
+                        print(f"保存论文失败: {exc}")
+                        continue
+                    cursor.execute("RELEASE save_paper")
+
+                    if new_venue:
+                        venue_ids[paper.venue_name] = paper.venue_id
+                    keyword_rows.extend(rows)
+                    count += 1
+
+                self._insert_keyword_rows(cursor, keyword_rows)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
         return count
 
+    @staticmethod
+    def _insert_keyword_rows(cursor, rows: List[Tuple[int, str, str]]):
+        """
+        多行 VALUES 批量写入关键词
+
+        整块部分每条语句写入 _KEYWORD_ROWS_PER_INSERT 行，剩余尾部用单行语句 executemany。
+        """
+        per_insert = _KEYWORD_ROWS_PER_INSERT
+        full = len(rows) - len(rows) % per_insert
+        if full:
+            cursor.executemany(
+                _KEYWORD_INSERT_PREFIX + ", ".join([_KEYWORD_ROW_VALUES] * per_insert),
+                (
+                    list(chain.from_iterable(rows[start:start + per_insert]))
+                    for start in range(0, full, per_insert)
+                ),
+            )
+        if full < len(rows):
+            cursor.executemany(_KEYWORD_INSERT_PREFIX + _KEYWORD_ROW_VALUES, rows[full:])
+
+    def _stage_paper(
+        self,
+        cursor,
+        paper: Paper,
+        venue_ids: Dict[str, int],
+    ) -> Tuple[bool, List[Tuple[int, str, str]]]:
+        """
+        在当前事务内写入会议与论文，返回 (是否新查到会议, 待写入的关键词行)
+        """
+        if not paper.venue_name and getattr(paper, "venue", None):
+            paper.venue_name = paper.venue
+
+        new_venue = False
+        venue_id = None
+        if paper.venue_name:
+            venue_id = venue_ids.get(paper.venue_name)
+            if venue_id is None:
+                venue_id = self.structured._insert_venue(
+                    cursor,
+                    Venue(
+                        canonical_name=paper.venue_name,
+                        domain=paper.domain,
+                    ),
+                )
+                new_venue = True
+            paper.venue_id = venue_id
+
+        paper_id = self.structured._find_paper_id(
+            cursor,
+            paper.canonical_title.lower(),
+            paper.year,
+        )
+        if not paper_id:
+            paper_id = self.structured._insert_paper(cursor, paper)
+        paper.paper_id = paper_id
+
+        rows = [(paper_id, keyword.lower().strip(), "author") for keyword in paper.keywords]
+        rows.extend(
+            (paper_id, keyword.lower().strip(), "extracted")
+            for keyword in paper.extracted_keywords
+        )
+        return new_venue, rows
+
     def get_paper(self, paper_id: int) -> Optional[Paper]:
         """获取论文"""
         if isinstance(paper_id, str):
@@ -185,6 +292,67 @@ class DatabaseRepository(BaseRepository):
                 cursor.execute("SELECT DISTINCT year FROM papers ORDER BY year DESC")
             return [row["year"] for row in cursor.fetchall()]
 
+    def get_venue_index_rows(self, keyword_limit: int = 10) -> Dict[str, Dict[str, Any]]:
+        """
+        一条 SQL 取回所有会议的论文数、年份列表与 Top 关键词
+
+        Returns:
+            canonical_name -> {"paper_count", "years"（降序）, "top_keywords": [(关键词, 次数)]}
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                WITH per_year AS (
+                    SELECT venue_id, year, COUNT(*) as n
+                    FROM papers
+                    WHERE venue_id IS NOT NULL
+                    GROUP BY venue_id, year
+                ),
+                venue_years AS (
+                    SELECT venue_id, SUM(n) as paper_count, json_group_array(year) as years
+                    FROM per_year
+                    GROUP BY venue_id
+                ),
+                keyword_counts AS (
+                    SELECT p.venue_id, pk.keyword, COUNT(*) as count,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY p.venue_id ORDER BY COUNT(*) DESC, pk.keyword
+                           ) as rn
+                    FROM paper_keywords pk
+                    JOIN papers p ON pk.paper_id = p.paper_id
+                    WHERE p.venue_id IS NOT NULL
+                    GROUP BY p.venue_id, pk.keyword
+                ),
+                venue_keywords AS (
+                    SELECT venue_id, json_group_array(json_array(keyword, count)) as keywords
+                    FROM keyword_counts
+                    WHERE rn <= ?
+                    GROUP BY venue_id
+                )
+                SELECT v.canonical_name, vy.paper_count, vy.years, vk.keywords
+                FROM venues v
+                LEFT JOIN venue_years vy ON vy.venue_id = v.venue_id
+                LEFT JOIN venue_keywords vk ON vk.venue_id = v.venue_id
+                """,
+                (keyword_limit,),
+            )
+            # json_group_array 不保证元素顺序（聚合内 ORDER BY 需要 SQLite 3.44+），在这里排序
+            return {
+                row["canonical_name"]: {
+                    "paper_count": row["paper_count"] or 0,
+                    # 与 get_all_years 一致：年份降序，NULL 排在最后
+                    "years": sorted(
+                        json.loads(row["years"]), key=lambda y: (y is None, -(y or 0))
+                    ) if row["years"] else [],
+                    "top_keywords": sorted(
+                        ((kw, count) for kw, count in json.loads(row["keywords"])),
+                        key=lambda item: (-item[1], item[0]),
+                    ) if row["keywords"] else [],
+                }
+                for row in cursor.fetchall()
+            }
+
     def get_venue_comparison(self, year: int, limit: int = 10) -> Dict[str, List[Tuple[str, int]]]:
         """获取会议对比（兼容旧接口）"""
         result = {}
@@ -292,24 +460,24 @@ def get_repository(db_path: Path = None) -> DatabaseRepository:
 
 
 def get_raw_repository(db_path: Path = None) -> RawRepository:
-    """获取原始数据层仓库"""
+    """获取原始数据层仓库（复用统一仓库的子仓库）"""
     global _raw_repository
     if _raw_repository is None:
-        _raw_repository = RawRepository(db_path)
+        _raw_repository = get_repository(db_path).raw
     return _raw_repository
 
 
 def get_structured_repository(db_path: Path = None) -> StructuredRepository:
-    """获取结构化数据层仓库"""
+    """获取结构化数据层仓库（复用统一仓库的子仓库）"""
     global _structured_repository
     if _structured_repository is None:
-        _structured_repository = StructuredRepository(db_path)
+        _structured_repository = get_repository(db_path).structured
     return _structured_repository
 
 
 def get_analysis_repository(db_path: Path = None) -> AnalysisRepository:
-    """获取分析层仓库"""
+    """获取分析层仓库（复用统一仓库的子仓库）"""
     global _analysis_repository
     if _analysis_repository is None:
-        _analysis_repository = AnalysisRepository(db_path)
+        _analysis_repository = get_repository(db_path).analysis
     return _analysis_repository
@@ -4,7 +4,10 @@ arXiv 数据质量检查脚本
 根据 agent.md 文档的 QA 检查清单验证数据质量。
 """
 
+import io
 import sys
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List
@@ -14,12 +17,30 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from database import get_repository
 
+try:
+    import orjson  # 可选依赖：更快的 JSON 序列化
+except ImportError:
+    orjson = None
+
+# 检查的数据源；作为绑定参数传入，使各查询的 SQL 文本与来源无关
+ARXIV_SOURCE = "arxiv"
+
+# raw_papers_stats 缓存的计数字段
+RAW_STATS_FIELDS = ("total", "title_null", "abstract_null", "year_null", "retrieved_null")
+
 
 class ArxivDataQualityChecker:
     """arXiv 数据质量检查器"""
 
-    def __init__(self):
+    # raw_papers 超过该行数时，标题重复率改为抽样估计
+    SAMPLE_THRESHOLD = 500_000
+    # 抽样比例 1/SAMPLE_MODULUS（按 raw_id 取模）
+    SAMPLE_MODULUS = 256
+
+    def __init__(self, exact: bool = False):
         self.repo = get_repository()
+        # exact=True 时总是全表统计标题重复
+        self.exact = exact
         self.results = {
             "timestamp": datetime.now().isoformat(),
             "checks": {},
@@ -30,76 +51,156 @@ class ArxivDataQualityChecker:
                 "warnings": 0
             }
         }
+        # arXiv 原始论文总数，首次查询后缓存供各项检查复用
+        self._arxiv_total = None
+        # raw_papers_stats 中的计数（见 _load_raw_stats）
+        self._raw_stats = None
 
     def run_all_checks(self) -> Dict:
         """运行所有质量检查"""
-        print("=" * 60)
-        print("arXiv Data Quality Check")
-        print("=" * 60)
-        print()
-
-        # Raw Layer 检查
-        print("Raw Layer Checks")
-        print("-" * 40)
-        self._check_raw_completeness()
-        self._check_raw_duplicates()
-        self._check_raw_anomalies()
-        print()
-
-        # Analysis Layer 检查
-        print("Analysis Layer Checks")
-        print("-" * 40)
-        self._check_analysis_cache()
-        self._check_keyword_quality()
-        print()
+        # 输出先写入缓冲区，检查结束后一次性写到 stdout
+        self._out = io.StringIO()
+        print("=" * 60, file=self._out)
+        print("arXiv Data Quality Check", file=self._out)
+        print("=" * 60, file=self._out)
+        print(file=self._out)
+
+        # 各项检查互相独立：每项在线程池中使用自己的只读连接查询，
+        # 结果按固定顺序写入报告并打印
+        phases = [
+            ("Raw Layer Checks", [
+                ("raw_completeness", self._check_raw_completeness, {"unit": "%"}),
+                ("raw_duplicates", self._check_raw_duplicates, {}),
+                ("raw_anomalies", self._check_raw_anomalies, {"unit": "%", "fail_status": "[WARN]"}),
+            ]),
+            ("Analysis Layer Checks", [
+                ("analysis_cache", self._check_analysis_cache, {"threshold_prefix": "> "}),
+                ("keyword_quality", self._check_keyword_quality, {"unit": "%"}),
+            ]),
+        ]
+        checks = [check for _, group in phases for check in group]
+
+        # 先读取（必要时刷新）原始层计数缓存，避免并行的检查各自重复扫描
+        with self.repo._get_connection() as conn:
+            self._load_raw_stats(conn)
+
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            futures = {
+                name: pool.submit(self._run_check, check)
+                for name, check, _ in checks
+            }
+
+        for title, group in phases:
+            print(title, file=self._out)
+            print("-" * 40, file=self._out)
+            for name, _, style in group:
+                entry = futures[name].result()
+                self.results["checks"][name] = entry
+                self._print_check(entry, **style)
+            print(file=self._out)
 
         # 生成报告
         self._generate_summary()
 
-        return self.results
+        sys.stdout.write(self._out.getvalue())
+        sys.stdout.flush()
 
-    def _check_raw_completeness(self):
-        """检查 Raw 层数据完整性"""
-        check_name = "raw_completeness"
+        return self.results
 
+    def _run_check(self, check) -> Dict:
+        """在独立的只读连接上执行单项检查（供线程池调用）"""
         with self.repo._get_connection() as conn:
-            cursor = conn.cursor()
-
-            # 总数
-            cursor.execute("SELECT COUNT(*) as total FROM raw_papers WHERE source = 'arxiv'")
-            total = cursor.fetchone()["total"]
-
-            # title 非空率
-            cursor.execute("""
-                SELECT COUNT(*) as count FROM raw_papers
-                WHERE source = 'arxiv' AND (title IS NULL OR title = '')
-            """)
-            title_null = cursor.fetchone()["count"]
-            title_rate = (total - title_null) / total * 100 if total > 0 else 0
-
-            # abstract 非空率
-            cursor.execute("""
-                SELECT COUNT(*) as count FROM raw_papers
-                WHERE source = 'arxiv' AND (abstract IS NULL OR abstract = '')
-            """)
-            abstract_null = cursor.fetchone()["count"]
-            abstract_rate = (total - abstract_null) / total * 100 if total > 0 else 0
-
-            # year 可解析率
-            cursor.execute("""
-                SELECT COUNT(*) as count FROM raw_papers
-                WHERE source = 'arxiv' AND (year IS NULL OR year = 0)
-            """)
-            year_null = cursor.fetchone()["count"]
-            year_rate = (total - year_null) / total * 100 if total > 0 else 0
+            conn.execute("PRAGMA query_only = ON")
+            return check(conn.cursor())
+
+    def _print_check(
+        self,
+        entry: Dict,
+        unit: str = "",
+        threshold_prefix: str = "",
+        fail_status: str = "[FAIL]",
+    ):
+        """打印单项检查结果并更新汇总统计"""
+        if "total_papers" in entry:
+            print(f"  Total papers: {entry['total_papers']}", file=self._out)
+        for key, check in entry["checks"].items():
+            if check.get("info"):
+                print(f"  [INFO] {key}: {check['value']}", file=self._out)
+                continue
+            status = "[PASS]" if check["passed"] else fail_status
+            print(f"  {status} {key}: {check['value']}{unit} (threshold: {threshold_prefix}{check['threshold']}{unit})", file=self._out)
+            if not check["passed"] and fail_status == "[WARN]":
+                # 警告项不计入失败
+                self.results["summary"]["warnings"] += 1
+            else:
+                self._update_summary(check["passed"])
 
-            # retrieved_at 必填
+    def _count_raw_stats(self, cursor) -> Dict:
+        """一次扫描统计 arXiv 原始论文总数与各字段缺失数"""
+        cursor.execute("""
+            SELECT
+                COUNT(*) as total,
+                SUM(CASE WHEN title IS NULL OR title = '' THEN 1 ELSE 0 END) as title_null,
+                SUM(CASE WHEN abstract IS NULL OR abstract = '' THEN 1 ELSE 0 END) as abstract_null,
+                SUM(CASE WHEN year IS NULL OR year = 0 THEN 1 ELSE 0 END) as year_null,
+                SUM(CASE WHEN retrieved_at IS NULL THEN 1 ELSE 0 END) as retrieved_null
+            FROM raw_papers
+            WHERE source = ?
+        """, (ARXIV_SOURCE,))
+        row = cursor.fetchone()
+        # 空表时 SUM 返回 NULL
+        return {key: row[key] or 0 for key in RAW_STATS_FIELDS}
+
+    def _load_raw_stats(self, conn) -> Dict:
+        """
+        读取 raw_papers_stats 中缓存的计数
+
+        raw_papers 上的触发器在任何 INSERT / UPDATE / DELETE 后删除对应来源的缓存行，
+        因此缓存行存在且 MAX(raw_id) 未变化时计数仍然有效，无需重新扫描。
+        """
+        cursor = conn.cursor()
+        cursor.execute("SELECT MAX(raw_id) as max_raw_id FROM raw_papers")
+        max_raw_id = cursor.fetchone()["max_raw_id"] or 0
+
+        cursor.execute("SELECT * FROM raw_papers_stats WHERE source = ?", (ARXIV_SOURCE,))
+        row = cursor.fetchone()
+        if row is not None and row["max_raw_id"] == max_raw_id:
+            stats = {key: row[key] for key in RAW_STATS_FIELDS}
+        else:
+            stats = self._count_raw_stats(cursor)
             cursor.execute("""
-                SELECT COUNT(*) as count FROM raw_papers
-                WHERE source = 'arxiv' AND retrieved_at IS NULL
-            """)
-            retrieved_null = cursor.fetchone()["count"]
-            retrieved_rate = (total - retrieved_null) / total * 100 if total > 0 else 0
+                INSERT OR REPLACE INTO raw_papers_stats
+                (source, total, title_null, abstract_null, year_null, retrieved_null, max_raw_id, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                ARXIV_SOURCE,
+                *(stats[key] for key in RAW_STATS_FIELDS),
+                max_raw_id,
+                datetime.now().isoformat(),
+            ))
+            conn.commit()
+
+        self._raw_stats = stats
+        self._arxiv_total = stats["total"]
+        return stats
+
+    def _check_raw_completeness(self, cursor) -> Dict:
+        """检查 Raw 层数据完整性"""
+        stats = self._raw_stats or self._count_raw_stats(cursor)
+        total = stats["total"]
+        title_null = stats["title_null"]
+        abstract_null = stats["abstract_null"]
+        year_null = stats["year_null"]
+        retrieved_null = stats["retrieved_null"]
+
+        # title 非空率
+        title_rate = (total - title_null) / total * 100 if total > 0 else 0
+        # abstract 非空率
+        abstract_rate = (total - abstract_null) / total * 100 if total > 0 else 0
+        # year 可解析率
+        year_rate = (total - year_null) / total * 100 if total > 0 else 0
+        # retrieved_at 必填
+        retrieved_rate = (total - retrieved_null) / total * 100 if total > 0 else 0
 
         # 评估结果
         checks = {
@@ -125,50 +226,81 @@ class ArxivDataQualityChecker:
             }
         }
 
-        self.results["checks"][check_name] = {
+        result = {
             "total_papers": total,
             "checks": checks
         }
+        if total == 0:
+            # 空表：各项比率记为 0 并判定失败，后续检查据缓存的总数跳过查询
+            result["reason"] = "empty_table"
+        return result
 
-        # 打印结果
-        print(f"  Total papers: {total}")
-        for key, check in checks.items():
-            status = "[PASS]" if check["passed"] else "[FAIL]"
-            print(f"  {status} {key}: {check['value']}% (threshold: {check['threshold']}%)")
-            self._update_summary(check["passed"])
-
-    def _check_raw_duplicates(self):
+    def _check_raw_duplicates(self, cursor) -> Dict:
         """检查 Raw 层重复数据"""
-        check_name = "raw_duplicates"
-
-        with self.repo._get_connection() as conn:
-            cursor = conn.cursor()
-
-            # (source, source_paper_id) 重复
+        total = self._get_arxiv_total(cursor)
+        approximate = not self.exact and total > self.SAMPLE_THRESHOLD
+        if total == 0:
+            # 空表直接跳过重复检测查询
+            duplicate_count, dup_rate, title_duplicates = 0, 0, []
+        else:
+            # (source, source_paper_id) 重复：只取组数，不拉回每个重复组
             cursor.execute("""
-                SELECT source, source_paper_id, COUNT(*) as count
-                FROM raw_papers
-                WHERE source = 'arxiv'
-                GROUP BY source, source_paper_id
-                HAVING count > 1
-            """)
-            duplicates = cursor.fetchall()
-            duplicate_count = len(duplicates)
+                SELECT COUNT(*) as count FROM (
+                    SELECT 1
+                    FROM raw_papers
+                    WHERE source = ?
+                    GROUP BY source, source_paper_id
+                    HAVING COUNT(*) > 1
+                )
+            """, (ARXIV_SOURCE,))
+            duplicate_count = cursor.fetchone()["count"]
 
             # title+abstract 哈希重复（简化版：只检查 title）
+            if approximate:
+                # 大表按 raw_id 取模抽样，逐条经 (source, title) 索引查同名组大小 g；
+                # 每条重复行贡献 1/g，其均值即为"重复组数 / 总行数"的无偏估计
+                cursor.execute("""
+                    SELECT
+                        COUNT(*) as sampled,
+                        SUM(CASE WHEN g > 1 THEN 1.0 / g ELSE 0 END) as dup_groups
+                    FROM (
+                        SELECT CASE
+                            WHEN s.title IS NULL OR s.title = '' THEN 0
+                            ELSE (
+                                SELECT COUNT(*) FROM raw_papers r2
+                                WHERE r2.source = s.source AND r2.title = s.title COLLATE NOCASE
+                            )
+                        END as g
+                        FROM raw_papers s
+                        WHERE s.source = ? AND s.raw_id % ? = 0
+                    )
+                """, (ARXIV_SOURCE, self.SAMPLE_MODULUS))
+                row = cursor.fetchone()
+                sample_size = row["sampled"]
+                dup_rate = (row["dup_groups"] or 0) / sample_size * 100 if sample_size > 0 else 0
+            else:
+                cursor.execute("""
+                    SELECT COUNT(*) as count FROM (
+                        SELECT 1
+                        FROM raw_papers
+                        WHERE source = ? AND title IS NOT NULL AND title != ''
+                        GROUP BY title COLLATE NOCASE
+                        HAVING COUNT(*) > 1
+                    )
+                """, (ARXIV_SOURCE,))
+                title_dup_count = cursor.fetchone()["count"]
+                dup_rate = title_dup_count / total * 100 if total > 0 else 0
+
+            # 报告只展示前 5 个重复示例
             cursor.execute("""
                 SELECT title, COUNT(*) as count
                 FROM raw_papers
-                WHERE source = 'arxiv' AND title IS NOT NULL AND title != ''
-                GROUP BY LOWER(title)
+                WHERE source = ? AND title IS NOT NULL AND title != ''
+                GROUP BY title COLLATE NOCASE
                 HAVING count > 1
-            """)
+                LIMIT 5
+            """, (ARXIV_SOURCE,))
             title_duplicates = cursor.fetchall()
-            title_dup_count = len(title_duplicates)
-
-            cursor.execute("SELECT COUNT(*) as total FROM raw_papers WHERE source = 'arxiv'")
-            total = cursor.fetchone()["total"]
-            dup_rate = title_dup_count / total * 100 if total > 0 else 0
 
         checks = {
             "unique_constraint_violations": {
@@ -182,46 +314,38 @@ class ArxivDataQualityChecker:
                 "passed": dup_rate < 3.0
             }
         }
+        if approximate:
+            checks["title_duplicate_rate"]["approximate"] = True
+            checks["title_duplicate_rate"]["sample_size"] = sample_size
 
-        self.results["checks"][check_name] = {
+        return {
             "checks": checks,
             "duplicate_examples": [
                 {"title": row["title"], "count": row["count"]}
-                for row in title_duplicates[:5]
+                for row in title_duplicates
             ]
         }
 
-        # 打印结果
-        for key, check in checks.items():
-            status = "[PASS]" if check["passed"] else "[FAIL]"
-            print(f"  {status} {key}: {check['value']} (threshold: {check['threshold']})")
-            self._update_summary(check["passed"])
-
-    def _check_raw_anomalies(self):
+    def _check_raw_anomalies(self, cursor) -> Dict:
         """检查 Raw 层异常数据"""
-        check_name = "raw_anomalies"
-
-        with self.repo._get_connection() as conn:
-            cursor = conn.cursor()
-
-            # 异常年份（< 1990 或 > 当前年份 + 1）
+        # 异常年份（< 1990 或 > 当前年份 + 1）与异常标题长度（< 10 或 > 500）一次扫描统计
+        total = self._get_arxiv_total(cursor)
+        if total == 0:
+            # 空表直接跳过异常检测查询
+            anomaly_year = anomaly_title = 0
+        else:
             current_year = datetime.now().year
             cursor.execute("""
-                SELECT COUNT(*) as count FROM raw_papers
-                WHERE source = 'arxiv' AND (year < 1990 OR year > ?)
-            """, (current_year + 1,))
-            anomaly_year = cursor.fetchone()["count"]
-
-            # 异常标题长度（< 10 或 > 500）
-            cursor.execute("""
-                SELECT COUNT(*) as count FROM raw_papers
-                WHERE source = 'arxiv' AND (LENGTH(title) < 10 OR LENGTH(title) > 500)
-            """)
-            anomaly_title = cursor.fetchone()["count"]
-
-            cursor.execute("SELECT COUNT(*) as total FROM raw_papers WHERE source = 'arxiv'")
-            total = cursor.fetchone()["total"]
-            anomaly_rate = (anomaly_year + anomaly_title) / total * 100 if total > 0 else 0
+                SELECT
+                    SUM(CASE WHEN year < 1990 OR year > ? THEN 1 ELSE 0 END) as anomaly_year,
+                    SUM(CASE WHEN LENGTH(title) < 10 OR LENGTH(title) > 500 THEN 1 ELSE 0 END) as anomaly_title
+                FROM raw_papers
+                WHERE source = ?
+            """, (current_year + 1, ARXIV_SOURCE))
+            row = cursor.fetchone()
+            anomaly_year = row["anomaly_year"] or 0
+            anomaly_title = row["anomaly_title"] or 0
+        anomaly_rate = (anomaly_year + anomaly_title) / total * 100 if total > 0 else 0
 
         checks = {
             "anomaly_rate": {
@@ -239,38 +363,21 @@ class ArxivDataQualityChecker:
             }
         }
 
-        self.results["checks"][check_name] = {"checks": checks}
+        return {"checks": checks}
 
-        # 打印结果
-        for key, check in checks.items():
-            if check.get("info"):
-                print(f"  [INFO] {key}: {check['value']}")
-            else:
-                status = "[PASS]" if check["passed"] else "[WARN]"
-                print(f"  {status} {key}: {check['value']}% (threshold: {check['threshold']}%)")
-                if not check["passed"]:
-                    self.results["summary"]["warnings"] += 1
-                else:
-                    self._update_summary(True)
-
-    def _check_analysis_cache(self):
+    def _check_analysis_cache(self, cursor) -> Dict:
         """检查 Analysis 层缓存"""
-        check_name = "analysis_cache"
-
-        with self.repo._get_connection() as conn:
-            cursor = conn.cursor()
-
-            # 检查 analysis_arxiv_timeseries 表
-            cursor.execute("SELECT COUNT(*) as count FROM analysis_arxiv_timeseries")
-            timeseries_count = cursor.fetchone()["count"]
-
-            # 检查 analysis_arxiv_emerging 表
-            cursor.execute("SELECT COUNT(*) as count FROM analysis_arxiv_emerging")
-            emerging_count = cursor.fetchone()["count"]
-
-            # 检查 analysis_meta 表
-            cursor.execute("SELECT COUNT(*) as count FROM analysis_meta WHERE key LIKE 'arxiv%'")
-            meta_count = cursor.fetchone()["count"]
+        # 三张缓存表的行数合并为一次查询
+        cursor.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM analysis_arxiv_timeseries) as timeseries_count,
+                (SELECT COUNT(*) FROM analysis_arxiv_emerging) as emerging_count,
+                (SELECT COUNT(*) FROM analysis_meta WHERE key LIKE 'arxiv%') as meta_count
+        """)
+        row = cursor.fetchone()
+        timeseries_count = row["timeseries_count"]
+        emerging_count = row["emerging_count"]
+        meta_count = row["meta_count"]
 
         checks = {
             "timeseries_cached": {
@@ -288,53 +395,34 @@ class ArxivDataQualityChecker:
             }
         }
 
-        self.results["checks"][check_name] = {"checks": checks}
+        return {"checks": checks}
 
-        # 打印结果
-        for key, check in checks.items():
-            if check.get("info"):
-                print(f"  [INFO] {key}: {check['value']}")
-            else:
-                status = "[PASS]" if check["passed"] else "[FAIL]"
-                print(f"  {status} {key}: {check['value']} (threshold: > {check['threshold']})")
-                self._update_summary(check["passed"])
-
-    def _check_keyword_quality(self):
+    def _check_keyword_quality(self, cursor) -> Dict:
         """检查关键词质量"""
-        check_name = "keyword_quality"
-
-        with self.repo._get_connection() as conn:
-            cursor = conn.cursor()
-
-            # 从 analysis_arxiv_timeseries 中抽样检查关键词
-            cursor.execute("""
+        # 从 analysis_arxiv_timeseries 中抽样检查关键词
+        # 由 SQLite 的 json_each 展开 JSON 数组，只回传关键词字符串
+        cursor.execute("""
+            SELECT json_extract(kw.value, '$.keyword') as keyword
+            FROM (
                 SELECT top_keywords_json FROM analysis_arxiv_timeseries
-                WHERE top_keywords_json IS NOT NULL
+                WHERE top_keywords_json IS NOT NULL AND top_keywords_json != ''
                 LIMIT 10
-            """)
+            ) AS ts, json_each(ts.top_keywords_json) AS kw
+        """)
 
-            import json
-            import re
+        total_keywords = 0
+        invalid_keywords = 0
 
-            total_keywords = 0
-            invalid_keywords = 0
+        # 逐行迭代游标，不整体 fetchall
+        for row in cursor:
+            keyword = row["keyword"] or ""
+            total_keywords += 1
 
-            for row in cursor.fetchall():
-                keywords_json = row["top_keywords_json"]
-                if keywords_json:
-                    keywords = json.loads(keywords_json)
-                    for kw_data in keywords:
-                        keyword = kw_data.get("keyword", "")
-                        total_keywords += 1
+            # 太短或纯数字
+            if len(keyword) <= 2 or keyword.isdigit():
+                invalid_keywords += 1
 
-                        # 检查是否为纯数字
-                        if re.match(r'^\d+$', keyword):
-                            invalid_keywords += 1
-                        # 检查是否太短
-                        elif len(keyword) <= 2:
-                            invalid_keywords += 1
-
-            invalid_rate = invalid_keywords / total_keywords * 100 if total_keywords > 0 else 0
+        invalid_rate = invalid_keywords / total_keywords * 100 if total_keywords > 0 else 0
 
         checks = {
             "keyword_quality": {
@@ -352,16 +440,14 @@ class ArxivDataQualityChecker:
             }
         }
 
-        self.results["checks"][check_name] = {"checks": checks}
+        return {"checks": checks}
 
-        # 打印结果
-        for key, check in checks.items():
-            if check.get("info"):
-                print(f"  [INFO] {key}: {check['value']}")
-            else:
-                status = "[PASS]" if check["passed"] else "[FAIL]"
-                print(f"  {status} {key}: {check['value']}% (threshold: {check['threshold']}%)")
-                self._update_summary(check["passed"])
+    def _get_arxiv_total(self, cursor) -> int:
+        """获取 arXiv 原始论文总数（缓存）"""
+        if self._arxiv_total is None:
+            cursor.execute("SELECT COUNT(*) as total FROM raw_papers WHERE source = ?", (ARXIV_SOURCE,))
+            self._arxiv_total = cursor.fetchone()["total"]
+        return self._arxiv_total
 
     def _update_summary(self, passed: bool):
         """更新汇总统计"""
@@ -375,44 +461,56 @@ class ArxivDataQualityChecker:
         """生成汇总报告"""
         summary = self.results["summary"]
 
-        print("=" * 60)
-        print("Summary")
-        print("=" * 60)
-        print(f"  Total checks: {summary['total_checks']}")
-        print(f"  Passed: {summary['passed']}")
-        print(f"  Failed: {summary['failed']}")
-        print(f"  Warnings: {summary['warnings']}")
+        print("=" * 60, file=self._out)
+        print("Summary", file=self._out)
+        print("=" * 60, file=self._out)
+        print(f"  Total checks: {summary['total_checks']}", file=self._out)
+        print(f"  Passed: {summary['passed']}", file=self._out)
+        print(f"  Failed: {summary['failed']}", file=self._out)
+        print(f"  Warnings: {summary['warnings']}", file=self._out)
 
         pass_rate = summary['passed'] / summary['total_checks'] * 100 if summary['total_checks'] > 0 else 0
-        print(f"  Pass rate: {pass_rate:.1f}%")
+        print(f"  Pass rate: {pass_rate:.1f}%", file=self._out)
 
         if pass_rate >= 95:
-            print("\n  [EXCELLENT] Data quality is excellent!")
+            print("\n  [EXCELLENT] Data quality is excellent!", file=self._out)
         elif pass_rate >= 80:
-            print("\n  [GOOD] Data quality is good")
+            print("\n  [GOOD] Data quality is good", file=self._out)
         else:
-            print("\n  [NEEDS IMPROVEMENT] Data quality needs improvement")
+            print("\n  [NEEDS IMPROVEMENT] Data quality needs improvement", file=self._out)
 
-        print("=" * 60)
+        print("=" * 60, file=self._out)
 
     def save_report(self, output_path: str = None):
         """保存报告到文件"""
-        import json
-
         if not output_path:
             output_path = f"output/dq_arxiv_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(self.results, f, indent=2, ensure_ascii=False)
 
         print(f"\nReport saved: {output_path}")
 
 
 def main():
     """主函数"""
-    checker = ArxivDataQualityChecker()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="arXiv 数据质量检查")
+    parser.add_argument(
+        "--exact",
+        action="store_true",
+        help="大表也全表统计标题重复率（默认超过阈值时抽样估计）",
+    )
+    args = parser.parse_args()
+
+    checker = ArxivDataQualityChecker(exact=args.exact)
     results = checker.run_all_checks()
 
     # 保存报告
@@ -10,7 +10,9 @@ Data Quality (DQ) Report
 - 新架构: papers(paper_id, canonical_title, venue_id, ...)
 """
 
+import io
 import sys
+import contextlib
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -37,6 +39,18 @@ def detect_schema_version(cursor):
 
 def run_dq_report(db_path: Path = None):
     """运行 DQ 报告"""
+    # 报告输出先写入缓冲区，结束后一次性写到 stdout
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            return _run_dq_report(db_path)
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
+def _run_dq_report(db_path: Path = None):
+    """执行各项 DQ 统计并打印报告"""
     import sqlite3
     
     db_path = db_path or DATABASE_PATH
@@ -79,9 +93,20 @@ def run_dq_report(db_path: Path = None):
     print("-" * 70)
     
     raw_total = 0
+    raw_missing = 0
     if has_raw_layer:
-        cursor.execute("SELECT COUNT(*) as count FROM raw_papers")
-        raw_total = cursor.fetchone()["count"]
+        # 总量、近 7 天增量、摘要缺失数一次扫描完成
+        seven_days_ago = (datetime.now() - timedelta(days=7)).isoformat()
+        cursor.execute("""
+            SELECT
+                COUNT(*) as count,
+                SUM(CASE WHEN retrieved_at >= ? THEN 1 ELSE 0 END) as recent,
+                SUM(CASE WHEN abstract IS NULL OR abstract = '' THEN 1 ELSE 0 END) as no_abstract
+            FROM raw_papers
+        """, (seven_days_ago,))
+        row = cursor.fetchone()
+        raw_total = row["count"]
+        raw_missing = row["no_abstract"] or 0
         print(f"   总量: {raw_total:,}")
         
         if raw_total == 0:
@@ -89,12 +114,7 @@ def run_dq_report(db_path: Path = None):
             issues.append("Raw Layer is empty")
         else:
             # 近 7 天增量
-            seven_days_ago = (datetime.now() - timedelta(days=7)).isoformat()
-            cursor.execute(
-                "SELECT COUNT(*) as count FROM raw_papers WHERE retrieved_at >= ?",
-                (seven_days_ago,)
-            )
-            recent_count = cursor.fetchone()["count"]
+            recent_count = row["recent"] or 0
             print(f"   近 7 天增量: {recent_count:,} ({recent_count/raw_total*100:.1f}%)")
             
             # 按 source 占比
@@ -140,11 +160,6 @@ def run_dq_report(db_path: Path = None):
     print("-" * 70)
     
     if raw_total > 0:
-        cursor.execute("""
-            SELECT COUNT(*) as count FROM raw_papers 
-            WHERE abstract IS NULL OR abstract = ''
-        """)
-        raw_missing = cursor.fetchone()["count"]
         raw_missing_pct = raw_missing / raw_total * 100
         print(f"   Raw Layer 摘要缺失: {raw_missing:,} ({raw_missing_pct:.1f}%)")
         
@@ -170,8 +185,34 @@ def run_dq_report(db_path: Path = None):
     print("🏛️ 4. Venue 识别率")
     print("-" * 70)
     
+    # 第 4、6 节的 venue 分布共用同一条 SQL（since 为 NULL 时不按时间过滤），
+    # 只按架构选择一次，SQLite 语句缓存中只编译一次
+    use_venue_table = schema_version == "new" and has_venues
+    if use_venue_table:
+        venue_dist_sql = """
+            SELECT v.canonical_name as name, COUNT(*) as count,
+                   SUM(COUNT(*)) OVER () as grand_total
+            FROM papers p
+            LEFT JOIN venues v ON p.venue_id = v.venue_id
+            WHERE :since IS NULL OR p.created_at >= :since
+            GROUP BY p.venue_id
+            ORDER BY count DESC
+            LIMIT 10
+        """
+    else:
+        # 旧架构：直接使用 venue 字段
+        venue_dist_sql = """
+            SELECT venue as name, COUNT(*) as count,
+                   SUM(COUNT(*)) OVER () as grand_total
+            FROM papers
+            WHERE :since IS NULL OR created_at >= :since
+            GROUP BY venue
+            ORDER BY count DESC
+            LIMIT 10
+        """
+    
     if papers_total > 0:
-        if schema_version == "new" and has_venues:
+        if use_venue_table:
             cursor.execute("""
                 SELECT COUNT(*) as count FROM papers 
                 WHERE venue_id IS NULL
@@ -179,31 +220,14 @@ def run_dq_report(db_path: Path = None):
             no_venue = cursor.fetchone()["count"]
             no_venue_pct = no_venue / papers_total * 100
             print(f"   未识别 venue_id: {no_venue:,} ({no_venue_pct:.1f}%)")
-            
-            cursor.execute("""
-                SELECT v.canonical_name, COUNT(*) as count 
-                FROM papers p
-                LEFT JOIN venues v ON p.venue_id = v.venue_id
-                GROUP BY p.venue_id
-                ORDER BY count DESC
-                LIMIT 10
-            """)
             print("   Top 10 Venue 分布:")
-            for row in cursor.fetchall():
-                name = row["canonical_name"] or "(UNKNOWN)"
-                print(f"      - {name}: {row['count']:,}")
         else:
-            # 旧架构：直接使用 venue 字段
-            cursor.execute("""
-                SELECT venue, COUNT(*) as count 
-                FROM papers 
-                GROUP BY venue 
-                ORDER BY count DESC
-                LIMIT 10
-            """)
             print("   Top 10 Venue 分布 (旧架构):")
-            for row in cursor.fetchall():
-                print(f"      - {row['venue']}: {row['count']:,}")
+        
+        cursor.execute(venue_dist_sql, {"since": None})
+        for row in cursor.fetchall():
+            name = row["name"] or "(UNKNOWN)"
+            print(f"      - {name}: {row['count']:,}")
     
     # ========================================
     # 5. 去重合并率
@@ -222,12 +246,14 @@ def run_dq_report(db_path: Path = None):
             print(f"   平均每篇论文对应 raw 记录数: {avg_sources:.2f}")
             
             cursor.execute("""
-                SELECT paper_id, COUNT(*) as source_count 
-                FROM paper_sources 
-                GROUP BY paper_id 
-                HAVING source_count > 1
+                SELECT COUNT(*) as count FROM (
+                    SELECT paper_id
+                    FROM paper_sources
+                    GROUP BY paper_id
+                    HAVING COUNT(*) > 1
+                )
             """)
-            multi_source = len(cursor.fetchall())
+            multi_source = cursor.fetchone()["count"]
             print(f"   多源合并的论文数: {multi_source:,}")
     else:
         print("   ⚠️ paper_sources 表不存在（使用旧架构）")
@@ -241,34 +267,16 @@ def run_dq_report(db_path: Path = None):
     
     thirty_days_ago = (datetime.now() - timedelta(days=30)).isoformat()
     
-    if schema_version == "new" and has_venues:
-        cursor.execute("""
-            SELECT v.canonical_name, COUNT(*) as count 
-            FROM papers p
-            LEFT JOIN venues v ON p.venue_id = v.venue_id
-            WHERE p.created_at >= ?
-            GROUP BY p.venue_id
-            ORDER BY count DESC
-        """, (thirty_days_ago,))
-    else:
-        cursor.execute("""
-            SELECT venue, COUNT(*) as count 
-            FROM papers
-            WHERE created_at >= ?
-            GROUP BY venue
-            ORDER BY count DESC
-        """, (thirty_days_ago,))
+    # 只取 Top 10，总量由窗口函数在 LIMIT 之前对全部分组求和
+    cursor.execute(venue_dist_sql, {"since": thirty_days_ago})
     
     recent_venue_dist = cursor.fetchall()
     if recent_venue_dist:
-        total_recent = sum(r["count"] for r in recent_venue_dist)
+        total_recent = recent_venue_dist[0]["grand_total"]
         print(f"   近 30 天新增总量: {total_recent:,}")
         print("   分布:")
-        for row in recent_venue_dist[:10]:
-            if schema_version == "new" and has_venues:
-                name = row["canonical_name"] or "(UNKNOWN)"
-            else:
-                name = row["venue"] or "(UNKNOWN)"
+        for row in recent_venue_dist:
+            name = row["name"] or "(UNKNOWN)"
             pct = row["count"] / total_recent * 100
             print(f"      - {name}: {row['count']:,} ({pct:.1f}%)")
         
@@ -16,6 +16,26 @@ if str(_src_dir) not in sys.path:
 
 from config import DATABASE_PATH
 
+# Venue 精确率抽样的查询主体；judge 列在 SQL 中完成自动判定：
+# OpenReview 来源直接信任 > venue_raw 包含 venue 名称 > comments 包含 venue 名称 > S2 有 venue_raw
+SAMPLE_SELECT = """
+    SELECT p.paper_id, p.canonical_title, v.canonical_name as venue,
+           r.source, r.venue_raw, r.comments, r.categories,
+           CASE
+               WHEN r.source = 'openreview' THEN 'openreview'
+               WHEN INSTR(UPPER(IFNULL(r.venue_raw, '')), UPPER(v.canonical_name)) > 0 THEN 'venue_raw'
+               WHEN INSTR(UPPER(IFNULL(r.comments, '')), UPPER(v.canonical_name)) > 0 THEN 'comments'
+               WHEN r.source = 's2' AND IFNULL(r.venue_raw, '') != '' THEN 's2'
+           END as judge
+    FROM paper_sources ps
+    JOIN papers p ON ps.paper_id = p.paper_id
+    JOIN venues v ON p.venue_id = v.venue_id
+    JOIN raw_papers r ON ps.raw_id = r.raw_id
+"""
+
+# 随机 id 的超额抽取倍数
+SAMPLE_OVERDRAW = 4
+
 
 def validate_venue_precision(conn, sample_size=10):
     """验证 Venue 识别精确率"""
@@ -26,18 +46,30 @@ def validate_venue_precision(conn, sample_size=10):
     cursor = conn.cursor()
     
     # 抽取已识别 venue 的论文（只看新采集的，有 paper_sources 关联）
-    cursor.execute("""
-        SELECT p.paper_id, p.canonical_title, v.canonical_name as venue,
-               r.source, r.venue_raw, r.comments, r.categories
-        FROM papers p
-        JOIN venues v ON p.venue_id = v.venue_id
-        JOIN paper_sources ps ON p.paper_id = ps.paper_id
-        JOIN raw_papers r ON ps.raw_id = r.raw_id
+    # 先在 paper_sources 的主键范围内随机取 id（超额抽取以抵消空洞和未识别 venue 的行），
+    # 再只对这些 id 做 JOIN，随机排序只作用于少量候选行，而非整个 JOIN 结果
+    cursor.execute(f"""
+        WITH RECURSIVE picks(n, id) AS (
+            SELECT 0, NULL
+            UNION ALL
+            SELECT n + 1, abs(random()) % (SELECT MAX(id) FROM paper_sources) + 1
+            FROM picks WHERE n < ?
+        )
+        {SAMPLE_SELECT}
+        WHERE ps.id IN (SELECT id FROM picks WHERE id IS NOT NULL)
         ORDER BY RANDOM()
         LIMIT ?
-    """, (sample_size,))
-    
+    """, (sample_size * SAMPLE_OVERDRAW, sample_size))
     samples = cursor.fetchall()
+    
+    # 随机 id 命中不足（数据稀疏）时退回全量随机排序
+    if len(samples) < sample_size:
+        cursor.execute(f"""
+            {SAMPLE_SELECT}
+            ORDER BY RANDOM()
+            LIMIT ?
+        """, (sample_size,))
+        samples = cursor.fetchall()
     print(f"\n抽样 {len(samples)} 篇已识别 venue 的论文:\n")
     
     correct = 0
@@ -55,25 +87,18 @@ def validate_venue_precision(conn, sample_size=10):
         if comments:
             print(f"   comments: {comments[:70]}")
         
-        # 自动验证
-        is_correct = False
+        # 自动验证（判定规则见 SAMPLE_SELECT 的 judge 列）
+        judge = row[7]
+        is_correct = judge is not None
         reason = ""
         
-        # OpenReview 来源直接信任
-        if source == "openreview":
-            is_correct = True
+        if judge == "openreview":
             reason = "OpenReview 来源"
-        # venue_raw 包含 venue 名称
-        elif venue.upper() in venue_raw.upper():
-            is_correct = True
+        elif judge == "venue_raw":
             reason = f"venue_raw 包含 '{venue}'"
-        # comments 包含 venue 名称
-        elif venue.upper() in comments.upper():
-            is_correct = True
+        elif judge == "comments":
             reason = f"comments 包含 '{venue}'"
-        # S2 来源，venue_raw 匹配
-        elif source == "s2" and venue_raw:
-            is_correct = True
+        elif judge == "s2":
             reason = f"S2 venue_raw = '{venue_raw}'"
         
         status = "✅" if is_correct else "❓"
@@ -104,19 +129,14 @@ def analyze_dedup_fusion(conn):
     
     cursor = conn.cursor()
     
-    # 新架构的 papers 数量（有 paper_sources 关联的）
+    # 基础统计一次取回：有 paper_sources 关联的 papers 数、关联总数、raw_papers 总数
+    # （两个 paper_sources 计数在同一次扫描中完成）
     cursor.execute("""
-        SELECT COUNT(DISTINCT paper_id) FROM paper_sources
+        SELECT COUNT(DISTINCT paper_id), COUNT(*),
+               (SELECT COUNT(*) FROM raw_papers)
+        FROM paper_sources
     """)
-    papers_with_sources = cursor.fetchone()[0]
-    
-    # paper_sources 总数
-    cursor.execute("SELECT COUNT(*) FROM paper_sources")
-    total_links = cursor.fetchone()[0]
-    
-    # raw_papers 总数
-    cursor.execute("SELECT COUNT(*) FROM raw_papers")
-    raw_total = cursor.fetchone()[0]
+    papers_with_sources, total_links, raw_total = cursor.fetchone()
     
     print(f"\n基础统计:")
     print(f"   raw_papers 总数: {raw_total}")
@@ -127,32 +147,42 @@ def analyze_dedup_fusion(conn):
         avg_sources = total_links / papers_with_sources
         print(f"   平均每篇 paper 关联 raw 数: {avg_sources:.2f}")
     
-    # 多源融合统计
+    # 多源融合统计：一条语句同时得到多源论文总数（窗口函数）和前 5 篇的来源详情，
+    # 只对这 5 篇回查 raw_papers 标题
+    # 详情用控制字符 char(31)/char(30) 拼接来源与标题，避免与标题中的分隔符冲突
     cursor.execute("""
-        SELECT paper_id, COUNT(*) as source_count
-        FROM paper_sources
-        GROUP BY paper_id
-        HAVING source_count > 1
+        WITH multi AS (
+            SELECT paper_id, COUNT(*) as source_count,
+                   COUNT(*) OVER () as multi_total
+            FROM paper_sources
+            GROUP BY paper_id
+            HAVING source_count > 1
+            ORDER BY paper_id
+            LIMIT 5
+        )
+        SELECT m.paper_id, m.source_count,
+               GROUP_CONCAT(ps.source || char(31) || substr(r.title, 1, 50), char(30)) as details,
+               m.multi_total
+        FROM multi m
+        JOIN paper_sources ps ON ps.paper_id = m.paper_id
+        LEFT JOIN raw_papers r ON ps.raw_id = r.raw_id
+        GROUP BY m.paper_id
+        ORDER BY m.paper_id
     """)
     multi_source_papers = cursor.fetchall()
+    multi_total = multi_source_papers[0][3] if multi_source_papers else 0
     
     print(f"\n多源融合统计:")
-    print(f"   多源合并的论文数: {len(multi_source_papers)}")
+    print(f"   多源合并的论文数: {multi_total}")
     
     if multi_source_papers:
         print(f"\n   多源论文详情:")
-        for row in multi_source_papers[:5]:
+        for row in multi_source_papers:
             paper_id, count = row[0], row[1]
-            cursor.execute("""
-                SELECT ps.source, r.title
-                FROM paper_sources ps
-                JOIN raw_papers r ON ps.raw_id = r.raw_id
-                WHERE ps.paper_id = ?
-            """, (paper_id,))
-            sources = cursor.fetchall()
             print(f"   Paper {paper_id}: {count} 个来源")
-            for s in sources:
-                print(f"      - {s[0]}: {s[1][:50]}...")
+            for item in row[2].split("\x1e") if row[2] else []:
+                source, title = item.split("\x1f", 1)
+                print(f"      - {source}: {title}...")
     else:
         print("\n⚠️ 当前没有多源融合的论文")
         print("   原因分析：")
@@ -173,12 +203,17 @@ def analyze_dedup_fusion(conn):
     for row in cursor.fetchall():
         print(f"   - {row[0]}: {row[1]}")
     
-    return len(multi_source_papers)
+    return multi_total
 
 
 def main():
     conn = sqlite3.connect(DATABASE_PATH)
     conn.row_factory = sqlite3.Row
+    # 只读分析连接：禁止写入，排序临时数据放内存，加大页缓存并启用 mmap 读取
+    conn.execute("PRAGMA query_only = ON")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -64000")
+    conn.execute("PRAGMA mmap_size = 268435456")
     
     precision = validate_venue_precision(conn)
     multi_source = analyze_dedup_fusion(conn)
@@ -4,6 +4,7 @@ This module is kept for backward compatibility. The canonical export path is
 `src/tools/export_static_site.py`.
 """
 
+import os
 import json
 import logging
 from pathlib import Path
@@ -38,7 +39,12 @@ class VenueExporter:
         result = self._exporter.export_all_venues()
         total_size = 0
         if self.output_dir.exists():
-            total_size = sum(f.stat().st_size for f in self.output_dir.glob("*.json"))
+            with os.scandir(self.output_dir) as entries:
+                total_size = sum(
+                    entry.stat().st_size
+                    for entry in entries
+                    if entry.name.endswith(".json") and entry.is_file()
+                )
 
         return {
             "venues_count": result.get("venues_count", 0),
@@ -1,12 +1,23 @@
 """关键词提取模块"""
 
-from .yake_extractor import YakeExtractor
-from .keybert_extractor import KeyBertExtractor
-from .processor import KeywordProcessor, extract_keywords_batch
+from lazy_import import lazy_exports
+
+# 按需导入：KeyBERT 会连带加载 torch / sentence-transformers，
+# 只在首次访问对应属性时才导入子模块（PEP 562）
+_LAZY_ATTRS = {
+    "YakeExtractor": ".yake_extractor",
+    "KeyBertExtractor": ".keybert_extractor",
+    "TfidfExtractor": ".tfidf_extractor",
+    "KeywordProcessor": ".processor",
+    "extract_keywords_batch": ".processor",
+}
 
 __all__ = [
     "YakeExtractor",
     "KeyBertExtractor", 
+    "TfidfExtractor",
     "KeywordProcessor",
     "extract_keywords_batch",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS)
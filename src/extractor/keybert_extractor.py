@@ -22,6 +22,7 @@ class KeyBertExtractor:
         model_name: str = None,
         top_n: int = None,
         keyphrase_ngram_range: tuple = None,
+        half_precision: bool = None,
     ):
         """
         初始化 KeyBERT 提取器
@@ -30,25 +31,110 @@ class KeyBertExtractor:
             model_name: 模型名称（默认 "all-MiniLM-L6-v2"）
             top_n: 返回关键词数量（默认 20）
             keyphrase_ngram_range: n-gram 范围（默认 (1, 3)）
+            half_precision: GPU 可用时以 FP16 运行编码器（默认 True）
         """
         self.model_name = model_name or EXTRACTOR_CONFIG.keybert_model
         self.top_n = top_n or EXTRACTOR_CONFIG.keybert_top_n
         self.keyphrase_ngram_range = (
             keyphrase_ngram_range or EXTRACTOR_CONFIG.keybert_keyphrase_ngram_range
         )
+        self.half_precision = (
+            EXTRACTOR_CONFIG.keybert_half_precision if half_precision is None else half_precision
+        )
         
         # 延迟加载模型
         self._keybert = None
+        
+        # build_vocab 预先构建的候选词表及其 embedding
+        self._candidates: Optional[List[str]] = None
+        self._word_embeddings = None
     
     @property
     def keybert(self) -> KeyBERT:
         """延迟加载 KeyBERT 模型"""
         if self._keybert is None:
             print(f"⏳ 加载 KeyBERT 模型: {self.model_name}...")
-            self._keybert = KeyBERT(self.model_name)
+            self._keybert = KeyBERT(model=self._load_embedding_model())
             print("✅ KeyBERT 模型加载完成")
         return self._keybert
     
+    def _load_embedding_model(self):
+        """加载 sentence-transformer 编码器；GPU 上转为 FP16，CPU 保持 FP32"""
+        from sentence_transformers import SentenceTransformer
+        
+        model = SentenceTransformer(self.model_name)
+        if self.half_precision:
+            import torch
+            
+            if torch.cuda.is_available():
+                model = model.half()
+        return model
+    
+    @staticmethod
+    def _inference_mode():
+        """编码器推理上下文：inference_mode 比 no_grad 少做版本计数与视图跟踪"""
+        import torch
+        
+        return torch.inference_mode()
+    
+    def build_vocab(self, corpus: List[str], max_features: int = None) -> int:
+        """
+        在语料上预先构建候选词表并一次性编码
+        
+        之后的提取只在该词表中选择候选词，复用候选词 embedding，
+        不再对每批文档重新编码候选词。
+        
+        Args:
+            corpus: 用于构建词表的文本列表
+            max_features: 词表最大长度（按语料词频截断，默认取配置）；
+                限制候选词 embedding 的内存与编码时间
+            
+        Returns:
+            词表大小
+        """
+        from sklearn.feature_extraction.text import CountVectorizer
+        
+        docs = [text for text in corpus if text and text.strip()]
+        if not docs:
+            return 0
+        
+        vocab = CountVectorizer(
+            ngram_range=self.keyphrase_ngram_range,
+            stop_words="english",
+            max_features=max_features or EXTRACTOR_CONFIG.keybert_vocab_max_features,
+        ).fit(docs).get_feature_names_out().tolist()
+        
+        with self._inference_mode():
+            self._word_embeddings = self.keybert.model.embed(vocab)
+        # KeyBERT 以 candidates 作为固定词表，候选词顺序与 word_embeddings 一致
+        self._candidates = vocab
+        return len(vocab)
+    
+    @property
+    def has_vocab(self) -> bool:
+        """是否已通过 build_vocab 构建候选词表"""
+        return self._candidates is not None
+    
+    def clear_vocab(self):
+        """清除 build_vocab 构建的候选词表，恢复按文档拟合候选词"""
+        self._candidates = None
+        self._word_embeddings = None
+    
+    def _extract_options(self) -> dict:
+        """extract_keywords 的公共参数"""
+        options = {
+            "keyphrase_ngram_range": self.keyphrase_ngram_range,
+            "stop_words": "english",
+            "top_n": self.top_n,
+            # MMR 多样化：贪心选择，代价随候选数线性增长（Max Sum 需枚举组合）
+            "use_mmr": True,
+            "diversity": EXTRACTOR_CONFIG.keybert_diversity,
+        }
+        if self._candidates is not None:
+            options["candidates"] = self._candidates
+            options["word_embeddings"] = self._word_embeddings
+        return options
+    
     def extract(self, text: str) -> List[Tuple[str, float]]:
         """
         从文本中提取关键词
@@ -63,19 +149,77 @@ class KeyBertExtractor:
             return []
         
         try:
-            keywords = self.keybert.extract_keywords(
-                text,
-                keyphrase_ngram_range=self.keyphrase_ngram_range,
-                stop_words="english",
-                top_n=self.top_n,
-                use_maxsum=True,  # 使用 Max Sum 多样化
-                nr_candidates=20,
-            )
+            with self._inference_mode():
+                keywords = self.keybert.extract_keywords(
+                    text,
+                    **self._extract_options(),
+                )
             return keywords
         except Exception as e:
             print(f"KeyBERT 提取失败: {e}")
             return []
     
+    def extract_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        批量提取关键词，多篇文档合并为一次编码
+        
+        Args:
+            texts: 输入文本列表
+            batch_size: 每批送入模型的文档数
+            
+        Returns:
+            与 texts 一一对应的关键词列表；空文本或失败的批次返回空列表
+        """
+        results: List[List[Tuple[str, float]]] = [[] for _ in texts]
+        docs = [(i, text) for i, text in enumerate(texts) if text and text.strip()]
+        if not docs:
+            return results
+        
+        # 所有文档一次性送入编码器（GPU 上 FP16），各批次直接复用文档 embedding
+        try:
+            with self._inference_mode():
+                doc_embeddings = self._embed_documents(
+                    [text for _, text in docs], batch_size=batch_size
+                )
+        except Exception as e:
+            print(f"KeyBERT 文档编码失败: {e}")
+            return results
+        
+        for start in range(0, len(docs), batch_size):
+            chunk = docs[start:start + batch_size]
+            try:
+                with self._inference_mode():
+                    keywords = self.keybert.extract_keywords(
+                        [text for _, text in chunk],
+                        doc_embeddings=doc_embeddings[start:start + batch_size],
+                        **self._extract_options(),
+                    )
+            except Exception as e:
+                print(f"KeyBERT 批量提取失败: {e}")
+                continue
+            
+            # KeyBERT 只传入一篇文档时返回扁平列表
+            if len(chunk) == 1:
+                keywords = [keywords]
+            for (i, _), kws in zip(chunk, keywords):
+                results[i] = kws
+        
+        return results
+    
+    def _embed_documents(self, docs: List[str], batch_size: int):
+        """用底层 sentence-transformer 按 batch_size 编码文档，返回 numpy 数组"""
+        embedding_model = self.keybert.model.embedding_model
+        return embedding_model.encode(
+            docs,
+            batch_size=batch_size,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+        )
+    
     def extract_keywords(self, text: str) -> List[str]:
         """
         从文本中提取关键词（仅返回关键词，不含分数）
@@ -11,10 +11,22 @@
 """
 
 import re
+from collections import Counter
+from functools import lru_cache
 from typing import List, Tuple, Optional, Set, Dict
 from difflib import SequenceMatcher
 
 
+# 规范化用的字符表：- _ / 统一为空格，首尾需去掉的标点
+_PUNCT_TO_SPACE = str.maketrans({'-': ' ', '_': ' ', '/': ' '})
+_TRAILING_PUNCT = ',;:.!?\'")]'
+_LEADING_PUNCT = '([\'"'
+
+# 噪声模式用到的正则，模块加载时编译一次
+_PURE_NUMBER_RE = re.compile(r'^[\d\s.,-]+$')
+_DIGIT_RE = re.compile(r'\d')
+
+
 # ============================================================
 # 2.2.A 低信息词（banned / generic words）
 # ============================================================
@@ -86,6 +98,9 @@ DOMAIN_NOISE_WORDS = {
     "application", "applications",
 }
 
+# 以上三类词合并为一个集合，过滤时只需一次查找
+FILTERED_WORDS = frozenset(BANNED_WORDS | ENGLISH_STOPWORDS | DOMAIN_NOISE_WORDS)
+
 # ============================================================
 # 2.4 同义归并词典
 # ============================================================
@@ -163,8 +178,15 @@ class KeywordFilter:
         self.min_length = min_length
         self.max_length = max_length
         
-        # 合并所有需要过滤的词
-        self._all_filtered = self.banned_words | self.stopwords | self.domain_noise
+        # 合并所有需要过滤的词（默认词表直接复用模块级 FILTERED_WORDS）
+        if banned_words or stopwords or domain_noise:
+            self._all_filtered = frozenset(self.banned_words | self.stopwords | self.domain_noise)
+        else:
+            self._all_filtered = FILTERED_WORDS
+        
+        # process() 用的合并查找表：过滤词 -> None，同义词 -> 规范形式，
+        # 不在表中的关键词保持原样；同时是过滤词和同义词时以过滤为准
+        self._keyword_lookup = {**self.synonym_map, **dict.fromkeys(self._all_filtered)}
     
     # ========== 2.1 规范化层 ==========
     
@@ -179,20 +201,7 @@ class KeywordFilter:
         """
         if not keyword:
             return None
-        
-        kw = keyword.lower().strip()
-        
-        # 标点统一
-        kw = re.sub(r'[-_/]', ' ', kw)
-        
-        # 去掉尾部标点
-        kw = re.sub(r'[,;:.!?\'")\]]+$', '', kw)
-        kw = re.sub(r'^[(\[\'\"]+', '', kw)
-        
-        # 空白折叠
-        kw = re.sub(r'\s+', ' ', kw).strip()
-        
-        return kw if kw else None
+        return _normalize(keyword)
     
     # ========== 2.2 过滤层 ==========
     
@@ -201,15 +210,8 @@ class KeywordFilter:
         return keyword in self.banned_words
     
     def is_stopword(self, keyword: str) -> bool:
-        """检查是否是停用词"""
-        # 检查整体
-        if keyword in self.stopwords:
-            return True
-        # 检查单词组成
-        words = keyword.split()
-        if len(words) == 1:
-            return keyword in self.stopwords
-        return False
+        """检查是否是停用词（整体匹配）"""
+        return keyword in self.stopwords
     
     def is_domain_noise(self, keyword: str) -> bool:
         """检查是否是领域噪声词"""
@@ -225,36 +227,39 @@ class KeywordFilter:
         - 过短/过长
         """
         # 长度检查
-        if len(keyword) < self.min_length or len(keyword) > self.max_length:
+        n = len(keyword)
+        if n < self.min_length or n > self.max_length:
             return True
         
-        # 纯数字
-        if re.match(r'^[\d\s.,-]+$', keyword):
+        # 单个字符（min_length < 3 时才会走到这里）
+        if n < 3 and len(keyword.split()) == 1:
             return True
         
-        # 数字占比过高（>50%）
-        digits = sum(1 for c in keyword if c.isdigit())
-        if digits > len(keyword) * 0.5:
-            return True
-        
-        # URL/email 模式
-        if re.search(r'(http|www|\.com|\.org|@)', keyword):
-            return True
-        
-        # 单个字符
-        if len(keyword.split()) == 1 and len(keyword) < 3:
-            return True
+        # 只含字母和空格的关键词（绝大多数）不可能命中数字相关规则，
+        # 用一次 C 层的 isalpha() 跳过两次正则扫描
+        if not keyword.replace(' ', '').isalpha():
+            # 纯数字
+            if _PURE_NUMBER_RE.match(keyword):
+                return True
+            
+            # 数字占比过高（>50%）
+            digits = len(_DIGIT_RE.findall(keyword))
+            if digits > n * 0.5:
+                return True
         
-        return False
+        # URL/email 模式：固定子串用 in 判断，不启动正则引擎
+        return (
+            '@' in keyword
+            or 'http' in keyword
+            or 'www' in keyword
+            or '.com' in keyword
+            or '.org' in keyword
+        )
     
     def should_filter(self, keyword: str) -> bool:
         """综合判断是否应该过滤"""
-        return (
-            self.is_banned(keyword) or
-            self.is_stopword(keyword) or
-            self.is_domain_noise(keyword) or
-            self.is_noise_pattern(keyword)
-        )
+        # banned / stopword / 领域噪声合并为一次集合查找
+        return keyword in self._all_filtered or self.is_noise_pattern(keyword)
     
     # ========== 2.3 去重与合并 ==========
     
@@ -264,14 +269,16 @@ class KeywordFilter:
     ) -> List[Tuple[str, float]]:
         """严格去重：完全相同的只留最高分"""
         seen = {}
+        get = seen.get
         for kw, score in keywords:
-            if kw not in seen or score > seen[kw]:
+            prev = get(kw)
+            if prev is None or score > prev:
                 seen[kw] = score
-        return [(kw, score) for kw, score in seen.items()]
+        return list(seen.items())
     
     def similarity(self, a: str, b: str) -> float:
-        """计算两个字符串的相似度"""
-        return SequenceMatcher(None, a, b).ratio()
+        """计算两个字符串的相似度（0~1）"""
+        return _similarity_ratio(a, b)
     
     def deduplicate_fuzzy(
         self,
@@ -289,28 +296,75 @@ class KeywordFilter:
         # 按分数降序排序
         sorted_kws = sorted(keywords, key=lambda x: x[1], reverse=True)
         result = []
+        kept = set()
+        kept_stripped = set()  # 已保留关键词去掉尾部 s 后的形式
+        buckets: Dict[int, List[str]] = {}  # 长度 -> 已保留关键词
         
         for kw, score in sorted_kws:
+            # 特殊处理单复数：尾部 s 的差异，两次集合查找代替逐个比较
+            if kw.rstrip('s') in kept or kw in kept_stripped:
+                continue
             # 检查是否与已有关键词相似
-            is_similar = False
-            for existing_kw, _ in result:
-                if self.similarity(kw, existing_kw) >= threshold:
-                    is_similar = True
-                    break
-                # 特殊处理单复数：最后一个字符差异
-                if kw.rstrip('s') == existing_kw or existing_kw.rstrip('s') == kw:
-                    is_similar = True
-                    break
+            if self._has_similar(kw, buckets, threshold):
+                continue
             
-            if not is_similar:
-                result.append((kw, score))
+            result.append((kw, score))
+            kept.add(kw)
+            kept_stripped.add(kw.rstrip('s'))
+            buckets.setdefault(len(kw), []).append(kw)
         
         return result
     
+    def _has_similar(
+        self,
+        keyword: str,
+        buckets: Dict[int, List[str]],
+        threshold: float,
+    ) -> bool:
+        """
+        判断 keyword 是否与某个已保留关键词相似度 >= threshold
+        
+        相似度为 2*M/(la+lb)，不超过 2*min(la,lb)/(la+lb)，
+        因此只需比较长度落在 [la*t/(2-t), la*(2-t)/t] 内的关键词。
+        """
+        if threshold > 1:
+            return False
+        
+        n = len(keyword)
+        if threshold > 0:
+            low = int(n * threshold / (2 - threshold))
+            high = int(n * (2 - threshold) / threshold) + 1
+        else:
+            low, high = 0, float("inf")
+        
+        candidates = [
+            existing
+            for length, group in buckets.items()
+            if low <= length <= high
+            for existing in group
+        ]
+        # 匹配字符数不超过两者字符多重集的交集，2*|A∩B|/(la+lb) 是 ratio 的上界，
+        # 上界已低于阈值的候选无需运行 SequenceMatcher
+        counts = _char_counts(keyword)
+        for existing in candidates:
+            common = sum((counts & _char_counts(existing)).values())
+            if 2 * common / (n + len(existing)) < threshold:
+                continue
+            if self.similarity(keyword, existing) >= threshold:
+                return True
+        return False
+    
     # ========== 2.4 同义归并 ==========
     
     def apply_synonym(self, keyword: str) -> str:
-        """应用同义归并"""
+        """
+        应用同义归并
+        
+        只做整词匹配：词典里有 "contrastive" -> "contrastive learning"、
+        "self supervised" -> "self supervised learning" 这类扩写条目，
+        若在多词关键词内部做子串替换会得到 "contrastive learning loss"、
+        "self supervised learning learning" 等错误结果。
+        """
         return self.synonym_map.get(keyword, keyword)
     
     # ========== 完整处理流程 ==========
@@ -331,19 +385,22 @@ class KeywordFilter:
         """
         result = []
         
+        # 1~3 步在同一个循环内完成：normalize / should_filter / apply_synonym 展开，
+        # 热路径上用到的属性与方法提前绑定为局部变量
+        lookup = self._keyword_lookup.get
+        is_noise_pattern = self.is_noise_pattern
+        
         for kw, score in keywords:
             # 1. 规范化
-            normalized = self.normalize(kw)
+            normalized = _normalize(kw) if kw else None
             if not normalized:
                 continue
             
-            # 2. 过滤
-            if self.should_filter(normalized):
+            # 2. 过滤 + 3. 同义归并：一次查表
+            canonical = lookup(normalized, normalized)
+            if canonical is None or is_noise_pattern(normalized):
                 continue
             
-            # 3. 同义归并
-            canonical = self.apply_synonym(normalized)
-            
             result.append((canonical, score))
         
         # 4. 严格去重
@@ -356,6 +413,41 @@ class KeywordFilter:
         return result
 
 
+@lru_cache(maxsize=65536)
+def _normalize(keyword: str) -> Optional[str]:
+    """
+    带缓存的规范化，跨论文重复出现的原始关键词只计算一次
+    
+    规则与 KeywordFilter 实例无关，所有实例共享；需要时可用 _normalize.cache_clear() 重置
+    """
+    # 标点统一（一次 translate 完成）
+    kw = keyword.lower().strip().translate(_PUNCT_TO_SPACE)
+    
+    # 去掉尾部标点
+    kw = kw.rstrip(_TRAILING_PUNCT).lstrip(_LEADING_PUNCT)
+    
+    # 空白折叠
+    kw = ' '.join(kw.split())
+    
+    return kw if kw else None
+
+
+@lru_cache(maxsize=4096)
+def _char_counts(keyword: str) -> Counter:
+    """关键词的字符计数，用于相似度上界预筛"""
+    return Counter(keyword)
+
+
+@lru_cache(maxsize=4096)
+def _similarity_ratio(a: str, b: str) -> float:
+    """
+    带缓存的相似度计算，所有过滤器实例共享，跨论文重复出现的关键词对直接命中
+    
+    缓存键保留 (a, b) 的顺序：SequenceMatcher.ratio 不保证对称
+    """
+    return SequenceMatcher(None, a, b).ratio()
+
+
 # 全局过滤器实例
 _default_filter = None
 
@@ -4,16 +4,18 @@
 批量处理论文，提取关键词并进行标准化。
 """
 
-from typing import List, Literal, Optional, Union
+from typing import Dict, List, Literal, Optional, Union
 from tqdm import tqdm
 
 from .yake_extractor import YakeExtractor, create_yake_extractor
+from .yake_pool import iter_yake_parallel
 from .keybert_extractor import KeyBertExtractor, get_keybert_extractor
+from .tfidf_extractor import TfidfExtractor, create_tfidf_extractor, is_tfidf_available
 from scraper.models import Paper
 from config import EXTRACTOR_CONFIG
 
 
-ExtractorType = Literal["yake", "keybert", "both"]
+ExtractorType = Literal["yake", "keybert", "both", "tfidf"]
 
 
 class KeywordProcessor:
@@ -24,17 +26,29 @@ class KeywordProcessor:
         extractor_type: ExtractorType = None,
         yake_extractor: Optional[YakeExtractor] = None,
         keybert_extractor: Optional[KeyBertExtractor] = None,
+        tfidf_extractor: Optional[TfidfExtractor] = None,
     ):
         """
         初始化处理器
         
         Args:
-            extractor_type: 提取器类型（"yake", "keybert", "both"）
+            extractor_type: 提取器类型（"yake", "keybert", "both", "tfidf"）
             yake_extractor: YAKE 提取器实例
             keybert_extractor: KeyBERT 提取器实例
+            tfidf_extractor: TF-IDF 提取器实例
         """
         self.extractor_type = extractor_type or EXTRACTOR_CONFIG.default_extractor
         
+        # TF-IDF 依赖 scikit-learn，不可用时回退到 YAKE
+        if self.extractor_type == "tfidf" and tfidf_extractor is None and not is_tfidf_available():
+            print("⚠️ 未安装 scikit-learn，TF-IDF 提取回退到 YAKE")
+            self.extractor_type = "yake"
+        
+        if self.extractor_type == "tfidf":
+            self.tfidf = tfidf_extractor or create_tfidf_extractor()
+        else:
+            self.tfidf = None
+        
         # 初始化提取器
         if self.extractor_type in ("yake", "both"):
             self.yake = yake_extractor or create_yake_extractor()
@@ -66,6 +80,9 @@ class KeywordProcessor:
             keybert_keywords = self.keybert.extract_keywords(text)
             keywords.update(keybert_keywords)
         
+        if self.tfidf:
+            keywords.update(self.tfidf.extract_keywords(text))
+        
         return list(keywords)
     
     def process_paper(self, paper: Paper) -> Paper:
@@ -91,6 +108,7 @@ class KeywordProcessor:
         self,
         papers: List[Paper],
         show_progress: bool = True,
+        jobs: int = 1,
     ) -> List[Paper]:
         """
         批量处理论文
@@ -98,23 +116,81 @@ class KeywordProcessor:
         Args:
             papers: 论文列表
             show_progress: 是否显示进度条
+            jobs: YAKE 并行进程数（1 为串行；KeyBERT 始终在主进程分批编码）
             
         Returns:
             处理后的论文列表
         """
         print(f"\n🔑 正在提取关键词（使用 {self.extractor_type}）...")
         
-        if show_progress:
-            papers = tqdm(papers, desc="提取关键词")
+        texts = [paper.text_for_extraction for paper in papers]
         
-        processed = []
-        for paper in papers:
-            processed.append(self.process_paper(paper))
+        # KeyBERT：全部文档分批合并编码，而不是每篇论文单独前向；
+        # 候选词表在整批上拟合、编码一次，各批次复用
+        if self.keybert:
+            build_vocab = not self.keybert.has_vocab
+            if build_vocab:
+                self.keybert.build_vocab(texts)
+            try:
+                keybert_results = [
+                    [kw for kw, _ in keywords]
+                    for keywords in self.keybert.extract_batch(texts, batch_size=64)
+                ]
+            finally:
+                # 提取器是共享单例，不把本批词表留给后续的单篇提取
+                if build_vocab:
+                    self.keybert.clear_vocab()
+        else:
+            keybert_results = [[] for _ in texts]
+        
+        # TF-IDF：整批拟合一次，按稀疏矩阵逐行取 top-k
+        if self.tfidf:
+            tfidf_results = [
+                [kw for kw, _ in keywords]
+                for keywords in self.tfidf.extract_batch(texts)
+            ]
+        else:
+            tfidf_results = [[] for _ in texts]
+        
+        # YAKE：CPU 密集，逐篇提取，可多进程并行
+        jobs = min(jobs, len(texts))
+        if self.yake is None:
+            yake_results = [[] for _ in texts]
+        elif jobs > 1:
+            yake_results = self._extract_yake_parallel(texts, jobs, show_progress)
+        else:
+            if show_progress:
+                texts = tqdm(texts, desc="提取关键词")
+            yake_results = [self.yake.extract_keywords(text) for text in texts]
+        
+        for paper, yake_keywords, keybert_keywords, tfidf_keywords in zip(
+            papers, yake_results, keybert_results, tfidf_results
+        ):
+            keywords = set(yake_keywords)
+            keywords.update(keybert_keywords)
+            keywords.update(tfidf_keywords)
+            paper.extracted_keywords = self._normalize_keywords(keywords)
         
-        total_keywords = sum(len(p.extracted_keywords) for p in processed)
+        total_keywords = sum(len(p.extracted_keywords) for p in papers)
         print(f"✅ 提取完成，共 {total_keywords} 个关键词")
         
-        return processed
+        return papers
+    
+    def _extract_yake_parallel(
+        self,
+        texts: List[str],
+        jobs: int,
+        show_progress: bool,
+    ) -> List[List[str]]:
+        """
+        多进程运行 YAKE，结果与 texts 顺序一致
+        
+        每个 worker 进程只初始化一次提取器。
+        """
+        results = iter_yake_parallel(self.yake, texts, jobs)
+        if show_progress:
+            results = tqdm(results, total=len(texts), desc="提取关键词")
+        return list(results)
     
     def _normalize_keywords(self, keywords: List[str]) -> List[str]:
         """
@@ -131,19 +207,16 @@ class KeywordProcessor:
         Returns:
             标准化后的关键词列表
         """
-        normalized = set()
-        for kw in keywords:
-            kw = kw.strip().lower()
-            # 过滤过短或过长的关键词
-            if 2 <= len(kw) <= 100:
-                normalized.add(kw)
-        return list(normalized)
+        # 先整体规范化去重，再按长度过滤（过短或过长的关键词）
+        normalized = {kw.strip().lower() for kw in keywords}
+        return [kw for kw in normalized if 2 <= len(kw) <= 100]
 
 
 def extract_keywords_batch(
     papers: List[Paper],
     extractor_type: ExtractorType = None,
     show_progress: bool = True,
+    jobs: int = 1,
 ) -> List[Paper]:
     """
     批量提取论文关键词的便捷函数
@@ -152,9 +225,10 @@ def extract_keywords_batch(
         papers: 论文列表
         extractor_type: 提取器类型
         show_progress: 是否显示进度条
+        jobs: YAKE 并行进程数
         
     Returns:
         处理后的论文列表
     """
     processor = KeywordProcessor(extractor_type=extractor_type)
-    return processor.process_papers(papers, show_progress=show_progress)
+    return processor.process_papers(papers, show_progress=show_progress, jobs=jobs)
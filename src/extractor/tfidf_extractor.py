@@ -0,0 +1,127 @@
+"""
+TF-IDF 关键词提取器
+
+在整个语料上一次性拟合 TfidfVectorizer（稀疏矩阵运算，C 实现），
+每篇文档取权重最高的 n-gram 作为关键词。适合批量处理，
+单篇文本时 IDF 退化为常数，只按词频排序。
+"""
+
+from typing import List, Tuple
+
+try:
+    import numpy as np  # 可选依赖：随 scikit-learn 安装
+    from sklearn.feature_extraction.text import TfidfVectorizer  # 可选依赖：TF-IDF 快速提取
+except ImportError:
+    np = None
+    TfidfVectorizer = None
+
+from config import EXTRACTOR_CONFIG
+
+
+def is_tfidf_available() -> bool:
+    """scikit-learn 是否可用"""
+    return TfidfVectorizer is not None
+
+
+class TfidfExtractor:
+    """TF-IDF 关键词提取器"""
+    
+    def __init__(
+        self,
+        max_ngram_size: int = None,
+        max_features: int = None,
+        num_keywords: int = None,
+    ):
+        """
+        初始化 TF-IDF 提取器
+        
+        Args:
+            max_ngram_size: 最大 n-gram 大小（默认 3）
+            max_features: 词表上限（默认 50000）
+            num_keywords: 每篇返回关键词数量（默认 20）
+        """
+        if TfidfVectorizer is None:
+            raise ImportError("TF-IDF 提取需要安装 scikit-learn")
+        
+        self.max_ngram_size = max_ngram_size or EXTRACTOR_CONFIG.tfidf_max_ngram_size
+        self.max_features = max_features or EXTRACTOR_CONFIG.tfidf_max_features
+        self.num_keywords = num_keywords or EXTRACTOR_CONFIG.tfidf_num_keywords
+    
+    def extract_batch(self, texts: List[str]) -> List[List[Tuple[str, float]]]:
+        """
+        在整批文本上拟合 TF-IDF 并提取关键词
+        
+        Args:
+            texts: 文本列表
+            
+        Returns:
+            与 texts 顺序一致的关键词列表，每个元素为 (关键词, 权重) 元组，
+            按权重降序排列
+        """
+        results: List[List[Tuple[str, float]]] = [[] for _ in texts]
+        
+        # 空文本不参与拟合，避免影响 IDF
+        indices = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not indices:
+            return results
+        
+        vectorizer = TfidfVectorizer(
+            ngram_range=(1, self.max_ngram_size),
+            max_features=self.max_features,
+            stop_words="english",
+        )
+        try:
+            matrix = vectorizer.fit_transform([texts[i] for i in indices]).tocsr()
+        except ValueError:
+            # 全部是停用词时词表为空
+            return results
+        
+        feature_names = vectorizer.get_feature_names_out()
+        indptr, columns, weights = matrix.indptr, matrix.indices, matrix.data
+        top_n = self.num_keywords
+        
+        # 直接读取 CSR 每行的非零元素，只对这部分做 top-k
+        for row, i in enumerate(indices):
+            start, end = indptr[row], indptr[row + 1]
+            row_weights = weights[start:end]
+            if len(row_weights) > top_n:
+                top = np.argpartition(-row_weights, top_n)[:top_n]
+            else:
+                top = np.arange(len(row_weights))
+            top = top[np.argsort(-row_weights[top], kind="stable")]
+            row_columns = columns[start:end]
+            results[i] = [
+                (str(feature_names[row_columns[j]]), float(row_weights[j]))
+                for j in top
+            ]
+        
+        return results
+    
+    def extract(self, text: str) -> List[Tuple[str, float]]:
+        """
+        从单篇文本中提取关键词
+        
+        Args:
+            text: 输入文本
+            
+        Returns:
+            关键词列表，每个元素为 (关键词, 权重) 元组
+        """
+        return self.extract_batch([text])[0]
+    
+    def extract_keywords(self, text: str) -> List[str]:
+        """
+        从文本中提取关键词（仅返回关键词，不含分数）
+        
+        Args:
+            text: 输入文本
+            
+        Returns:
+            关键词列表
+        """
+        return [kw for kw, _ in self.extract(text)]
+
+
+def create_tfidf_extractor(**kwargs) -> TfidfExtractor:
+    """创建 TF-IDF 提取器"""
+    return TfidfExtractor(**kwargs)
@@ -0,0 +1,57 @@
+"""
+YAKE 进程池
+
+KeywordProcessor 与 AnalysisAgent 共用的多进程 YAKE 提取。
+只依赖 yake_extractor，不会连带导入 KeyBERT / torch。
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional
+
+from .yake_extractor import YakeExtractor
+
+
+# 进程池 worker 内的提取方法，每个进程初始化一次
+_worker_extract: Optional[Callable[[str], Any]] = None
+
+
+def _init_worker(params: dict, method: str):
+    """进程池 initializer：在 worker 进程中创建 YAKE 提取器"""
+    global _worker_extract
+    _worker_extract = getattr(YakeExtractor(**params), method)
+
+
+def _extract_worker(text: str) -> Any:
+    """进程池 worker：对单篇文本运行 YAKE"""
+    return _worker_extract(text)
+
+
+def iter_yake_parallel(
+    yake: YakeExtractor,
+    texts: List[str],
+    jobs: int,
+    method: str = "extract_keywords",
+) -> Iterator[Any]:
+    """
+    多进程运行 YAKE，按 texts 顺序逐个产出结果
+    
+    Args:
+        yake: 主进程中的提取器，worker 按其参数重建
+        texts: 待提取文本
+        jobs: 进程数
+        method: 调用的提取方法，"extract_keywords" 或 "extract"（带分数）
+    """
+    params = {
+        "language": yake.language,
+        "max_ngram_size": yake.max_ngram_size,
+        "deduplication_threshold": yake.deduplication_threshold,
+        "num_keywords": yake.num_keywords,
+    }
+    chunksize = max(1, len(texts) // (4 * jobs))
+    
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(params, method),
+    ) as executor:
+        yield from executor.map(_extract_worker, texts, chunksize=chunksize)
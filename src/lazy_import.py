@@ -0,0 +1,40 @@
+"""
+按需导入
+
+包的 __init__ 用 lazy_exports 声明对外属性，只在首次访问时才导入对应子模块
+（PEP 562），避免导入包时连带加载 torch / openreview 等较重的依赖。
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    module_name: str,
+    attrs: Dict[str, str],
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    生成模块级 __getattr__ / __dir__
+    
+    Args:
+        module_name: 包名，即调用方的 __name__
+        attrs: 属性名 -> 相对子模块名，如 {"Paper": ".models"}
+    
+    Returns:
+        (__getattr__, __dir__)
+    """
+    def __getattr__(name: str):
+        submodule = attrs.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(submodule, module_name), name)
+        # 写回包的命名空间，之后的访问不再经过 __getattr__
+        setattr(sys.modules[module_name], name, value)
+        return value
+    
+    def __dir__() -> List[str]:
+        namespace = vars(sys.modules[module_name])
+        return sorted(set(namespace) | set(namespace.get("__all__", ())))
+    
+    return __getattr__, __dir__
@@ -1,6 +1,7 @@
 ﻿"""DeepTrender pipeline entrypoint."""
 
 import argparse
+import os
 import sys
 from pathlib import Path
 from typing import List
@@ -13,11 +14,8 @@ if hasattr(sys.stderr, "reconfigure"):
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from agents import IngestionAgent, StructuringAgent
-from agents.analysis_agent import AnalysisAgent
-from analysis import get_analyzer
-from visualization import generate_all_charts
-from report import generate_report
+# Pipeline stages (scrapers, extractors, plotting) are imported inside
+# run_pipeline so that `--help` and skipped stages do not pay for them.
 
 
 def run_pipeline(
@@ -29,13 +27,17 @@ def run_pipeline(
     limit: int = 5000,
     skip_ingestion: bool = False,
     skip_structuring: bool = False,
+    jobs: int = 1,
 ) -> str:
     print("=" * 60)
     print("DeepTrender - Three-stage Pipeline")
     print("=" * 60)
-    print(f"Start: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    start = datetime.now()
+    print(f"Start: {start.strftime('%Y-%m-%d %H:%M:%S')}")
 
     if not skip_ingestion:
+        from agents.ingestion_agent import IngestionAgent
+
         print("\n[1/3] Ingestion")
         ingestion_agent = IngestionAgent()
         ingestion_agent.run(
@@ -48,21 +50,25 @@ def run_pipeline(
         print("\n[1/3] Ingestion skipped")
 
     if not skip_structuring:
+        from agents.structuring_agent import StructuringAgent
+
         print("\n[2/3] Structuring")
         structuring_agent = StructuringAgent()
         structuring_agent.run(limit=limit)
     else:
         print("\n[2/3] Structuring skipped")
 
+    from agents.analysis_agent import AnalysisAgent
+
     print("\n[3/3] Analysis")
     analysis_agent = AnalysisAgent()
 
     if extractor == "yake":
-        analysis_agent.run(method="yake", limit=limit)
+        analysis_agent.run(method="yake", limit=limit, jobs=jobs)
     elif extractor == "keybert":
         analysis_agent.run(method="keybert", limit=limit)
     elif extractor == "both":
-        analysis_agent.run(method="yake", limit=limit)
+        analysis_agent.run(method="yake", limit=limit, jobs=jobs)
         analysis_agent.run(method="keybert", limit=limit)
 
     try:
@@ -74,15 +80,19 @@ def run_pipeline(
     except Exception as exc:
         print(f"arXiv analysis warning: {exc}")
 
+    from analysis import get_analyzer
+    from visualization import generate_all_charts
+    from report import generate_report
+
     analyzer = get_analyzer()
     result = analyzer.analyze()
 
     charts = generate_all_charts(result)
-    report_path = generate_report(result, charts)
+    report_path = generate_report(result, charts, now=start)
 
     print("\nPipeline completed")
     print(f"Report: {report_path}")
-    print(f"End: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Elapsed: {(datetime.now() - start).total_seconds():.1f}s")
 
     return str(report_path)
 
@@ -109,6 +119,12 @@ def main():
     )
     parser.add_argument("--skip-ingestion", action="store_true", help="Skip ingestion stage")
     parser.add_argument("--skip-structuring", action="store_true", help="Skip structuring stage")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for YAKE extraction (default: CPU count)",
+    )
 
     args = parser.parse_args()
     sources = None if args.source == "all" else [args.source]
@@ -122,6 +138,7 @@ def main():
         limit=args.limit,
         skip_ingestion=args.skip_ingestion,
         skip_structuring=args.skip_structuring,
+        jobs=args.jobs,
     )
 
 
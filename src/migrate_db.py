@@ -42,14 +42,23 @@ def migrate_database(db_path: Path = None, backup: bool = True):
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     
-    # 获取现有表
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-    existing_tables = {row["name"] for row in cursor.fetchall()}
+    # 获取现有表及其列：一条语句读取 sqlite_master 与各表的 table_info，
+    # 后续各步骤的结构检查都复用这里的结果
+    schema = {}
+    for table, column in conn.execute("""
+        SELECT m.name, c.name
+        FROM sqlite_master m
+        LEFT JOIN pragma_table_info(m.name) c
+        WHERE m.type = 'table'
+    """).fetchall():
+        columns = schema.setdefault(table, set())
+        if column is not None:
+            columns.add(column)
+    existing_tables = set(schema)
     print(f"\n现有表: {', '.join(existing_tables)}")
     
     # 检查 papers 表结构
-    cursor.execute("PRAGMA table_info(papers)")
-    papers_columns = {row[1] for row in cursor.fetchall()}
+    papers_columns = schema.get("papers", set())
     print(f"papers 列: {', '.join(papers_columns)}")
     
     is_legacy = "id" in papers_columns and "paper_id" not in papers_columns
@@ -61,7 +70,19 @@ def migrate_database(db_path: Path = None, backup: bool = True):
     
     print("\n📦 检测到旧架构，开始迁移...")
     
+    # 与 BaseRepository 一致的 PRAGMA，迁移期间加大页缓存
+    cursor.execute("PRAGMA journal_mode = WAL")
+    cursor.execute("PRAGMA synchronous = NORMAL")
+    cursor.execute("PRAGMA temp_store = MEMORY")
+    cursor.execute("PRAGMA cache_size = -200000")
+    # 复制与重建表期间不做逐行外键校验（该 PRAGMA 在事务内无效，须在 BEGIN 之前设置），
+    # 提交前统一用 foreign_key_check 校验一次
+    cursor.execute("PRAGMA foreign_keys = OFF")
+    
     try:
+        # 整个迁移在一个写事务中完成，结束时只提交一次
+        cursor.execute("BEGIN IMMEDIATE")
+        
         # 1. 创建 Raw Layer 表（如果不存在）
         print("\n1️⃣ 创建 Raw Layer 表...")
         cursor.execute("""
@@ -103,14 +124,12 @@ def migrate_database(db_path: Path = None, backup: bool = True):
         
         # 3. 从旧 papers 表提取 venues
         print("\n3️⃣ 提取 venues...")
-        cursor.execute("SELECT DISTINCT venue FROM papers WHERE venue IS NOT NULL")
-        venues = [row["venue"] for row in cursor.fetchall()]
-        for venue in venues:
-            cursor.execute(
-                "INSERT OR IGNORE INTO venues (canonical_name) VALUES (?)",
-                (venue,)
-            )
-        print(f"   ✅ 已提取 {len(venues)} 个 venue")
+        # 去重与插入在 SQLite 内一条语句完成，不经过 Python 逐行中转
+        cursor.execute("""
+            INSERT OR IGNORE INTO venues (canonical_name)
+            SELECT DISTINCT venue FROM papers WHERE venue IS NOT NULL
+        """)
+        print(f"   ✅ 已提取 {cursor.rowcount} 个 venue")
         
         # 4. 创建新的 papers 表（papers_new）
         print("\n4️⃣ 创建新架构 papers 表...")
@@ -177,9 +196,8 @@ def migrate_database(db_path: Path = None, backup: bool = True):
         
         # 8. 创建/更新 paper_keywords 表
         print("\n8️⃣ 更新 paper_keywords 表...")
-        # 检查是否需要添加 method 列
-        cursor.execute("PRAGMA table_info(paper_keywords)")
-        pk_columns = {row[1] for row in cursor.fetchall()}
+        # 检查是否需要添加 method 列（前面步骤不会修改 paper_keywords）
+        pk_columns = schema.get("paper_keywords", set())
         
         if "method" not in pk_columns:
             # 需要重建表
@@ -195,10 +213,13 @@ def migrate_database(db_path: Path = None, backup: bool = True):
                 )
             """)
             # 迁移现有关键词数据（如果有）
+            # 按唯一键顺序写入，UNIQUE 自动索引按顺序追加而不是随机插入 B-tree；
+            # rowid 作为次序键，重复行仍保留最先写入的一条
             cursor.execute("""
                 INSERT OR IGNORE INTO paper_keywords_new (paper_id, keyword, method, score)
                 SELECT paper_id, keyword_id, 'legacy', score
                 FROM paper_keywords
+                ORDER BY paper_id, keyword_id, rowid
             """)
             cursor.execute("DROP TABLE IF EXISTS paper_keywords")
             cursor.execute("ALTER TABLE paper_keywords_new RENAME TO paper_keywords")
@@ -239,7 +260,7 @@ def migrate_database(db_path: Path = None, backup: bool = True):
         indexes = [
             "CREATE INDEX IF NOT EXISTS idx_raw_papers_source ON raw_papers(source, source_paper_id)",
             "CREATE INDEX IF NOT EXISTS idx_papers_venue_year ON papers(venue_id, year)",
-            "CREATE INDEX IF NOT EXISTS idx_paper_sources_paper ON paper_sources(paper_id)",
+            "CREATE INDEX IF NOT EXISTS idx_paper_sources_paper_source_raw ON paper_sources(paper_id, source, raw_id)",
             "CREATE INDEX IF NOT EXISTS idx_paper_keywords_paper ON paper_keywords(paper_id)",
         ]
         for idx in indexes:
@@ -249,6 +270,11 @@ def migrate_database(db_path: Path = None, backup: bool = True):
                 print(f"   ⚠️ 索引创建警告: {e}")
         print("   ✅ 索引已创建")
         
+        # 外键一次性校验：papers.venue_id 来自 venues 的 LEFT JOIN，正常不应有违规
+        violations = cursor.execute("PRAGMA foreign_key_check(papers)").fetchall()
+        if violations:
+            print(f"   ⚠️ papers 表存在 {len(violations)} 条外键违规记录")
+        
         conn.commit()
         print("\n" + "=" * 60)
         print("✅ 迁移完成！")
@@ -4,6 +4,7 @@ Markdown 报告生成器
 生成包含图表和统计信息的 Markdown 报告。
 """
 
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Optional
 from datetime import datetime
@@ -12,6 +13,46 @@ from analysis.statistics import AnalysisResult
 from config import REPORTS_DIR, FIGURES_DIR
 
 
+# 报告中的固定 Markdown 片段，模块加载时构建一次，生成时只填入数据
+_HEADER_TMPL = (
+    "# 🔬 顶会论文关键词趋势报告\n"
+    "\n"
+    "> 自动生成于 {generated_at}\n"
+    "\n"
+)
+
+_OVERVIEW_TMPL = (
+    "## 📊 数据概览\n"
+    "\n"
+    "| 指标 | 数值 |\n"
+    "|------|------|\n"
+    "| 论文总数 | {total_papers:,} |\n"
+    "| 关键词总数 | {total_keywords:,} |\n"
+    "| 覆盖会议 | {venues} |\n"
+    "| 年份范围 | {min_year} - {max_year} |\n"
+    "\n"
+)
+
+_TOP_KEYWORDS_TABLE_HEADER = (
+    "<details>\n"
+    "<summary>📋 完整列表（Top 50）</summary>\n"
+    "\n"
+    "| 排名 | 关键词 | 出现次数 |\n"
+    "|------|--------|----------|\n"
+)
+
+_VENUE_TABLE_HEADER = (
+    "| 年份 | 论文数 | Top 5 关键词 |\n"
+    "|------|--------|--------------|\n"
+)
+
+_FOOTER = (
+    "---\n"
+    "\n"
+    "*本报告由 [DeepTrender](https://github.com/your-repo/deeptrender) 自动生成*"
+)
+
+
 class ReportGenerator:
     """报告生成器"""
     
@@ -36,6 +77,7 @@ class ReportGenerator:
         result: AnalysisResult,
         charts: Dict[str, Path],
         filename: str = "report.md",
+        now: Optional[datetime] = None,
     ) -> Path:
         """
         生成 Markdown 报告
@@ -44,128 +86,126 @@ class ReportGenerator:
             result: 分析结果
             charts: 图表路径映射
             filename: 输出文件名
+            now: 报告生成时间（默认当前时间；流水线传入启动时间以对齐时间戳）
             
         Returns:
             报告文件路径
         """
-        lines = []
-        
-        # 标题
-        lines.append("# 🔬 顶会论文关键词趋势报告")
-        lines.append("")
-        lines.append(f"> 自动生成于 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append("")
-        
-        # 概览
-        lines.append("## 📊 数据概览")
-        lines.append("")
-        lines.append(f"| 指标 | 数值 |")
-        lines.append("|------|------|")
-        lines.append(f"| 论文总数 | {result.total_papers:,} |")
-        lines.append(f"| 关键词总数 | {result.total_keywords:,} |")
-        lines.append(f"| 覆盖会议 | {', '.join(result.venues)} |")
-        lines.append(f"| 年份范围 | {min(result.years)} - {max(result.years)} |")
-        lines.append("")
-        
-        # 整体词云
-        if "wordcloud_overall" in charts:
-            lines.append("## ☁️ 关键词云")
-            lines.append("")
-            rel_path = self._get_relative_path(charts["wordcloud_overall"])
-            lines.append(f"![关键词云]({rel_path})")
-            lines.append("")
-        
-        # Top-K 关键词
-        if result.overall_top_keywords:
-            lines.append("## 🏆 Top 20 热门关键词")
-            lines.append("")
+        # 逐段直接写入文件（1 MB 缓冲），不在内存中先拼出整份报告
+        output_path = self.output_dir / filename
+        with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            write = f.write
+            # 图表相对路径只计算一次，之后按键查找（一次 get，替代 "in" 判断后再取值）
+            rel_paths = {
+                key: self._get_relative_path(path)
+                for key, path in charts.items()
+                if path is not None
+            }
+            rel_get = rel_paths.get
+
+            # 标题
+            write(_HEADER_TMPL.format(
+                generated_at=(now or datetime.now()).strftime('%Y-%m-%d %H:%M:%S'),
+            ))
             
-            if "top_keywords" in charts:
-                rel_path = self._get_relative_path(charts["top_keywords"])
-                lines.append(f"![Top 关键词]({rel_path})")
-                lines.append("")
+            # 概览
+            write(_OVERVIEW_TMPL.format(
+                total_papers=result.total_papers,
+                total_keywords=result.total_keywords,
+                venues=', '.join(result.venues),
+                min_year=min(result.years),
+                max_year=max(result.years),
+            ))
             
-            # 表格形式
-            lines.append("<details>")
-            lines.append("<summary>📋 完整列表（Top 50）</summary>")
-            lines.append("")
-            lines.append("| 排名 | 关键词 | 出现次数 |")
-            lines.append("|------|--------|----------|")
-            for i, (kw, count) in enumerate(result.overall_top_keywords[:50], 1):
-                lines.append(f"| {i} | {kw} | {count} |")
-            lines.append("")
-            lines.append("</details>")
-            lines.append("")
-        
-        # 趋势分析
-        if result.keyword_trends:
-            lines.append("## 📈 关键词趋势")
-            lines.append("")
+            # 整体词云
+            rel_path = rel_get("wordcloud_overall")
+            if rel_path is not None:
+                write("## ☁️ 关键词云\n")
+                write("\n")
+                write(f"![关键词云]({rel_path})\n")
+                write("\n")
             
-            if "keyword_trends" in charts:
-                rel_path = self._get_relative_path(charts["keyword_trends"])
-                lines.append(f"![关键词趋势]({rel_path})")
-                lines.append("")
-        
-        # 新兴关键词
-        if result.emerging_keywords:
-            lines.append("## 🚀 新兴关键词")
-            lines.append("")
-            lines.append("以下关键词在最近一年增长显著：")
-            lines.append("")
-            for i, kw in enumerate(result.emerging_keywords[:10], 1):
-                lines.append(f"{i}. **{kw}**")
-            lines.append("")
-        
-        # 各会议详情
-        lines.append("## 📚 会议详情")
-        lines.append("")
-        
-        for venue in result.venues:
-            if venue not in result.venue_stats:
-                continue
+            # Top-K 关键词
+            if result.overall_top_keywords:
+                write("## 🏆 Top 20 热门关键词\n")
+                write("\n")
                 
-            lines.append(f"### {venue}")
-            lines.append("")
+                rel_path = rel_get("top_keywords")
+                if rel_path is not None:
+                    write(f"![Top 关键词]({rel_path})\n")
+                    write("\n")
+                
+                # 表格形式
+                write(_TOP_KEYWORDS_TABLE_HEADER)
+                write("".join(
+                    f"| {i} | {kw} | {count} |\n"
+                    for i, (kw, count) in enumerate(result.overall_top_keywords[:50], 1)
+                ))
+                write("\n")
+                write("</details>\n")
+                write("\n")
             
-            # 会议词云
-            chart_key = f"wordcloud_{venue.lower()}"
-            if chart_key in charts:
-                rel_path = self._get_relative_path(charts[chart_key])
-                lines.append(f"![{venue} 词云]({rel_path})")
-                lines.append("")
+            # 趋势分析
+            if result.keyword_trends:
+                write("## 📈 关键词趋势\n")
+                write("\n")
+                
+                rel_path = rel_get("keyword_trends")
+                if rel_path is not None:
+                    write(f"![关键词趋势]({rel_path})\n")
+                    write("\n")
             
-            # 各年份统计
-            lines.append("| 年份 | 论文数 | Top 5 关键词 |")
-            lines.append("|------|--------|--------------|")
+            # 新兴关键词
+            if result.emerging_keywords:
+                write("## 🚀 新兴关键词\n")
+                write("\n")
+                write("以下关键词在最近一年增长显著：\n")
+                write("\n")
+                for i, kw in enumerate(result.emerging_keywords[:10], 1):
+                    write(f"{i}. **{kw}**\n")
+                write("\n")
             
-            for year in sorted(result.venue_stats[venue].keys(), reverse=True):
-                stats = result.venue_stats[venue][year]
-                top5 = ", ".join([kw for kw, _ in stats.top_keywords[:5]])
-                lines.append(f"| {year} | {stats.paper_count} | {top5} |")
+            # 各会议详情
+            write("## 📚 会议详情\n")
+            write("\n")
             
-            lines.append("")
-        
-        # 会议对比
-        if result.years:
-            latest_year = result.years[0]
-            chart_key = f"comparison_{latest_year}"
-            if chart_key in charts:
-                lines.append(f"## ⚖️ 会议对比 ({latest_year})")
-                lines.append("")
-                rel_path = self._get_relative_path(charts[chart_key])
-                lines.append(f"![会议对比]({rel_path})")
-                lines.append("")
-        
-        # 页脚
-        lines.append("---")
-        lines.append("")
-        lines.append("*本报告由 [DeepTrender](https://github.com/your-repo/deeptrender) 自动生成*")
-        
-        # 写入文件
-        output_path = self.output_dir / filename
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+            for venue in result.venues:
+                year_stats = result.venue_stats.get(venue)
+                if year_stats is None:
+                    continue
+                    
+                write(f"### {venue}\n\n")
+                
+                # 会议词云
+                rel_path = rel_get(f"wordcloud_{venue.lower()}")
+                if rel_path is not None:
+                    write(f"![{venue} 词云]({rel_path})\n")
+                    write("\n")
+                
+                # 各年份统计
+                write(_VENUE_TABLE_HEADER)
+                
+                # 整个年份表一次拼接、一次写入
+                write("".join(
+                    f"| {year} | {stats.paper_count} | "
+                    f"{', '.join(kw for kw, _ in stats.top_keywords[:5])} |\n"
+                    for year, stats in sorted(year_stats.items(), key=itemgetter(0), reverse=True)
+                ))
+                
+                write("\n")
+            
+            # 会议对比
+            if result.years:
+                latest_year = result.years[0]
+                rel_path = rel_get(f"comparison_{latest_year}")
+                if rel_path is not None:
+                    write(f"## ⚖️ 会议对比 ({latest_year})\n")
+                    write("\n")
+                    write(f"![会议对比]({rel_path})\n")
+                    write("\n")
+            
+            # 页脚
+            write(_FOOTER)
         
         return output_path
     
@@ -182,6 +222,7 @@ def generate_report(
     charts: Dict[str, Path],
     output_dir: Path = None,
     filename: str = "report.md",
+    now: Optional[datetime] = None,
 ) -> Path:
     """
     生成报告的便捷函数
@@ -191,9 +232,10 @@ def generate_report(
         charts: 图表路径映射
         output_dir: 输出目录
         filename: 文件名
+        now: 报告生成时间
         
     Returns:
         报告文件路径
     """
     generator = ReportGenerator(output_dir=output_dir)
-    return generator.generate(result, charts, filename)
+    return generator.generate(result, charts, filename, now=now)
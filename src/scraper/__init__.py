@@ -8,17 +8,31 @@
 - OpenAlex: 结构化锚点源
 """
 
-from .client import OpenReviewClient, create_client
-from .venues import scrape_venue, scrape_all_venues
-from .models import RawPaper, Paper, Venue, PaperSource, PaperKeyword, TrendData
-from .semantic_scholar import (
-    SemanticScholarClient,
-    scrape_s2_venue,
-    scrape_all_s2_venues,
-    S2_VENUES,
-)
-from .arxiv_client import ArxivClient, create_arxiv_client
-from .openalex_client import OpenAlexClient, create_openalex_client
+from lazy_import import lazy_exports
+
+# 按需导入：各数据源客户端会连带加载 openreview / requests 等依赖，
+# 只在首次访问对应属性时才导入子模块（PEP 562）。
+# 这样 `from scraper.models import Paper` 等只用到数据模型的导入不再加载所有客户端
+_LAZY_ATTRS = {
+    "OpenReviewClient": ".client",
+    "create_client": ".client",
+    "scrape_venue": ".venues",
+    "scrape_all_venues": ".venues",
+    "RawPaper": ".models",
+    "Paper": ".models",
+    "Venue": ".models",
+    "PaperSource": ".models",
+    "PaperKeyword": ".models",
+    "TrendData": ".models",
+    "SemanticScholarClient": ".semantic_scholar",
+    "scrape_s2_venue": ".semantic_scholar",
+    "scrape_all_s2_venues": ".semantic_scholar",
+    "S2_VENUES": ".semantic_scholar",
+    "ArxivClient": ".arxiv_client",
+    "create_arxiv_client": ".arxiv_client",
+    "OpenAlexClient": ".openalex_client",
+    "create_openalex_client": ".openalex_client",
+}
 
 __all__ = [
     # OpenReview
@@ -50,3 +64,4 @@ __all__ = [
     "TrendData",
 ]
 
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS)
@@ -12,9 +12,13 @@ arXiv 提供最广泛的 AI 相关论文覆盖，更新最快。
 
 import time
 import urllib.parse
-import feedparser
+import xml.etree.ElementTree as ET
+from io import BytesIO
 import requests
-from typing import List, Optional, Iterator, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from itertools import count
+from typing import List, Optional, Iterator, Dict, Any, BinaryIO, Set, Union
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
@@ -28,6 +32,61 @@ ARXIV_BULK_URL = "https://arxiv.org/list"
 # 默认 AI 相关类别
 DEFAULT_CATEGORIES = ["cs.CV", "cs.CL", "cs.LG", "cs.AI", "cs.RO", "cs.NE", "stat.ML"]
 
+# Atom / arXiv 扩展的 XML 命名空间
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_ARXIV_NS = "{http://arxiv.org/schemas/atom}"
+
+
+def _iter_entries(source: Union[bytes, BinaryIO]) -> Iterator[Dict[str, Any]]:
+    """
+    流式解析 arXiv Atom feed
+    
+    使用 C 实现的 ElementTree 代替纯 Python 的 feedparser，
+    只转换 _parse_entry 用到的字段，产出与 feedparser entry 同构的字典：
+    Atom 元素按标签名（id, title, summary, published, updated），
+    arXiv 扩展元素加 "arxiv_" 前缀（arxiv_comment, arxiv_journal_ref, arxiv_doi），
+    以及 authors / tags / links 列表。
+    
+    iterparse 逐个 <entry> 处理，处理完即从树中移除，不在内存中保留整份 feed。
+    source 可以是完整的字节串，也可以是二进制流（如解压后的响应体），边读边解析。
+    """
+    if isinstance(source, bytes):
+        source = BytesIO(source)
+    entry_tag = f"{_ATOM_NS}entry"
+    root = None
+    
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        if root is None:
+            root = element
+        elif event == "end" and element.tag == entry_tag:
+            yield _entry_to_dict(element)
+            # entry 是 <feed> 的直接子元素，已处理的部分（含 feed 头部）全部丢弃
+            root.clear()
+
+
+def _entry_to_dict(element: ET.Element) -> Dict[str, Any]:
+    """将单个 <entry> 元素转换为 feedparser 风格的字典"""
+    entry: Dict[str, Any] = {}
+    authors, tags, links = [], [], []
+    
+    for child in element:
+        tag = child.tag
+        if tag == f"{_ATOM_NS}author":
+            authors.append({"name": child.findtext(f"{_ATOM_NS}name", "")})
+        elif tag == f"{_ATOM_NS}category":
+            tags.append({"term": child.get("term", "")})
+        elif tag == f"{_ATOM_NS}link":
+            links.append(dict(child.attrib))
+        elif tag.startswith(_ATOM_NS):
+            entry[tag[len(_ATOM_NS):]] = child.text or ""
+        elif tag.startswith(_ARXIV_NS):
+            entry["arxiv_" + tag[len(_ARXIV_NS):]] = child.text or ""
+    
+    entry["authors"] = authors
+    entry["tags"] = tags
+    entry["links"] = links
+    return entry
+
 
 @dataclass
 class ArxivQuery:
@@ -52,8 +111,25 @@ class ArxivClient:
         self.delay = delay
         self.session = requests.Session()
         self.session.headers.update({
-            "User-Agent": "DepthTrender/1.0 (https://github.com/depthtrender)"
+            "User-Agent": "DepthTrender/1.0 (https://github.com/depthtrender)",
+            "Connection": "keep-alive",
+            # Atom XML 压缩率很高，显式要求 gzip 传输
+            "Accept-Encoding": "gzip, deflate",
         })
+        # arXiv 只允许单连接：连接池只保留一个连接并复用 TCP/TLS，
+        # 429/5xx 按 Retry-After 或以 delay 为基数的指数退避自动重试
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=1,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=delay,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self._last_request = 0
     
     def _wait_for_rate_limit(self):
@@ -69,6 +145,7 @@ class ArxivClient:
         search_query: str = None,
         start: int = 0,
         max_results: int = 100,
+        seen: Optional[Set[str]] = None,
     ) -> List[RawPaper]:
         """
         搜索 arXiv 论文
@@ -78,6 +155,8 @@ class ArxivClient:
             search_query: 搜索词
             start: 起始位置
             max_results: 最大结果数（单次最多 2000）
+            seen: 已解析过的 entry id 集合；传入时跳过其中的条目并登记新条目，
+                用于分页窗口重叠（翻页期间有新论文提交）时去重
             
         Returns:
             RawPaper 列表
@@ -105,17 +184,24 @@ class ArxivClient:
         }
         
         try:
-            response = self.session.get(ARXIV_API_URL, params=params)
-            response.raise_for_status()
-            
-            # 解析 Atom feed
-            feed = feedparser.parse(response.text)
-            papers = []
-            
-            for entry in feed.entries:
-                paper = self._parse_entry(entry)
-                if paper:
-                    papers.append(paper)
+            # 流式读取：gzip 响应体边下载、边解压、边解析，不先拼出完整字节串再解码为 str
+            with self.session.get(ARXIV_API_URL, params=params, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                
+                # 解析 Atom feed；同一页的论文共用一个采集时刻
+                papers = []
+                now = datetime.now()
+                
+                for entry in _iter_entries(response.raw):
+                    entry_id = entry.get("id")
+                    if seen is not None and entry_id:
+                        if entry_id in seen:
+                            continue
+                        seen.add(entry_id)
+                    paper = self._parse_entry(entry, retrieved_at=now)
+                    if paper:
+                        papers.append(paper)
             
             return papers
             
@@ -123,6 +209,38 @@ class ArxivClient:
             print(f"arXiv API 请求失败: {e}")
             return []
     
+    def _iter_pages(
+        self,
+        categories: List[str],
+        batch_size: int = 500,
+        max_results: Optional[int] = None,
+    ) -> Iterator[List[RawPaper]]:
+        """
+        按顺序逐页请求并产出结果
+        
+        同一时刻只有一个请求在途（arXiv 只允许单连接）。响应体边下载边解析，
+        而速率限制从上一次请求发起时计时，解析耗时已计入下一页前的等待。
+        
+        Args:
+            categories: arXiv 类别
+            batch_size: 每页数量
+            max_results: 总数上限（None 表示直到调用方停止迭代）
+            
+        Yields:
+            每页的 RawPaper 列表；调用方 break 后不再发起后续请求
+        """
+        if max_results is None:
+            starts = count(0, batch_size)
+        else:
+            starts = iter(range(0, max_results, batch_size))
+        
+        # 本次分页共享的 entry id 集合，重叠窗口中重复出现的论文只解析一次
+        seen: Set[str] = set()
+        
+        for start in starts:
+            size = batch_size if max_results is None else min(batch_size, max_results - start)
+            yield self.search(categories=categories, start=start, max_results=size, seen=seen)
+    
     def search_recent(
         self,
         categories: List[str] = None,
@@ -146,21 +264,15 @@ class ArxivClient:
         print(f"   Categories: {', '.join(categories)}")
         
         all_papers = []
-        start = 0
-        batch_size = 500
+        cutoff_date = datetime.now() - timedelta(days=days)
         
-        while len(all_papers) < max_results:
-            papers = self.search(
-                categories=categories,
-                start=start,
-                max_results=min(batch_size, max_results - len(all_papers)),
-            )
-            
+        # 日期过滤会剔除部分论文，页数无法预先确定：持续翻页直到凑满 max_results
+        # 或结果已超出时间窗口；分页是惰性的，break 之后不会再发请求
+        for papers in self._iter_pages(categories):
             if not papers:
                 break
             
             # 过滤日期
-            cutoff_date = datetime.now() - timedelta(days=days)
             recent_papers = []
             
             for paper in papers:
@@ -169,13 +281,14 @@ class ArxivClient:
                 elif paper.year and paper.year >= cutoff_date.year:
                     recent_papers.append(paper)
             
-            all_papers.extend(recent_papers)
+            all_papers.extend(recent_papers[:max_results - len(all_papers)])
+            if len(all_papers) >= max_results:
+                break
             
             # 如果这批次都太旧了，停止
             if len(recent_papers) < len(papers) * 0.5:
                 break
             
-            start += batch_size
             print(f"   Fetched {len(all_papers)} papers...")
 
         print(f"SUCCESS: Fetched {len(all_papers)} papers from arXiv")
@@ -199,21 +312,12 @@ class ArxivClient:
         print(f"Fetching {category} papers from arXiv...")
         
         all_papers = []
-        start = 0
-        batch_size = 500
         
-        while len(all_papers) < max_results:
-            papers = self.search(
-                categories=[category],
-                start=start,
-                max_results=min(batch_size, max_results - len(all_papers)),
-            )
-            
+        for papers in self._iter_pages([category], max_results=max_results):
             if not papers:
                 break
             
             all_papers.extend(papers)
-            start += batch_size
             
             print(f"   Fetched {len(all_papers)} papers...")
 
@@ -238,20 +342,31 @@ class ArxivClient:
         }
         
         try:
-            response = self.session.get(ARXIV_API_URL, params=params)
-            response.raise_for_status()
-            
-            feed = feedparser.parse(response.text)
-            if feed.entries:
-                return self._parse_entry(feed.entries[0])
+            with self.session.get(ARXIV_API_URL, params=params, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                
+                entry = next(_iter_entries(response.raw), None)
+            if entry is not None:
+                return self._parse_entry(entry)
             return None
             
         except Exception as e:
             print(f"获取 arXiv 论文失败: {e}")
             return None
     
-    def _parse_entry(self, entry: Dict[str, Any]) -> Optional[RawPaper]:
-        """解析 arXiv Atom entry 为 RawPaper"""
+    def _parse_entry(
+        self,
+        entry: Dict[str, Any],
+        retrieved_at: Optional[datetime] = None,
+    ) -> Optional[RawPaper]:
+        """
+        解析 arXiv Atom entry 为 RawPaper
+        
+        Args:
+            entry: feedparser 风格的 entry 字典
+            retrieved_at: 采集时刻（批量解析时由调用方统一传入，默认当前时间）
+        """
         try:
             # 提取 arXiv ID
             arxiv_id = entry.get("id", "").split("/abs/")[-1].split("v")[0]
@@ -265,11 +380,7 @@ class ArxivClient:
             abstract = entry.get("summary", "").replace("\n", " ").strip()
             
             # 作者
-            authors = []
-            for author in entry.get("authors", []):
-                name = author.get("name", "")
-                if name:
-                    authors.append(name)
+            authors = [name for name in (a.get("name", "") for a in entry.get("authors", [])) if name]
             
             # 发布日期
             published = entry.get("published", "")
@@ -282,12 +393,10 @@ class ArxivClient:
                 except:
                     pass
             
-            # 类别
-            categories = []
-            for tag in entry.get("tags", []):
-                term = tag.get("term", "")
-                if term:
-                    categories.append(term)
+            # 类别（直接拼接，不建中间列表）
+            categories = ",".join(
+                term for term in (tag.get("term", "") for tag in entry.get("tags", [])) if term
+            )
             
             # Comments（可能包含会议信息）
             comments = entry.get("arxiv_comment", "")
@@ -298,12 +407,12 @@ class ArxivClient:
             # DOI
             doi = entry.get("arxiv_doi", "")
             
-            # PDF 链接
-            pdf_url = None
-            for link in entry.get("links", []):
-                if link.get("type") == "application/pdf":
-                    pdf_url = link.get("href")
-                    break
+            # 链接：只取一次列表，PDF 链接找到即停
+            links = entry.get("links", [])
+            pdf_url = next(
+                (link.get("href") for link in links if link.get("type") == "application/pdf"),
+                None,
+            )
             
             return RawPaper(
                 source="arxiv",
@@ -315,17 +424,17 @@ class ArxivClient:
                 venue_raw=None,  # arXiv 本身不是 venue
                 journal_ref=journal_ref,
                 comments=comments,
-                categories=",".join(categories),
+                categories=categories,
                 doi=doi,
                 raw_json={
                     "id": entry.get("id"),
                     "published": published,
                     "updated": entry.get("updated"),
                     "pdf_url": pdf_url,
-                    "links": [l.get("href") for l in entry.get("links", [])],
+                    "links": [link.get("href") for link in links],
                 },
                 published_at=published_at,
-                retrieved_at=datetime.now(),
+                retrieved_at=retrieved_at or datetime.now(),
             )
             
         except Exception as e:
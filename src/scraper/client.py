@@ -3,6 +3,7 @@ OpenReview API 客户端封装
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Iterator
 import openreview
 from openreview.api import OpenReviewClient as ORClient
@@ -67,21 +68,21 @@ class OpenReviewClient:
             ))
             
             if not notes:
-                # 尝试其他常见的 invitation 格式
+                # 尝试其他常见的 invitation 格式：并发探测，按列表顺序取第一个非空结果
                 alternative_invitations = [
                     f"{venue_id}/-/Blind_Submission",
                     f"{venue_id}/-/blind-submission",
                 ]
-                for alt_invitation in alternative_invitations:
-                    try:
-                        notes = list(self.client.get_all_notes(
-                            invitation=alt_invitation,
-                            details="original",
-                        ))
-                        if notes:
+                with ThreadPoolExecutor(max_workers=len(alternative_invitations)) as executor:
+                    futures = [
+                        executor.submit(self._get_all_notes, alt_invitation)
+                        for alt_invitation in alternative_invitations
+                    ]
+                    for future in futures:
+                        alt_notes = future.result()
+                        if alt_notes:
+                            notes = alt_notes
                             break
-                    except Exception:
-                        continue
         except Exception as e:
             print(f"获取论文失败 ({venue_id}): {e}")
             return
@@ -95,6 +96,16 @@ class OpenReviewClient:
         for note in notes:
             yield note
     
+    def _get_all_notes(self, invitation: str) -> list:
+        """获取某个 invitation 下的全部 Note，失败时返回空列表"""
+        try:
+            return list(self.client.get_all_notes(
+                invitation=invitation,
+                details="original",
+            ))
+        except Exception:
+            return []
+    
     def get_accepted_papers(
         self,
         venue_id: str,
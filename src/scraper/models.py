@@ -7,11 +7,15 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 
 
+# All models use slots=True: no per-instance __dict__, so large scrapes hold
+# far less memory and attribute access skips a dict lookup. Any attribute a
+# caller sets must therefore be declared as a field.
+
 # ============================================================
 # RAW LAYER MODELS
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class RawPaper:
     """Raw paper payload from upstream sources."""
 
@@ -82,7 +86,7 @@ class RawPaper:
 # STRUCTURED LAYER MODELS
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class Venue:
     """Canonical venue model."""
 
@@ -93,9 +97,12 @@ class Venue:
     first_year: Optional[int] = None
     last_year: Optional[int] = None
     venue_id: Optional[int] = None
+    tier: str = "C"
+    openreview_ids: List[str] = field(default_factory=list)
+    years_available: List[int] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Paper:
     """Structured/deduplicated paper model."""
 
@@ -191,7 +198,7 @@ class Paper:
         return list(set(self.keywords + self.extracted_keywords))
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperSource:
     """Link between structured paper and raw payload."""
 
@@ -206,7 +213,7 @@ class PaperSource:
 # ANALYSIS LAYER MODELS
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class PaperKeyword:
     """Extracted keyword per paper."""
 
@@ -217,7 +224,7 @@ class PaperKeyword:
     id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TrendData:
     """Trend series model."""
 
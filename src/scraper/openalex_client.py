@@ -144,8 +144,10 @@ class OpenAlexClient:
             if not results:
                 break
             
+            # 同一页的论文共用一个采集时刻
+            now = datetime.now()
             for work in results:
-                paper = self._parse_work(work)
+                paper = self._parse_work(work, retrieved_at=now)
                 if paper:
                     all_papers.append(paper)
             
@@ -259,7 +261,11 @@ class OpenAlexClient:
             for source in data["results"]
         ]
     
-    def _parse_work(self, work: Dict[str, Any]) -> Optional[RawPaper]:
+    def _parse_work(
+        self,
+        work: Dict[str, Any],
+        retrieved_at: Optional[datetime] = None,
+    ) -> Optional[RawPaper]:
         """解析 OpenAlex Work 为 RawPaper"""
         try:
             # OpenAlex ID
@@ -319,7 +325,7 @@ class OpenAlexClient:
                     "concepts": [c.get("display_name") for c in work.get("concepts", [])[:5]],
                     "primary_location": primary_location,
                 },
-                retrieved_at=datetime.now(),
+                retrieved_at=retrieved_at or datetime.now(),
             )
             
         except Exception as e:
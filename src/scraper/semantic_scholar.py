@@ -6,7 +6,9 @@ Semantic Scholar 是一个免费的学术论文搜索引擎，提供 API 访问
 """
 
 import time
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Iterator, Dict, Any
 from dataclasses import dataclass
 
@@ -24,6 +26,10 @@ S2_FIELDS = [
     "year", "url", "externalIds", "publicationTypes"
 ]
 
+# 同时在途的 API 请求数上限（按 IP 限流，所有客户端与线程共享）
+S2_MAX_CONCURRENT_REQUESTS = 2
+_request_slots = threading.Semaphore(S2_MAX_CONCURRENT_REQUESTS)
+
 
 @dataclass
 class SemanticScholarConfig:
@@ -137,7 +143,8 @@ class SemanticScholarClient:
                 params["token"] = token
             
             try:
-                response = self.session.get(S2_SEARCH_URL, params=params)
+                with _request_slots:
+                    response = self.session.get(S2_SEARCH_URL, params=params)
                 response.raise_for_status()
                 data = response.json()
                 
@@ -165,7 +172,8 @@ class SemanticScholarClient:
         try:
             url = f"{S2_PAPER_URL}/{paper_id}"
             params = {"fields": ",".join(S2_FIELDS)}
-            response = self.session.get(url, params=params)
+            with _request_slots:
+                response = self.session.get(url, params=params)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
@@ -257,6 +265,7 @@ def scrape_all_s2_venues(
     limit_per_venue: Optional[int] = None,
     max_age_days: int = 7,
     repository = None,
+    max_workers: int = 8,
 ) -> List[Paper]:
     """
     爬取所有 Semantic Scholar 会议
@@ -267,6 +276,7 @@ def scrape_all_s2_venues(
         limit_per_venue: 每个会议的论文限制
         max_age_days: 最大爬取间隔天数，在此时间内爬取过的会议将被跳过（默认 7 天）
         repository: 数据库仓库（用于检查和记录爬取日志）
+        max_workers: 并发爬取的会议年份数（实际在途请求数受 S2_MAX_CONCURRENT_REQUESTS 限制）
         
     Returns:
         所有论文列表
@@ -278,6 +288,8 @@ def scrape_all_s2_venues(
     all_papers = []
     skipped_count = 0
     
+    # 先筛选出需要爬取的会议年份
+    targets = []
     for venue_name, config in venues.items():
         venue_years = years if years is not None else config.years
         
@@ -287,18 +299,29 @@ def scrape_all_s2_venues(
                 print(f"⏭️ 跳过 {config.name} {year}（{max_age_days} 天内已爬取）")
                 skipped_count += 1
                 continue
-            
-            try:
-                papers = scrape_s2_venue(config, year, client, limit_per_venue)
-                all_papers.extend(papers)
-                
-                # 记录爬取日志
-                if repository is not None and papers:
-                    repository.log_scrape(config.name, year, len(papers))
-                    
-            except Exception as e:
-                print(f"❌ 爬取 {venue_name} {year} 失败: {e}")
+            targets.append((venue_name, config, year))
+    
+    def scrape_target(target) -> Optional[List[Paper]]:
+        venue_name, config, year = target
+        try:
+            return scrape_s2_venue(config, year, client, limit_per_venue)
+        except Exception as e:
+            print(f"❌ 爬取 {venue_name} {year} 失败: {e}")
+            return None
+    
+    # 各会议年份并发爬取，结果按原顺序合并
+    if targets:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(targets)))) as executor:
+            results = list(executor.map(scrape_target, targets))
+        
+        for (_, config, year), papers in zip(targets, results):
+            if papers is None:
                 continue
+            all_papers.extend(papers)
+            
+            # 记录爬取日志
+            if repository is not None and papers:
+                repository.log_scrape(config.name, year, len(papers))
     
     print(f"\n📊 Semantic Scholar 总计获取 {len(all_papers)} 篇论文（跳过 {skipped_count} 个会议年份）")
     return all_papers
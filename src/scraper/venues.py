@@ -2,6 +2,7 @@
 会议配置与论文爬取
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict
 from tqdm import tqdm
 
@@ -124,6 +125,7 @@ def scrape_all_venues(
     show_progress: bool = True,
     max_age_days: int = 7,
     repository = None,
+    max_workers: int = 8,
 ) -> List[Paper]:
     """
     爬取所有配置的会议论文
@@ -135,6 +137,7 @@ def scrape_all_venues(
         show_progress: 是否显示进度条
         max_age_days: 最大爬取间隔天数，在此时间内爬取过的会议将被跳过（默认 7 天）
         repository: 数据库仓库（用于检查和记录爬取日志）
+        max_workers: 并发爬取的会议年份数
         
     Returns:
         所有论文列表
@@ -146,6 +149,8 @@ def scrape_all_venues(
     all_papers = []
     skipped_count = 0
     
+    # 先筛选出需要爬取的会议年份
+    targets = []
     for venue_name, venue_config in venues.items():
         venue_years = years if years is not None else venue_config.years
         
@@ -155,24 +160,35 @@ def scrape_all_venues(
                 print(f"⏭️ 跳过 {venue_config.name} {year}（{max_age_days} 天内已爬取）")
                 skipped_count += 1
                 continue
-            
-            try:
-                papers = scrape_venue(
-                    venue_config,
-                    year,
-                    client=client,
-                    limit=limit_per_venue,
-                    show_progress=show_progress,
-                )
-                all_papers.extend(papers)
-                
-                # 记录爬取日志
-                if repository is not None and papers:
-                    repository.log_scrape(venue_config.name, year, len(papers))
-                    
-            except Exception as e:
-                print(f"❌ 爬取 {venue_name} {year} 失败: {e}")
+            targets.append((venue_name, venue_config, year))
+    
+    def scrape_target(target) -> Optional[List[Paper]]:
+        venue_name, venue_config, year = target
+        try:
+            return scrape_venue(
+                venue_config,
+                year,
+                client=client,
+                limit=limit_per_venue,
+                show_progress=show_progress,
+            )
+        except Exception as e:
+            print(f"❌ 爬取 {venue_name} {year} 失败: {e}")
+            return None
+    
+    # 各会议年份的请求互不依赖（网络 I/O），线程池并发爬取，结果按原顺序合并
+    if targets:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(targets)))) as executor:
+            results = list(executor.map(scrape_target, targets))
+        
+        for (_, venue_config, year), papers in zip(targets, results):
+            if papers is None:
                 continue
+            all_papers.extend(papers)
+            
+            # 记录爬取日志
+            if repository is not None and papers:
+                repository.log_scrape(venue_config.name, year, len(papers))
     
     print(f"\n📊 总计爬取 {len(all_papers)} 篇论文（跳过 {skipped_count} 个会议年份）")
     return all_papers
@@ -4,13 +4,15 @@
 Exports data and static assets into a docs-friendly folder layout.
 """
 
+import os
 import sys
 import json
 import shutil
 import argparse
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from collections import defaultdict
 
 if hasattr(sys.stdout, "reconfigure"):
@@ -23,21 +25,31 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from database import DatabaseRepository, get_repository
 from config import VENUES, ROOT_DIR
 
+try:
+    import orjson  # Optional: faster JSON serialization
+except ImportError:
+    orjson = None
+
 
 class StaticSiteExporter:
     """Exporter for static website data and assets."""
 
+    # Keyword trends only track counts and ranks within each year's top N.
+    TRENDS_YEAR_LIMIT = 100
+
     def __init__(
         self,
         output_dir: str = "docs",
         top_keywords: int = 300,
         repository: Optional[DatabaseRepository] = None,
+        jobs: int = 1,
     ):
         self.output_dir = Path(output_dir)
         self.data_dir = self.output_dir / "data"
         self.venues_data_dir = self.data_dir / "venues"
         self.arxiv_data_dir = self.data_dir / "arxiv"
         self.top_keywords = top_keywords
+        self.jobs = jobs
 
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.venues_data_dir.mkdir(parents=True, exist_ok=True)
@@ -51,24 +63,51 @@ class StaticSiteExporter:
             "total_size_bytes": 0,
         }
 
+    @staticmethod
+    def _dumps(data) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    @classmethod
+    def _write_json(cls, output_file: Path, data) -> None:
+        output_file.write_bytes(cls._dumps(data))
+
+    @classmethod
+    def _write_json_object_stream(cls, output_file: Path, items: Iterable[Tuple[str, object]]) -> None:
+        """Write a JSON object one member at a time, matching _write_json's layout."""
+        with open(output_file, "wb") as f:
+            first = True
+            for key, value in items:
+                f.write(b"{\n  " if first else b",\n  ")
+                f.write(cls._dumps(key))
+                f.write(b": ")
+                # Nested lines move one level deeper; JSON strings never contain raw newlines.
+                f.write(cls._dumps(value).replace(b"\n", b"\n  "))
+                first = False
+            f.write(b"{}" if first else b"\n}")
+
     def export_venues_index(self) -> int:
         venues_data = []
         all_summaries = self.repo.analysis.get_all_venue_summaries()
         summary_map = {s["venue"]: s for s in all_summaries if s.get("year") is None}
+        # Counts, years and top keywords for every venue in one query.
+        index_rows = self.repo.get_venue_index_rows(keyword_limit=10)
+        empty_row = {"paper_count": 0, "years": [], "top_keywords": []}
 
         for _, venue_config in VENUES.items():
             venue_name = venue_config.name
             summary = summary_map.get(venue_name)
+            row = index_rows.get(venue_name, empty_row)
 
             if summary:
                 paper_count = summary.get("paper_count", 0)
                 top_keywords = summary.get("top_keywords", [])[:10]
             else:
-                paper_count = self.repo.get_paper_count(venue=venue_name)
-                top_kw = self.repo.get_top_keywords(venue=venue_name, limit=10)
-                top_keywords = [{"keyword": kw, "count": c} for kw, c in top_kw]
+                paper_count = row["paper_count"]
+                top_keywords = [{"keyword": kw, "count": c} for kw, c in row["top_keywords"]]
 
-            years = self.repo.get_all_years(venue=venue_name)
+            years = row["years"]
             venue_data = {
                 "name": venue_name,
                 "full_name": venue_config.full_name,
@@ -81,42 +120,60 @@ class StaticSiteExporter:
             venues_data.append(venue_data)
 
         output_file = self.venues_data_dir / "venues_index.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(venues_data, f, indent=2, ensure_ascii=False)
+        self._write_json(output_file, venues_data)
 
         self.stats["total_size_bytes"] += output_file.stat().st_size
         return len(venues_data)
 
-    def export_venue_top_keywords(self, venue_name: str, top_n: int = 50) -> bool:
+    def _fetch_venue_year_matrix(self, venue_name: str, limit: int = TRENDS_YEAR_LIMIT) -> Dict[int, List[Tuple[str, int]]]:
+        """Fetch each year's top keywords once so several venue exports can share them."""
         years = self.repo.get_all_years(venue=venue_name)
-        if not years:
+        return {
+            year: self.repo.get_top_keywords(venue=venue_name, year=year, limit=limit)
+            for year in sorted(years)
+        }
+
+    def export_venue_top_keywords(
+        self,
+        venue_name: str,
+        top_n: int = 50,
+        year_matrix: Optional[Dict[int, List[Tuple[str, int]]]] = None,
+    ) -> bool:
+        if year_matrix is None:
+            year_matrix = self._fetch_venue_year_matrix(venue_name, limit=top_n)
+        if not year_matrix:
             return False
 
         yearly_data = {}
-        for year in sorted(years):
-            top_keywords = self.repo.get_top_keywords(venue=venue_name, year=year, limit=top_n)
+        for year, top_keywords in year_matrix.items():
             yearly_data[str(year)] = [
                 {"keyword": kw, "count": count, "rank": rank + 1}
-                for rank, (kw, count) in enumerate(top_keywords)
+                for rank, (kw, count) in enumerate(top_keywords[:top_n])
             ]
 
         output_file = self.venues_data_dir / f"venue_{venue_name}_top_keywords.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(yearly_data, f, indent=2, ensure_ascii=False)
+        self._write_json(output_file, yearly_data)
 
         self.stats["total_size_bytes"] += output_file.stat().st_size
         return True
 
-    def export_venue_keyword_trends(self, venue_name: str, max_keywords: int = 300) -> bool:
-        years = self.repo.get_all_years(venue=venue_name)
-        if not years:
+    def export_venue_keyword_trends(
+        self,
+        venue_name: str,
+        max_keywords: int = 300,
+        year_matrix: Optional[Dict[int, List[Tuple[str, int]]]] = None,
+    ) -> bool:
+        if year_matrix is None:
+            year_matrix = self._fetch_venue_year_matrix(venue_name, limit=self.TRENDS_YEAR_LIMIT)
+        if not year_matrix:
             return False
 
+        sorted_years = sorted(year_matrix)
         keyword_yearly_counts = defaultdict(dict)
         keyword_yearly_ranks = defaultdict(dict)
 
-        for year in sorted(years):
-            top_keywords = self.repo.get_top_keywords(venue=venue_name, year=year, limit=100)
+        for year in sorted_years:
+            top_keywords = year_matrix[year][:self.TRENDS_YEAR_LIMIT]
             for rank, (kw, count) in enumerate(top_keywords, start=1):
                 keyword_yearly_counts[kw][year] = count
                 keyword_yearly_ranks[kw][year] = rank
@@ -124,22 +181,22 @@ class StaticSiteExporter:
         keyword_totals = {kw: sum(counts.values()) for kw, counts in keyword_yearly_counts.items()}
         top_keywords = sorted(keyword_totals.keys(), key=lambda k: keyword_totals[k], reverse=True)[:max_keywords]
 
-        trends_data = {}
-        for kw in top_keywords:
-            yearly_points = []
-            for year in sorted(years):
-                yearly_points.append(
-                    {
-                        "year": year,
-                        "count": keyword_yearly_counts[kw].get(year, 0),
-                        "rank": keyword_yearly_ranks[kw].get(year, 0),
-                    }
-                )
-            trends_data[kw] = yearly_points
-
+        def iter_trends():
+            for kw in top_keywords:
+                yearly_points = []
+                for year in sorted_years:
+                    yearly_points.append(
+                        {
+                            "year": year,
+                            "count": keyword_yearly_counts[kw].get(year, 0),
+                            "rank": keyword_yearly_ranks[kw].get(year, 0),
+                        }
+                    )
+                yield kw, yearly_points
+
+        # Stream one keyword's series at a time instead of building the whole nested dict.
         output_file = self.venues_data_dir / f"venue_{venue_name}_keyword_trends.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(trends_data, f, indent=2, ensure_ascii=False)
+        self._write_json_object_stream(output_file, iter_trends())
 
         self.stats["total_size_bytes"] += output_file.stat().st_size
         return True
@@ -150,23 +207,52 @@ class StaticSiteExporter:
             return False
 
         output_file = self.venues_data_dir / f"venue_{venue_name}_keywords_index.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump([kw for kw, _ in top_keywords], f, indent=2, ensure_ascii=False)
+        self._write_json(output_file, [kw for kw, _ in top_keywords])
 
         self.stats["total_size_bytes"] += output_file.stat().st_size
         return True
 
+    def export_venue(self, venue_name: str, top_n: int = 50) -> bool:
+        # Both exports share one yearly ranking, one query per (venue, year).
+        year_matrix = self._fetch_venue_year_matrix(
+            venue_name, limit=max(top_n, self.TRENDS_YEAR_LIMIT)
+        )
+        if not self.export_venue_top_keywords(venue_name, top_n=top_n, year_matrix=year_matrix):
+            return False
+        if not self.export_venue_keyword_trends(
+            venue_name, max_keywords=self.top_keywords, year_matrix=year_matrix
+        ):
+            return False
+        self.export_venue_keywords_index(venue_name)
+        return True
+
     def export_all_venues(self) -> Dict:
         venues_count = self.export_venues_index()
-        exported_venues = []
-
-        for _, venue_config in VENUES.items():
-            venue_name = venue_config.name
-            if self.export_venue_top_keywords(venue_name, top_n=50):
-                if self.export_venue_keyword_trends(venue_name, max_keywords=self.top_keywords):
-                    self.export_venue_keywords_index(venue_name)
-                    exported_venues.append(venue_name)
-
+        venue_names = [venue_config.name for venue_config in VENUES.values()]
+
+        workers = min(self.jobs, len(venue_names))
+        if workers > 1:
+            # Venues write separate files from a read-only database, so each
+            # worker process exports one venue over its own connection.
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        _export_single_venue,
+                        str(self.output_dir),
+                        self.top_keywords,
+                        str(self.repo.db_path),
+                        venue_name,
+                    )
+                    for venue_name in venue_names
+                ]
+                results = [future.result() for future in futures]
+            for _, size_bytes in results:
+                self.stats["total_size_bytes"] += size_bytes
+            exported = [ok for ok, _ in results]
+        else:
+            exported = [self.export_venue(venue_name) for venue_name in venue_names]
+
+        exported_venues = [name for name, ok in zip(venue_names, exported) if ok]
         self.stats["venues_exported"] = len(exported_venues)
         return {"venues_count": venues_count, "venues_exported": exported_venues}
 
@@ -189,8 +275,7 @@ class StaticSiteExporter:
                     "exported_at": datetime.now().isoformat(),
                 }
                 output_file = self.arxiv_data_dir / f"arxiv_timeseries_{granularity}_{category}.json"
-                with open(output_file, "w", encoding="utf-8") as f:
-                    json.dump(output_data, f, indent=2, ensure_ascii=False)
+                self._write_json(output_file, output_data)
 
                 self.stats["total_size_bytes"] += output_file.stat().st_size
                 exported_count += 1
@@ -207,8 +292,7 @@ class StaticSiteExporter:
                 continue
 
             output_file = self.arxiv_data_dir / f"arxiv_emerging_{category}.json"
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(topics, f, indent=2, ensure_ascii=False)
+            self._write_json(output_file, topics)
 
             self.stats["total_size_bytes"] += output_file.stat().st_size
             exported_count += 1
@@ -220,8 +304,7 @@ class StaticSiteExporter:
         stats_data["exported_at"] = datetime.now().isoformat()
 
         output_file = self.arxiv_data_dir / "arxiv_stats.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(stats_data, f, indent=2, ensure_ascii=False)
+        self._write_json(output_file, stats_data)
 
         self.stats["total_size_bytes"] += output_file.stat().st_size
         return True
@@ -259,8 +342,7 @@ class StaticSiteExporter:
             "stats": self.stats,
         }
         manifest_file = self.output_dir / "data" / "manifest.json"
-        with open(manifest_file, "w", encoding="utf-8") as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        self._write_json(manifest_file, manifest)
 
     def export_all(self):
         self.export_all_venues()
@@ -270,13 +352,33 @@ class StaticSiteExporter:
         return self.stats
 
 
+def _export_single_venue(output_dir: str, top_keywords: int, db_path: str, venue_name: str):
+    """Process-pool worker: export one venue and report (exported, bytes written)."""
+    exporter = StaticSiteExporter(
+        output_dir=output_dir,
+        top_keywords=top_keywords,
+        # Export only reads; the parent process already initialised the schema.
+        repository=DatabaseRepository(Path(db_path), init_schema=False),
+    )
+    exported = exporter.export_venue(venue_name)
+    return exported, exporter.stats["total_size_bytes"]
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Export DeepTrender static site")
     parser.add_argument("--output-dir", type=str, default="docs", help="Output directory")
     parser.add_argument("--top-keywords", type=int, default=300, help="Max keywords per venue")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=min(8, os.cpu_count() or 1),
+        help="Worker processes for per-venue export (1 = serial)",
+    )
     args = parser.parse_args()
 
-    exporter = StaticSiteExporter(output_dir=args.output_dir, top_keywords=args.top_keywords)
+    exporter = StaticSiteExporter(
+        output_dir=args.output_dir, top_keywords=args.top_keywords, jobs=args.jobs
+    )
     try:
         exporter.export_all()
         print(f"Static export complete: {args.output_dir}")
@@ -16,7 +16,7 @@ from collections import Counter
 
 sys.path.insert(0, str(Path(__file__).parent))
 from config import DATABASE_PATH
-from extractor.keyword_filter import BANNED_WORDS, ENGLISH_STOPWORDS, DOMAIN_NOISE_WORDS
+from extractor.keyword_filter import FILTERED_WORDS
 
 
 def main():
@@ -110,12 +110,10 @@ def main():
     """)
     top_keywords = [(r["keyword"], r["cnt"]) for r in cur.fetchall()]
     
-    all_noise = BANNED_WORDS | ENGLISH_STOPWORDS | DOMAIN_NOISE_WORDS
-    
     noise_count = 0
     noise_keywords = []
     for kw, cnt in top_keywords:
-        if kw in all_noise:
+        if kw in FILTERED_WORDS:
             noise_count += 1
             noise_keywords.append(kw)
     
@@ -128,7 +126,7 @@ def main():
     
     print("\n   Top-20 关键词:")
     for kw, cnt in top_keywords[:20]:
-        marker = "⚠️" if kw in all_noise else ""
+        marker = "⚠️" if kw in FILTERED_WORDS else ""
         print(f"      [{cnt:3d}] {kw} {marker}")
     
     # 检查纯数字/符号
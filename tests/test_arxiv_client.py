@@ -0,0 +1,166 @@
+"""
+Tests for arXiv Atom feed parsing
+"""
+
+import gzip
+from datetime import datetime
+from io import BytesIO
+
+import pytest
+
+from scraper.arxiv_client import ArxivClient, _iter_entries
+from scraper.models import RawPaper
+
+
+SAMPLE_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <title type="html">ArXiv Query: search_query=cat:cs.LG</title>
+  <opensearch:totalResults>2</opensearch:totalResults>
+  <entry>
+    <id>http://arxiv.org/abs/2401.01234v2</id>
+    <updated>2024-01-05T10:00:00Z</updated>
+    <published>2024-01-03T18:59:59Z</published>
+    <title>Sparse Attention
+  for Long Sequences</title>
+    <summary>  We study sparse attention &amp; its
+  efficiency.
+</summary>
+    <author>
+      <name>Alice Smith</name>
+      <arxiv:affiliation>MIT</arxiv:affiliation>
+    </author>
+    <author>
+      <name>Bob Johnson</name>
+    </author>
+    <arxiv:doi>10.1234/example.5678</arxiv:doi>
+    <link title="doi" href="http://dx.doi.org/10.1234/example.5678" rel="related"/>
+    <arxiv:comment>Accepted at ICLR 2024</arxiv:comment>
+    <arxiv:journal_ref>ICLR 2024</arxiv:journal_ref>
+    <link href="http://arxiv.org/abs/2401.01234v2" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/2401.01234v2" rel="related" type="application/pdf"/>
+    <arxiv:primary_category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.CL" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/2401.05678v1</id>
+    <updated>2024-01-04T00:00:00Z</updated>
+    <published>2024-01-04T00:00:00Z</published>
+    <title>No Extras</title>
+    <summary>Plain abstract.</summary>
+    <author>
+      <name>Carol White</name>
+    </author>
+    <link href="http://arxiv.org/abs/2401.05678v1" rel="alternate" type="text/html"/>
+    <category term="cs.CV" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+</feed>
+"""
+
+
+class TestArxivFeedParsing:
+    """Test Atom feed parsing into RawPaper"""
+    
+    def test_parse_feed_entries(self):
+        """Test feedparser-compatible entry dicts"""
+        entries = list(_iter_entries(SAMPLE_FEED))
+        
+        assert len(entries) == 2
+        entry = entries[0]
+        assert entry["id"] == "http://arxiv.org/abs/2401.01234v2"
+        assert entry["arxiv_comment"] == "Accepted at ICLR 2024"
+        assert entry["arxiv_journal_ref"] == "ICLR 2024"
+        assert [a["name"] for a in entry["authors"]] == ["Alice Smith", "Bob Johnson"]
+        assert [t["term"] for t in entry["tags"]] == ["cs.LG", "cs.CL"]
+        assert len(entry["links"]) == 3
+        assert "arxiv_comment" not in entries[1]
+    
+    def test_parse_entry_to_raw_paper(self):
+        """Test RawPaper fields built from a parsed entry"""
+        client = ArxivClient(delay=0)
+        papers = [client._parse_entry(entry) for entry in list(_iter_entries(SAMPLE_FEED))]
+        
+        paper = papers[0]
+        assert paper.source == "arxiv"
+        assert paper.source_paper_id == "2401.01234"
+        assert paper.title == "Sparse Attention   for Long Sequences"
+        assert paper.abstract == "We study sparse attention & its   efficiency."
+        assert paper.authors == ["Alice Smith", "Bob Johnson"]
+        assert paper.year == 2024
+        assert paper.categories == "cs.LG,cs.CL"
+        assert paper.comments == "Accepted at ICLR 2024"
+        assert paper.doi == "10.1234/example.5678"
+        assert paper.raw_json["pdf_url"] == "http://arxiv.org/pdf/2401.01234v2"
+        assert paper.raw_json["links"] == [
+            "http://dx.doi.org/10.1234/example.5678",
+            "http://arxiv.org/abs/2401.01234v2",
+            "http://arxiv.org/pdf/2401.01234v2",
+        ]
+        
+        other = papers[1]
+        assert other.comments == ""
+        assert other.journal_ref == ""
+        assert other.raw_json["pdf_url"] is None
+    
+    def test_parse_feed_from_stream(self):
+        """Test parsing a decompressed response stream"""
+        stream = gzip.GzipFile(fileobj=BytesIO(gzip.compress(SAMPLE_FEED)))
+        
+        assert list(_iter_entries(stream)) == list(_iter_entries(SAMPLE_FEED))
+    
+    def test_search_skips_seen_entries(self, monkeypatch):
+        """Test entries already seen on an earlier page are not parsed again"""
+        class FakeResponse:
+            def __init__(self):
+                self.raw = BytesIO(SAMPLE_FEED)
+            
+            def __enter__(self):
+                return self
+            
+            def __exit__(self, *exc):
+                return False
+            
+            def raise_for_status(self):
+                pass
+        
+        client = ArxivClient(delay=0)
+        monkeypatch.setattr(client.session, "get", lambda *args, **kwargs: FakeResponse())
+        seen = set()
+        
+        first = client.search(categories=["cs.LG"], seen=seen)
+        second = client.search(categories=["cs.LG"], start=2, seen=seen)
+        
+        assert [p.source_paper_id for p in first] == ["2401.01234", "2401.05678"]
+        assert second == []
+    
+    def test_search_recent_pages_until_enough_recent_papers(self, monkeypatch):
+        """Test pages keep coming while the date filter drops some entries"""
+        starts = []
+        
+        def fake_search(categories=None, start=0, max_results=100, seen=None):
+            starts.append(start)
+            # 60% recent, 40% outside the date window
+            return [
+                RawPaper(
+                    source="arxiv",
+                    source_paper_id=f"{start + i}",
+                    title="t",
+                    year=2000 if i % 5 < 2 else None,
+                    retrieved_at=datetime(2000, 1, 1) if i % 5 < 2 else datetime.now(),
+                )
+                for i in range(max_results)
+            ]
+        
+        client = ArxivClient(delay=0)
+        monkeypatch.setattr(client, "search", fake_search)
+        
+        papers = client.search_recent(categories=["cs.LG"], days=7, max_results=600)
+        
+        assert len(papers) == 600
+        assert starts == [0, 500]
+    
+    def test_parse_feed_empty(self):
+        """Test feed without entries"""
+        feed = b'<feed xmlns="http://www.w3.org/2005/Atom"><title>empty</title></feed>'
+        
+        assert list(_iter_entries(feed)) == []
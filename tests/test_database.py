@@ -44,6 +44,19 @@ class TestDatabaseRepository:
         saved_count = repo.save_papers(sample_papers)
         assert saved_count == len(sample_papers)
 
+    def test_save_papers_batch_matches_single_saves(self, repo, sample_papers):
+        for paper in sample_papers:
+            paper.extracted_keywords = ["machine learning", "Neural Network "]
+
+        # 同一批内重复的论文应复用已写入的 paper_id
+        assert repo.save_papers(sample_papers + sample_papers[:1]) == len(sample_papers) + 1
+        assert repo.get_paper_count() == len(sample_papers)
+        assert repo.get_paper_count(venue="ICLR") == 2
+
+        retrieved = repo.get_paper(sample_papers[0].paper_id)
+        assert sorted(retrieved.extracted_keywords) == ["machine learning", "neural network"]
+        assert sorted(retrieved.keywords) == sorted(k.lower() for k in sample_papers[0].keywords)
+
     def test_get_paper_count(self, repo_with_data):
         assert repo_with_data.get_paper_count() == 3
 
@@ -115,6 +128,19 @@ class TestDatabaseRepository:
         assert result is True
         assert repo.get_paper_count() == 1
 
+    def test_get_venue_index_rows(self, repo_with_data):
+        rows = repo_with_data.get_venue_index_rows(keyword_limit=10)
+
+        for venue in ("ICLR", "NeurIPS"):
+            row = rows[venue]
+            assert row["paper_count"] == repo_with_data.get_paper_count(venue=venue)
+            assert row["years"] == repo_with_data.get_all_years(venue=venue)
+            assert sorted(row["top_keywords"]) == sorted(
+                repo_with_data.get_top_keywords(venue=venue, limit=10)
+            )
+            # 同频关键词按字母序排列，结果在多次运行间稳定
+            assert row["top_keywords"] == sorted(row["top_keywords"], key=lambda kc: (-kc[1], kc[0]))
+
     def test_get_venue_comparison(self, repo_with_data):
         comparison = repo_with_data.get_venue_comparison(year=2023, limit=5)
         assert isinstance(comparison, dict)
@@ -140,3 +166,46 @@ class TestDatabaseRepository:
         assert stats["categories"]["cs.CV"] == 0
         assert stats["date_range"]["min"] is not None
         assert stats["date_range"]["max"] is not None
+
+    def test_layer_singletons_share_unified_repository(self, temp_db_path, monkeypatch):
+        from database import unified
+
+        for name in ("_repository", "_raw_repository", "_structured_repository", "_analysis_repository"):
+            monkeypatch.setattr(unified, name, None)
+
+        repo = unified.get_repository(db_path=temp_db_path)
+
+        assert unified.get_raw_repository() is repo.raw
+        assert unified.get_structured_repository() is repo.structured
+        assert unified.get_analysis_repository() is repo.analysis
+
+    def test_raw_stats_cache_invalidated_by_any_raw_write(self, repo, monkeypatch):
+        import dq_arxiv
+
+        monkeypatch.setattr(dq_arxiv, "get_repository", lambda: repo)
+        for i, abstract in enumerate(["", "An abstract."]):
+            repo.raw.save_raw_paper(
+                RawPaper(source="arxiv", source_paper_id=f"2401.0000{i}", title=f"Paper {i}", abstract=abstract)
+            )
+
+        checker = dq_arxiv.ArxivDataQualityChecker()
+
+        def load_stats():
+            with repo._get_connection() as conn:
+                return checker._load_raw_stats(conn)
+
+        assert load_stats()["abstract_null"] == 1
+
+        # UPDATE 不改变 MAX(raw_id)
+        with repo._get_connection() as conn:
+            conn.execute("UPDATE raw_papers SET abstract = 'Filled.' WHERE abstract = ''")
+            conn.commit()
+        assert load_stats()["abstract_null"] == 0
+
+        # 整行替换 raw_id 最大的行会复用同一个 raw_id
+        repo.raw.save_raw_paper(
+            RawPaper(source="arxiv", source_paper_id="2401.00001", title="Paper 1", abstract="")
+        )
+        assert load_stats() == {
+            "total": 2, "title_null": 0, "abstract_null": 1, "year_null": 2, "retrieved_null": 0,
+        }
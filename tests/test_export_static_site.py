@@ -112,6 +112,62 @@ class TestStaticSiteExporter:
         assert exporter.venues_data_dir.exists()
         assert exporter.arxiv_data_dir.exists()
     
+    def test_shared_year_matrix_matches_direct_export(self, exporter):
+        venue_name = "ICLR"
+        trends_file = exporter.venues_data_dir / f"venue_{venue_name}_keyword_trends.json"
+
+        exporter.export_venue_keyword_trends(venue_name, max_keywords=20)
+        direct = json.loads(trends_file.read_text(encoding="utf-8"))
+
+        year_matrix = exporter._fetch_venue_year_matrix(venue_name, limit=200)
+        exporter.export_venue_keyword_trends(venue_name, max_keywords=20, year_matrix=year_matrix)
+        shared = json.loads(trends_file.read_text(encoding="utf-8"))
+
+        assert shared == direct
+
+    def test_parallel_venue_export_matches_serial(self, exporter, repo_with_data, tmp_path):
+        serial = exporter.export_all_venues()
+
+        parallel_exporter = StaticSiteExporter(
+            output_dir=str(tmp_path),
+            top_keywords=50,
+            repository=repo_with_data,
+            jobs=2,
+        )
+        parallel = parallel_exporter.export_all_venues()
+
+        assert parallel == serial
+        assert serial["venues_exported"]
+        assert parallel_exporter.stats["total_size_bytes"] == exporter.stats["total_size_bytes"]
+        for venue_file in exporter.venues_data_dir.glob("venue_*.json"):
+            parallel_file = parallel_exporter.venues_data_dir / venue_file.name
+            assert parallel_file.read_bytes() == venue_file.read_bytes()
+
+    def test_venue_worker_does_not_touch_schema(self, repo_with_data, tmp_path, monkeypatch):
+        from database.repository import BaseRepository, RawRepository
+        from tools.export_static_site import _export_single_venue
+
+        def fail(self):
+            raise AssertionError("export worker must not write the schema")
+
+        monkeypatch.setattr(BaseRepository, "_init_database", fail)
+        monkeypatch.setattr(RawRepository, "_ensure_raw_schema_columns", fail)
+
+        exported, size = _export_single_venue(str(tmp_path), 50, str(repo_with_data.db_path), "ICLR")
+
+        assert exported
+        assert size > 0
+
+    def test_streamed_json_object_matches_write_json(self, exporter):
+        data = {"graph learning": [{"year": 2024, "count": 3, "rank": 1}], "模型": []}
+        full_file = exporter.data_dir / "full.json"
+        streamed_file = exporter.data_dir / "streamed.json"
+
+        for payload in (data, {}):
+            exporter._write_json(full_file, payload)
+            exporter._write_json_object_stream(streamed_file, payload.items())
+            assert streamed_file.read_bytes() == full_file.read_bytes()
+
     def test_export_handles_empty_venue(self, exporter):
         result = exporter.export_venue_top_keywords("NONEXISTENT_VENUE", top_n=10)
         assert result is False
@@ -122,6 +122,41 @@ class TestKeywordProcessor:
         # 每篇论文都应该有提取的关键词
         for paper in processed:
             assert len(paper.extracted_keywords) > 0
+    
+    def test_process_papers_parallel_matches_serial(self, sample_papers):
+        """测试多进程提取与串行结果一致"""
+        processor = KeywordProcessor(extractor_type="yake")
+        
+        serial = [
+            sorted(p.extracted_keywords)
+            for p in processor.process_papers(sample_papers, show_progress=False)
+        ]
+        parallel = [
+            sorted(p.extracted_keywords)
+            for p in processor.process_papers(sample_papers, show_progress=False, jobs=2)
+        ]
+        
+        assert parallel == serial
+    
+    def test_process_papers_tfidf(self, sample_papers):
+        """测试 TF-IDF 批量提取"""
+        pytest.importorskip("sklearn")
+        processor = KeywordProcessor(extractor_type="tfidf")
+        
+        processed = processor.process_papers(sample_papers, show_progress=False)
+        
+        assert processor.extractor_type == "tfidf"
+        for paper in processed:
+            assert len(paper.extracted_keywords) > 0
+    
+    def test_tfidf_falls_back_to_yake(self, monkeypatch):
+        """测试未安装 scikit-learn 时 TF-IDF 回退到 YAKE"""
+        monkeypatch.setattr("extractor.processor.is_tfidf_available", lambda: False)
+        processor = KeywordProcessor(extractor_type="tfidf")
+        
+        assert processor.extractor_type == "yake"
+        assert processor.tfidf is None
+        assert processor.yake is not None
 
 
 class TestExtractKeywordsBatch:
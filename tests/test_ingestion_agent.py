@@ -0,0 +1,98 @@
+"""
+Tests for concurrent ingestion in IngestionAgent
+"""
+
+import threading
+
+from agents.ingestion_agent import IngestionAgent
+from database.repository import RawRepository
+from scraper.models import RawPaper
+
+
+def _raw_papers(source, count):
+    return [
+        RawPaper(source=source, source_paper_id=f"{source}-{i}", title=f"{source} paper {i}")
+        for i in range(count)
+    ]
+
+
+class _FakeArxivClient:
+
+    def __init__(self, barrier):
+        self.barrier = barrier
+
+    def search_recent(self, categories, days, max_results):
+        self.barrier.wait(timeout=5)
+        return _raw_papers("arxiv", 40)
+
+
+class _FakeOpenAlexClient:
+
+    def __init__(self, barrier):
+        self.barrier = barrier
+
+    def search_by_venue_year(self, venue_name, year, max_results):
+        self.barrier.wait(timeout=5)
+        return _raw_papers("openalex", 30)
+
+
+class _FailingS2Client:
+
+    def search_papers(self, venue_name, year, max_results):
+        raise RuntimeError("S2 unavailable")
+
+
+def _tracking_repo(db_path):
+    """记录同时在写库的线程数"""
+    repo = RawRepository(db_path=db_path)
+    save = repo.save_raw_paper
+    lock = threading.Lock()
+    state = {"active": 0, "max_active": 0}
+
+    def tracked_save(paper):
+        with lock:
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+        try:
+            return save(paper)
+        finally:
+            with lock:
+                state["active"] -= 1
+
+    repo.save_raw_paper = tracked_save
+    return repo, state
+
+
+def test_run_serializes_writes_from_concurrent_sources(temp_db_path, capsys):
+    repo, state = _tracking_repo(temp_db_path)
+    # 两个数据源同时抓取完成后再一起写库
+    barrier = threading.Barrier(2)
+    agent = IngestionAgent(
+        repository=repo,
+        arxiv_client=_FakeArxivClient(barrier),
+        openalex_client=_FakeOpenAlexClient(barrier),
+    )
+
+    results = agent.run(sources=["arxiv", "openalex"], venues=["ICLR"], years=[2024])
+
+    assert results == {"arxiv": 40, "openalex": 30}
+    assert state["max_active"] == 1
+    with repo._get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM raw_papers").fetchone()[0] == 70
+
+    out = capsys.readouterr().out
+    assert "[arxiv] ✅ arXiv: 已保存 40/40" in out
+    assert "[openalex] ✅ OpenAlex ICLR 2024: 已保存 30 篇" in out
+
+
+def test_run_keeps_counts_when_one_source_fails(temp_db_path, capsys):
+    agent = IngestionAgent(
+        repository=RawRepository(db_path=temp_db_path),
+        arxiv_client=_FakeArxivClient(threading.Barrier(1)),
+        s2_client=_FailingS2Client(),
+    )
+
+    results = agent.run(sources=["arxiv", "s2"], venues=["ICLR"], years=[2024])
+
+    assert results == {"arxiv": 40, "s2": 0}
+    assert "❌ s2 采集失败: S2 unavailable" in capsys.readouterr().out
@@ -0,0 +1,133 @@
+"""
+Tests for keyword normalization, noise filtering and deduplication
+"""
+
+import random
+
+import pytest
+
+from extractor.keyword_filter import KeywordFilter
+
+
+@pytest.fixture
+def keyword_filter():
+    return KeywordFilter()
+
+
+def _reference_deduplicate_fuzzy(keyword_filter, keywords, threshold):
+    """逐对比较的原始实现，用于核对剪枝后的结果"""
+    result = []
+    for kw, score in sorted(keywords, key=lambda x: x[1], reverse=True):
+        if not any(
+            keyword_filter.similarity(kw, existing) >= threshold
+            or kw.rstrip('s') == existing
+            or existing.rstrip('s') == kw
+            for existing, _ in result
+        ):
+            result.append((kw, score))
+    return result
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("  Self-Supervised_Learning. ", "self supervised learning"),
+    ('("Graph/Neural  Networks")', "graph neural networks"),
+    ("Vision\tTransformers!?", "vision transformers"),
+    ("'quoted'", "quoted"),
+    ("end-to-end", "end to end"),
+    ("...", None),
+    ("  ", None),
+    ("", None),
+])
+def test_normalize(keyword_filter, raw, expected):
+    assert keyword_filter.normalize(raw) == expected
+
+
+@pytest.mark.parametrize("keyword, expected", [
+    ("ab", True),
+    ("x" * 61, True),
+    ("2024 2025", True),
+    ("3.14", True),
+    ("https arxiv", True),
+    ("user@example", True),
+    ("www example", True),
+    ("example.com", True),
+    ("gpt 4", False),
+    ("resnet50", False),
+    ("resnet 50 101", False),
+    ("a b", False),
+    ("graph neural network", False),
+])
+def test_is_noise_pattern(keyword_filter, keyword, expected):
+    assert keyword_filter.is_noise_pattern(keyword) is expected
+
+
+def test_is_noise_pattern_short_single_word():
+    keyword_filter = KeywordFilter(min_length=1)
+    assert keyword_filter.is_noise_pattern("x")
+    assert keyword_filter.is_noise_pattern("7")
+    assert not keyword_filter.is_noise_pattern("a b")
+
+
+def test_deduplicate_fuzzy(keyword_filter):
+    keywords = [
+        ("diffusion models", 0.9),
+        ("diffusion model", 0.8),
+        ("graph neural network", 0.7),
+        ("graph neural networks", 0.75),
+        ("contrastive learning", 0.6),
+        ("contrastive learner", 0.65),
+        ("transformer", 0.5),
+        ("transformers", 0.4),
+        ("vision transformer", 0.55),
+        ("reinforcement learning", 0.3),
+    ]
+
+    assert keyword_filter.deduplicate_fuzzy(keywords) == [
+        ("diffusion models", 0.9),
+        ("graph neural networks", 0.75),
+        ("contrastive learner", 0.65),
+        ("vision transformer", 0.55),
+        ("transformer", 0.5),
+        ("reinforcement learning", 0.3),
+    ]
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.5, 0.7, 0.85, 0.95, 1.0])
+def test_deduplicate_fuzzy_matches_pairwise_comparison(keyword_filter, threshold):
+    rng = random.Random(7)
+    words = ["graph", "graphs", "neural", "network", "networks", "diffusion",
+             "model", "models", "learning", "learner", "vision", "transformer"]
+    keywords = [
+        (" ".join(rng.choices(words, k=rng.randint(1, 3))), rng.random())
+        for _ in range(200)
+    ]
+    keywords = keyword_filter.deduplicate_exact(keywords)
+
+    assert keyword_filter.deduplicate_fuzzy(keywords, threshold=threshold) == (
+        _reference_deduplicate_fuzzy(keyword_filter, keywords, threshold)
+    )
+
+
+def test_process(keyword_filter):
+    keywords = [
+        ("Diffusion Models", 0.9),
+        ("diffusion-model", 0.8),
+        ("LLMs", 0.85),
+        ("large language models", 0.7),
+        ("the", 0.99),
+        ("experiments", 0.6),
+        ("2024", 0.5),
+        ("Graph Neural Networks.", 0.65),
+        ("graph neural network", 0.64),
+        ("http://x.org", 0.4),
+        ("Self-Supervised", 0.3),
+        ("contrastive learning loss", 0.2),
+    ]
+
+    assert keyword_filter.process(keywords) == [
+        ("diffusion model", 0.9),
+        ("large language model", 0.85),
+        ("graph neural networks", 0.65),
+        ("self supervised learning", 0.3),
+        ("contrastive learning loss", 0.2),
+    ]